@@ -6,16 +6,22 @@ import secrets
 from collections import defaultdict, deque
 import logging
 import json
+import click
 from dotenv import load_dotenv
 from sqlalchemy.pool import NullPool
 from sqlalchemy.exc import IntegrityError, OperationalError, ProgrammingError
 from werkzeug.middleware.proxy_fix import ProxyFix
+from .atomic_io import recover_file_state
 from .db import db, migrate
 
 # Lade Umgebungsvariablen aus .env Datei
 load_dotenv()
 _LAST_CREATED_APP = None
 _RATE_LIMIT_BUCKETS = defaultdict(deque)
+SCHEMA_UPGRADE_HINT = (
+    "Datenbank-Schema ist veraltet. Bitte Migration ausführen: "
+    "flask --app run.py db upgrade"
+)
 
 
 def get_last_created_app():
@@ -68,6 +74,40 @@ def _get_app_secret_key():
         return _generate_secret_key()
     return key
 
+def bootstrap_database(app):
+    """Einmaliger DB-Bootstrap: create_all() plus Default-Gruppen und -Cubes.
+
+    Liefert False, wenn das Schema hinter den Modellen liegt (Migration nötig).
+    """
+    from .services.cubes import ensure_default_cubes
+    from .services.groups import ensure_default_groups
+
+    with app.app_context():
+        try:
+            db.create_all()
+        except (IntegrityError, OperationalError, ProgrammingError) as e:
+            # Mehrere Gunicorn-Worker starten parallel und können gleichzeitig
+            # versuchen, Tabellen anzulegen ("duplicate table" etc.).
+            # Das ist harmlos, solange die Tabellen am Ende existieren.
+            db.session.rollback()
+            app.logger.warning("db.create_all() beim Start uebersprungen: %s", e)
+        try:
+            ensure_default_groups()
+            ensure_default_cubes()
+        except ProgrammingError:
+            # Transitional safety: if DB schema is behind the current models,
+            # allow app creation so `flask db upgrade` can be executed.
+            db.session.rollback()
+            app.config["DB_SCHEMA_OUTDATED"] = True
+            app.logger.error(SCHEMA_UPGRADE_HINT)
+            return False
+        except (IntegrityError, OperationalError) as e:
+            # Race beim parallelen Seeding der Default-Daten durch mehrere
+            # Worker: Ein anderer Worker hat die Defaults bereits angelegt.
+            db.session.rollback()
+            app.logger.warning("Default-Seeding beim Start uebersprungen: %s", e)
+    return True
+
 def create_app():
     global _LAST_CREATED_APP
     app = Flask(__name__)
@@ -85,10 +125,6 @@ def create_app():
     if is_production:
         app.config["PREFERRED_URL_SCHEME"] = "https"
 
-    schema_upgrade_hint = (
-        "Datenbank-Schema ist veraltet. Bitte Migration ausführen: "
-        "flask --app run.py db upgrade"
-    )
     app.config["DB_SCHEMA_OUTDATED"] = False
     
     # Stabiler Secret Key (env oder persistiert in instance/)
@@ -111,6 +147,7 @@ def create_app():
             "main.start_tables",
             "main.pair",
             "main.save_results",
+            "main.save_results_bulk",
             "main.next_round",
             "main.end_tournament",
             "main.delete_tournament",
@@ -122,6 +159,40 @@ def create_app():
     app.config["SESSION_COOKIE_HTTPONLY"] = True
     app.config["SESSION_COOKIE_SAMESITE"] = "Lax"
     app.config["SESSION_COOKIE_SECURE"] = is_production
+    # Live-Updates: Poll-Intervall und maximale Dauer eines SSE-Streams. Jeder
+    # offene Stream belegt einen Gunicorn-Thread; der Browser verbindet sich
+    # nach Ablauf per Last-Event-ID automatisch neu. Höchstens
+    # SSE_MAX_STREAMS_PER_WORKER Streams pro Prozess (unter `threads` in
+    # gunicorn_config.py halten); darüber antwortet der Endpunkt mit 204 und
+    # die Rundenseite fragt alle SSE_FALLBACK_POLL_MS die Round-State-API ab.
+    app.config.setdefault("SSE_POLL_INTERVAL_SECONDS", float(os.environ.get("SSE_POLL_INTERVAL_SECONDS", "1.0")))
+    app.config.setdefault("SSE_MAX_STREAM_SECONDS", float(os.environ.get("SSE_MAX_STREAM_SECONDS", "30")))
+    app.config.setdefault("SSE_KEEPALIVE_SECONDS", float(os.environ.get("SSE_KEEPALIVE_SECONDS", "15")))
+    app.config.setdefault("SSE_RETRY_MS", int(os.environ.get("SSE_RETRY_MS", "2000")))
+    app.config.setdefault("SSE_MAX_STREAMS_PER_WORKER", int(os.environ.get("SSE_MAX_STREAMS_PER_WORKER", "2")))
+    app.config.setdefault("SSE_FALLBACK_POLL_MS", int(os.environ.get("SSE_FALLBACK_POLL_MS", "5000")))
+    app.config.setdefault("FRAGMENT_CACHE_ENABLED", os.environ.get("FRAGMENT_CACHE_ENABLED", "true").lower() == "true")
+    app.config.setdefault("FRAGMENT_CACHE_MAX_ENTRIES", int(os.environ.get("FRAGMENT_CACHE_MAX_ENTRIES", "256")))
+    app.config.setdefault(
+        "LEGACY_FILE_FALLBACKS", os.environ.get("LEGACY_FILE_FALLBACKS", "true").lower() == "true"
+    )
+    # Paarungen mehrerer Spielergruppen in Worker-Prozessen; 0/1 = immer im Request-Thread.
+    # Standard aus: auf wenigen Kernen ist der Pool langsamer. Gestartet wird er
+    # beim Prozessstart (gunicorn_config.post_worker_init, run.py), nie im Request.
+    app.config.setdefault("PAIRING_POOL_WORKERS", int(os.environ.get("PAIRING_POOL_WORKERS", "0")))
+    app.config.setdefault("PAIRING_PARALLEL_MIN_PLAYERS", int(os.environ.get("PAIRING_PARALLEL_MIN_PLAYERS", "10")))
+    # Sitzverteilung auf Pods gegen wiederholte Tischnachbarn aus den letzten N Turnieren.
+    app.config.setdefault("SEATING_OPTIMIZER_ENABLED", os.environ.get("SEATING_OPTIMIZER_ENABLED", "true").lower() == "true")
+    app.config.setdefault("SEATING_HISTORY_TOURNAMENTS", int(os.environ.get("SEATING_HISTORY_TOURNAMENTS", "8")))
+    app.config.setdefault("SEATING_TIME_BUDGET_MS", int(os.environ.get("SEATING_TIME_BUDGET_MS", "200")))
+    # Session-Backend: "cookie" (signiertes Cookie, Flask-Standard) oder "db"
+    # (Inhalt in server_sessions, Cookie trägt nur eine opake ID).
+    app.config.setdefault("SESSION_BACKEND", os.environ.get("SESSION_BACKEND", "cookie"))
+    app.config.setdefault("SESSION_SWEEP_PROBABILITY", float(os.environ.get("SESSION_SWEEP_PROBABILITY", "0.01")))
+    app.config.setdefault(
+        "DB_BOOTSTRAP_ON_STARTUP",
+        os.environ.get("DB_BOOTSTRAP_ON_STARTUP", "true").lower() == "true",
+    )
     app.config.setdefault("APP_LOGIN_ENABLED", os.environ.get("APP_LOGIN_ENABLED", "false").lower() == "true")
     app.config.setdefault("APP_LOGIN_USERNAME", os.environ.get("APP_LOGIN_USERNAME", "mtg"))
     app.config.setdefault("APP_LOGIN_PASSWORD", os.environ.get("APP_LOGIN_PASSWORD", ""))
@@ -133,8 +204,9 @@ def create_app():
     migrate.init_app(app, db)
     # Modelle explizit laden, damit Flask-Migrate Metadaten kennt.
     from . import models  # noqa: F401
-    from .services.cubes import ensure_default_cubes
-    from .services.groups import ensure_default_groups
+    from .session_store import init_session_store
+
+    init_session_store(app)
     
     @app.route("/", methods=["GET"])
     def home():
@@ -144,31 +216,95 @@ def create_app():
     from .routes import main
     app.register_blueprint(main, url_prefix="/mtg")
 
-    # Für Greenfield-Setup ohne Datenmigration:
-    # Tabellen bei Bedarf automatisch anlegen und Defaults sicherstellen.
-    with app.app_context():
-        try:
-            db.create_all()
-        except (IntegrityError, OperationalError, ProgrammingError) as e:
-            # Mehrere Gunicorn-Worker starten parallel und können gleichzeitig
-            # versuchen, Tabellen anzulegen ("duplicate table" etc.).
-            # Das ist harmlos, solange die Tabellen am Ende existieren.
-            db.session.rollback()
-            app.logger.warning("db.create_all() beim Start uebersprungen: %s", e)
+    # Für Greenfield-Setup ohne Datenmigration: Tabellen und Defaults beim
+    # Start sicherstellen. Mit Gunicorn preload_app läuft das einmalig im
+    # Master; mit DB_BOOTSTRAP_ON_STARTUP=false übernimmt `flask bootstrap-db`.
+    if app.config["DB_BOOTSTRAP_ON_STARTUP"]:
+        bootstrap_database(app)
+
+    # Abgebrochene Datei-Batches werden nicht hier nachgezogen (create_app läuft
+    # in jedem Worker, CLI-Aufruf und Test), sondern einmal vor den Workern:
+    # Gunicorn `on_starting`, run.py oder `flask recover-batches`.
+
+    @app.cli.command("bootstrap-db")
+    def bootstrap_db_command():
+        """Legt fehlende Tabellen an und seedet Default-Gruppen/-Cubes."""
+        if not bootstrap_database(app):
+            raise click.ClickException(SCHEMA_UPGRADE_HINT)
+        click.echo("Datenbank-Bootstrap abgeschlossen.")
+
+    @app.cli.command("recover-batches")
+    def recover_batches_command():
+        """Zieht abgebrochene Datei-Batches nach und löscht verwaiste Tempdateien."""
+        summary = recover_file_state()
+        click.echo(
+            f"{summary['batches']} Batch(es) wiederhergestellt, "
+            f"{summary['temp_files']} verwaiste Tempdatei(en) gelöscht."
+        )
+
+    @app.cli.command("import-legacy")
+    @click.option("--batch-size", default=500, show_default=True, type=int, help="Neue Zeilen pro Commit.")
+    def import_legacy_command(batch_size):
+        """Übernimmt Turniere, Runden, Matches und Power-Nine aus den Legacy-Dateien."""
+        from .services.legacy_import import import_legacy_data
+
+        def _progress(stage, done, total):
+            if stage == "tournaments":
+                click.echo(f"Turniere: {done}/{total}")
+            else:
+                click.echo(f"results.csv: {done} Zeilen gelesen")
+
+        summary = import_legacy_data(batch_size=batch_size, progress=_progress)
+        click.echo(
+            "Import abgeschlossen: "
+            f"{summary['tournaments']} Turnier(e), {summary['rounds']} Runde(n), "
+            f"{summary['matches']} Match(es), {summary['power_nine']} Power-Nine-Einträge neu; "
+            f"{summary['skipped_rows']} Zeile(n) übersprungen."
+        )
+        click.echo("Danach können die Datei-Fallbacks mit LEGACY_FILE_FALLBACKS=false abgeschaltet werden.")
+
+    @app.cli.command("export-matches")
+    @click.option("--format", "export_format", type=click.Choice(["csv", "json"]), default="csv", show_default=True)
+    @click.option("--output", type=click.File("w", encoding="utf-8", lazy=True), default="-", help="Zieldatei (Default: stdout).")
+    @click.option("--tournament", default=None, help="Nur dieses Turnier.")
+    @click.option("--group", default=None, help="Nur Turniere dieser Gruppe.")
+    @click.option("--cube", default=None, help="Nur Turniere mit diesem Cube.")
+    @click.option("--from", "date_from", default=None, help="Runden ab Datum (JJJJ-MM-TT).")
+    @click.option("--to", "date_to", default=None, help="Runden bis Datum (JJJJ-MM-TT).")
+    def export_matches_command(export_format, output, tournament, group, cube, date_from, date_to):
+        """Exportiert die Match-Historie gestreamt als CSV oder JSON."""
+        from .services.exports import parse_export_filters, stream_export
+
         try:
-            ensure_default_groups()
-            ensure_default_cubes()
-        except ProgrammingError:
-            # Transitional safety: if DB schema is behind the current models,
-            # allow app creation so `flask db upgrade` can be executed.
-            db.session.rollback()
-            app.config["DB_SCHEMA_OUTDATED"] = True
-            app.logger.error(schema_upgrade_hint)
-        except (IntegrityError, OperationalError) as e:
-            # Race beim parallelen Seeding der Default-Daten durch mehrere
-            # Worker: Ein anderer Worker hat die Defaults bereits angelegt.
-            db.session.rollback()
-            app.logger.warning("Default-Seeding beim Start uebersprungen: %s", e)
+            filters = parse_export_filters(tournament, group, cube, date_from, date_to)
+        except ValueError as e:
+            raise click.BadParameter(str(e))
+        for chunk in stream_export(export_format, filters):
+            output.write(chunk)
+
+    @app.cli.command("archive-tournaments")
+    @click.option("--min-age-days", default=30, show_default=True, type=float, help="Nur Turniere, die mindestens so lange beendet sind.")
+    def archive_tournaments_command(min_age_days):
+        """Packt beendete Turniere in tournament_archive/ und entfernt die Live-Dateien."""
+        from .routes import is_valid_tournament_id
+        from .tournament_archive import archive_ended_tournaments
+
+        summary = archive_ended_tournaments(min_age_days=min_age_days, is_valid_id=is_valid_tournament_id)
+        click.echo(f"{summary['archived']} Turnier(e) archiviert, {summary['skipped']} übersprungen.")
+
+    @app.cli.command("recompute-ratings")
+    @click.option("--batch-size", default=1000, show_default=True, type=int, help="Matches pro gelesenem Block.")
+    def recompute_ratings_command(batch_size):
+        """Berechnet alle Elo-Wertungen chronologisch aus der Match-Historie neu."""
+        from .services.ratings import recompute_all_ratings
+        from .services.versions import PLAYERS_SCOPE, TOURNAMENTS_SCOPE, bump_versions
+
+        summary = recompute_all_ratings(
+            batch_size=batch_size,
+            progress=lambda done: click.echo(f"{done} Match(es) gewertet"),
+        )
+        bump_versions([PLAYERS_SCOPE, TOURNAMENTS_SCOPE])
+        click.echo(f"Fertig: {summary['matches']} Match(es), {summary['ratings']} Wertung(en).")
 
     @app.context_processor
     def inject_csrf_token():
@@ -184,13 +320,13 @@ def create_app():
             payload = {
                 "success": False,
                 "code": "DB_SCHEMA_OUTDATED",
-                "message": schema_upgrade_hint,
+                "message": SCHEMA_UPGRADE_HINT,
             }
             if request.path.startswith("/api/"):
                 return jsonify(payload), 503
             return (
                 "<h1>Datenbank-Schema veraltet</h1>"
-                f"<p>{schema_upgrade_hint}</p>",
+                f"<p>{SCHEMA_UPGRADE_HINT}</p>",
                 503,
                 {"Content-Type": "text/html; charset=utf-8"},
             )
@@ -262,6 +398,7 @@ def create_app():
                         "path": request.path,
                         "status_code": response.status_code,
                         "duration_ms": duration_ms,
+                        "lock_wait_ms": round(getattr(g, "lock_wait_ms", 0.0), 1),
                         "tournament_id": session.get("tournament_id"),
                     }
                 )
@@ -0,0 +1,77 @@
+"""Advisory-Locks für Read-Modify-Write auf Turnierdateien.
+
+Zwei Scorekeeper, die parallel Tische derselben Runde speichern, lesen beide
+`round_N.csv`, ändern je eine Zeile und ersetzen die Datei atomar - ohne Lock
+gewinnt der letzte Schreiber und das andere Ergebnis geht verloren. Die Locks
+hier serialisieren solche Zugriffe pro Turnier (fcntl.flock, wirkt über alle
+Gunicorn-Worker hinweg); verschiedene Turniere blockieren sich nicht.
+
+Ohne fcntl (z.B. Windows-Entwicklung) greift nur der prozesslokale
+Thread-Lock. Die Wartezeit landet in `g.lock_wait_ms` und damit im
+http_request-Logeintrag.
+"""
+
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from flask import g, has_app_context
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - nur auf Plattformen ohne fcntl
+    fcntl = None
+
+
+LOCK_DIR = os.path.join("instance", "locks")
+# Globale results.csv wird von allen Turnieren geschrieben.
+RESULTS_LOCK_NAME = "results"
+
+_THREAD_LOCKS = defaultdict(threading.Lock)
+_THREAD_LOCKS_GUARD = threading.Lock()
+_UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def _thread_lock(name):
+    with _THREAD_LOCKS_GUARD:
+        return _THREAD_LOCKS[name]
+
+
+def _record_wait(seconds):
+    if has_app_context():
+        g.lock_wait_ms = getattr(g, "lock_wait_ms", 0.0) + seconds * 1000.0
+
+
+@contextmanager
+def file_lock(name):
+    """Exklusiver Lock mit Namen `name` (nicht reentrant)."""
+    safe_name = _UNSAFE_NAME_CHARS.sub("_", str(name))
+    started = time.monotonic()
+    thread_lock = _thread_lock(safe_name)
+    thread_lock.acquire()
+    handle = None
+    try:
+        if fcntl is not None:
+            os.makedirs(LOCK_DIR, exist_ok=True)
+            handle = open(os.path.join(LOCK_DIR, f"{safe_name}.lock"), "a+")
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        _record_wait(time.monotonic() - started)
+        yield
+    finally:
+        if handle is not None:
+            try:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            finally:
+                handle.close()
+        thread_lock.release()
+
+
+def tournament_lock(tournament_id):
+    return file_lock(f"tournament-{tournament_id}")
+
+
+def results_lock():
+    return file_lock(RESULTS_LOCK_NAME)
@@ -51,8 +51,9 @@ class Tournament(db.Model):
     id = db.Column(db.String(36), primary_key=True, default=_uuid_str)
     status = db.Column(db.String(16), nullable=False, default="running")
     current_round = db.Column(db.Integer, nullable=False, default=1)
-    created_at = db.Column(db.DateTime, default=_utcnow, nullable=False)
+    created_at = db.Column(db.DateTime, default=_utcnow, nullable=False, index=True)
     ended_at = db.Column(db.DateTime, nullable=True)
+    pairing_mode = db.Column(db.String(16), nullable=True)
 
     group_id = db.Column(db.String(64), db.ForeignKey("tournament_groups.id"), nullable=False)
     cube_id = db.Column(db.String(64), db.ForeignKey("cubes.id"), nullable=False)
@@ -161,3 +162,64 @@ class PlayerPowerNine(db.Model):
     __table_args__ = (
         UniqueConstraint("tournament_id", "player_id", "card_name", name="uq_power_nine_tournament_player_card"),
     )
+
+
+class PlayerRating(db.Model):
+    __tablename__ = "player_ratings"
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    player_id = db.Column(db.String(36), db.ForeignKey("players.id"), nullable=False, index=True)
+    scope_key = db.Column(db.String(160), nullable=False, index=True)
+    rating = db.Column(db.Float, nullable=False)
+    matches = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=_utcnow, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("player_id", "scope_key", name="uq_player_ratings_player_scope"),
+    )
+
+
+class MatchRatingDelta(db.Model):
+    __tablename__ = "match_rating_deltas"
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    # Ohne Fremdschlüssel: Match-IDs kann SQLite nach Löschungen neu vergeben,
+    # eindeutig ist erst (tournament_id, match_id). Aufräumen über
+    # services.ratings.revert_match_ratings vor jeder Match-Löschung.
+    tournament_id = db.Column(db.String(36), nullable=False, index=True)
+    match_id = db.Column(db.Integer, nullable=False, index=True)
+    scope_key = db.Column(db.String(160), nullable=False)
+    player1_id = db.Column(db.String(36), nullable=False)
+    player2_id = db.Column(db.String(36), nullable=False)
+    delta = db.Column(db.Float, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("tournament_id", "match_id", "scope_key", name="uq_match_rating_deltas_match_scope"),
+    )
+
+
+class DataVersion(db.Model):
+    __tablename__ = "data_versions"
+
+    scope_key = db.Column(db.String(160), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=_utcnow, nullable=False)
+
+
+class TournamentEvent(db.Model):
+    __tablename__ = "tournament_events"
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    tournament_id = db.Column(db.String(36), nullable=False, index=True)
+    event_type = db.Column(db.String(32), nullable=False)
+    payload = db.Column(db.Text, nullable=False, default="{}")
+    created_at = db.Column(db.DateTime, default=_utcnow, nullable=False)
+
+
+class ServerSession(db.Model):
+    __tablename__ = "server_sessions"
+
+    id = db.Column(db.String(64), primary_key=True)
+    data = db.Column(db.Text, nullable=False, default="{}")
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+    updated_at = db.Column(db.DateTime, default=_utcnow, nullable=False)
@@ -0,0 +1,110 @@
+"""Fingerprint des Turnierstands und zwischengespeicherte Paarungen für die nächste Runde.
+
+Die Paarungen der nächsten Runde hängen nur von den bisherigen Runden
+(Ergebnisse, Dropouts), den Spielergruppen und dem Pairing-Modus ab. Der
+Fingerprint fasst genau diese Eingaben als SHA-256 zusammen; unter ihm legt
+`data/<id>/pairing_cache.json` die berechnete Rundenliste ab. Ein erneuter
+Aufruf mit unverändertem Stand (Doppelklick, Retry, Vorschau und späteres
+Bestätigen) übernimmt sie, ohne Leaderboard und Pairing-Suche neu zu rechnen.
+
+Dieselbe Datei merkt sich die Idempotency-Keys bereits ausgeführter
+next_round-POSTs mit der erzeugten Rundennummer. Schreibzugriffe erfolgen
+unter dem Turnier-Lock des Aufrufers.
+"""
+
+import hashlib
+import json
+import os
+import re
+
+from .atomic_io import atomic_write
+
+
+CACHE_FILENAME = "pairing_cache.json"
+# Erhöhen, wenn sich der Pairing-Algorithmus ändert: alte Einträge werden dann ignoriert.
+FINGERPRINT_VERSION = 1
+MAX_REMEMBERED_KEYS = 20
+_IDEMPOTENCY_KEY_RE = re.compile(r"^[A-Za-z0-9_-]{8,64}$")
+
+
+def normalize_idempotency_key(value):
+    """Bereinigter Key oder None, wenn er fehlt oder ungültig ist."""
+    key = (value or "").strip()
+    return key if _IDEMPOTENCY_KEY_RE.match(key) else None
+
+
+def state_fingerprint(rounds_dir, up_to_round, player_groups, marked_players, pairing_mode):
+    """SHA-256 über alle Runden bis up_to_round, Spielergruppen, Dropouts und Pairing-Modus."""
+    digest = hashlib.sha256()
+    header = {
+        "version": FINGERPRINT_VERSION,
+        "round": int(up_to_round),
+        # Reihenfolge der Gruppen bestimmt die Tischnummerierung: nicht sortieren.
+        "groups": list(player_groups.items()),
+        "marked": sorted(marked_players),
+        "pairing_mode": pairing_mode,
+    }
+    digest.update(json.dumps(header, ensure_ascii=False).encode("utf-8"))
+    for round_number in range(1, int(up_to_round) + 1):
+        digest.update(f"\0round_{round_number}\0".encode("ascii"))
+        try:
+            with open(os.path.join(rounds_dir, f"round_{round_number}.csv"), "rb") as f:
+                digest.update(f.read())
+        except FileNotFoundError:
+            digest.update(b"missing")
+    return digest.hexdigest()
+
+
+def _cache_path(tournament_dir):
+    return os.path.join(tournament_dir, CACHE_FILENAME)
+
+
+def _load(tournament_dir):
+    try:
+        with open(_cache_path(tournament_dir), "r", encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _save(tournament_dir, payload):
+    atomic_write(_cache_path(tournament_dir), lambda f: json.dump(payload, f, ensure_ascii=False))
+
+
+def load_cached_round(tournament_dir, fingerprint):
+    """{"matches": [...], "diagnostics": [...]} für diesen Fingerprint oder None."""
+    payload = _load(tournament_dir)
+    if payload.get("fingerprint") != fingerprint or not isinstance(payload.get("matches"), list):
+        return None
+    return {"matches": payload["matches"], "diagnostics": payload.get("diagnostics") or []}
+
+
+def store_cached_round(tournament_dir, fingerprint, matches, diagnostics=()):
+    payload = _load(tournament_dir)
+    payload["fingerprint"] = fingerprint
+    payload["matches"] = list(matches)
+    payload["diagnostics"] = list(diagnostics)
+    _save(tournament_dir, payload)
+
+
+def round_for_idempotency_key(tournament_dir, key):
+    """Rundennummer, die ein früherer POST mit diesem Key erzeugt hat, oder None."""
+    if not key:
+        return None
+    value = _load(tournament_dir).get("requests", {}).get(key)
+    return int(value) if isinstance(value, int) else None
+
+
+def remember_idempotency_key(tournament_dir, key, round_number):
+    if not key:
+        return
+    payload = _load(tournament_dir)
+    requests = payload.get("requests")
+    if not isinstance(requests, dict):
+        requests = {}
+    requests.pop(key, None)
+    requests[key] = int(round_number)
+    # Nur die jüngsten Keys behalten (Einfügereihenfolge).
+    payload["requests"] = dict(list(requests.items())[-MAX_REMEMBERED_KEYS:])
+    _save(tournament_dir, payload)
@@ -0,0 +1,172 @@
+"""Paarungen für mehrere Pods (Spielergruppen) parallel berechnen.
+
+Die Swiss-Suche ist reine CPU-Arbeit; Threads bringen wegen des GIL nichts.
+Unabhängige Pods gehen deshalb an einen prozessweiten ProcessPoolExecutor,
+kleine Pods (und einzelne Pods) werden direkt im Request-Thread gepaart, weil
+sich der Versand dort nicht lohnt. Die Ergebnisse kommen immer in der
+Reihenfolge der übergebenen Pods zurück; die Tischnummerierung des Aufrufers
+bleibt damit unabhängig davon, welcher Prozess zuerst fertig ist.
+
+Pods teilen keine Spieler: jeder Worker bekommt nur Punkte, Gegner und
+BYE-Zähler seiner eigenen Spieler.
+
+Der Pool ist standardmäßig aus (`PAIRING_POOL_WORKERS=0`) und wird nie im
+Request gestartet: ein Spawn-Worker braucht ~1-3 s zum Hochfahren, das sonst
+der erste `/next_round` unter dem Turnier-Lock zahlen würde. `start_pool()`
+läuft stattdessen beim Prozessstart (Gunicorn `post_worker_init`, run.py);
+ohne laufenden Pool wird im Request-Thread gepaart. Jeder Gunicorn-Worker hat
+einen eigenen Pool, `pool_size_for()` teilt die CPUs deshalb durch die Zahl
+der Worker. Gemessen auf 1 CPU war der Pool durchweg langsamer (4 Pods à 12
+Spieler: 968 statt 710 ms); lohnend ist er nur mit freien Kernen.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from flask import current_app, has_app_context
+
+from .swiss_pairing import generate_swiss_pairings
+
+
+# Ab dieser Pod-Größe lohnt sich der Versand an einen Worker-Prozess.
+DEFAULT_PARALLEL_MIN_PLAYERS = 10
+
+_POOL = None
+_POOL_WORKERS = 0
+_POOL_GUARD = threading.Lock()
+
+
+def _config_value(key, default):
+    if has_app_context():
+        return current_app.config.get(key, default)
+    return default
+
+
+def pool_size_for(requested, processes=1):
+    """Pool-Größe pro Prozess: höchstens die CPUs, die auf jeden von `processes` Prozessen entfallen.
+
+    Weniger als 2 Worker lohnen nicht; dann 0 (Pool aus).
+    """
+    size = min(max(0, int(requested or 0)), (os.cpu_count() or 1) // max(1, int(processes)))
+    return size if size >= 2 else 0
+
+
+def _warm_up():
+    return os.getpid()
+
+
+def start_pool(workers):
+    """Startet den Pool mit `workers` Prozessen und wartet, bis alle bereit sind.
+
+    0 oder 1 schaltet den Pool ab. Liefert die tatsächliche Pool-Größe.
+    """
+    global _POOL, _POOL_WORKERS
+    workers = max(0, int(workers or 0))
+    pool = None
+    if workers >= 2:
+        # "spawn" statt fork: der Prozess hat Threads, DB-Verbindungen und
+        # Locks, die ein Fork-Kind in undefiniertem Zustand erben würde.
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        # Prozesse entstehen erst beim ersten submit: jetzt alle hochfahren
+        # (ohne Guard, damit Requests währenddessen inline weiterpaaren).
+        for future in [pool.submit(_warm_up) for _ in range(workers)]:
+            future.result()
+    with _POOL_GUARD:
+        previous = _POOL
+        _POOL = pool
+        _POOL_WORKERS = workers if pool is not None else 0
+    if previous is not None:
+        previous.shutdown(wait=False, cancel_futures=True)
+    return workers if pool is not None else 0
+
+
+def _get_pool(workers):
+    """Laufender Pool oder None; im Request wird nie ein Pool gestartet."""
+    with _POOL_GUARD:
+        return _POOL if _POOL is not None and _POOL_WORKERS >= 2 else None
+
+
+def _restart_pool_in_background(workers):
+    # Nach einem abgestürzten Worker neu starten, ohne den Request aufzuhalten.
+    threading.Thread(target=start_pool, args=(workers,), name="pairing-pool-restart", daemon=True).start()
+
+
+def shutdown_pool():
+    global _POOL, _POOL_WORKERS
+    with _POOL_GUARD:
+        if _POOL is not None:
+            _POOL.shutdown(wait=True, cancel_futures=True)
+        _POOL = None
+        _POOL_WORKERS = 0
+
+
+def _pod_inputs(players, points_by_player, opponents_by_player, bye_counts_by_player):
+    # Nur die Daten des Pods übertragen (und aus defaultdicts echte dicts machen).
+    return (
+        list(players),
+        {player: points_by_player[player] for player in players if player in points_by_player},
+        {player: list(opponents_by_player.get(player, [])) for player in players},
+        {player: int(bye_counts_by_player.get(player, 0)) for player in players},
+    )
+
+
+def _pair_pod(args):
+    return generate_swiss_pairings(*args)
+
+
+def pair_pods(pods, points_by_player, opponents_by_player, bye_counts_by_player,
+              max_workers=None, min_parallel_players=None):
+    """Paart jeden Pod aus `pods` ([sortierte Spieler, ...]) und liefert die Ergebnisse in gleicher Reihenfolge.
+
+    max_workers / min_parallel_players überschreiben die Konfiguration
+    PAIRING_POOL_WORKERS / PAIRING_PARALLEL_MIN_PLAYERS; 0 oder 1 Worker
+    schaltet den Prozess-Pool ab. Genutzt wird nur ein per start_pool()
+    gestarteter Pool.
+    """
+    if max_workers is None:
+        max_workers = _config_value("PAIRING_POOL_WORKERS", 0)
+    if min_parallel_players is None:
+        min_parallel_players = _config_value("PAIRING_PARALLEL_MIN_PLAYERS", DEFAULT_PARALLEL_MIN_PLAYERS)
+    max_workers = max(0, int(max_workers))
+
+    inputs = [_pod_inputs(players, points_by_player, opponents_by_player, bye_counts_by_player) for players in pods]
+    results = [None] * len(inputs)
+    remote = [index for index, args in enumerate(inputs) if len(args[0]) >= int(min_parallel_players)]
+    if max_workers < 2 or len(remote) < 2:
+        remote = []
+
+    futures = {}
+    if remote:
+        try:
+            pool = _get_pool(max_workers)
+            if pool is not None:
+                futures = {index: pool.submit(_pair_pod, inputs[index]) for index in remote}
+        except (BrokenProcessPool, OSError, RuntimeError) as e:
+            print(f"Pairing-Pool nicht verfügbar, paare im Request-Thread: {e}")
+            pool_workers = _POOL_WORKERS
+            shutdown_pool()
+            if isinstance(e, BrokenProcessPool):
+                _restart_pool_in_background(pool_workers)
+            futures = {}
+
+    # Kleine Pods währenddessen im eigenen Thread paaren.
+    for index, args in enumerate(inputs):
+        if index not in futures:
+            results[index] = _pair_pod(args)
+
+    for index, future in futures.items():
+        try:
+            results[index] = future.result()
+        except Exception as e:
+            # Echte Fehler der Suche treten inline erneut auf; ein defekter Pool
+            # (abgestürzter Worker) wird verworfen und im Hintergrund neu gestartet.
+            print(f"Pairing-Worker fehlgeschlagen, paare Pod {index} im Request-Thread: {e!r}")
+            if isinstance(e, BrokenProcessPool) and _get_pool(max_workers) is not None:
+                pool_workers = _POOL_WORKERS
+                shutdown_pool()
+                _restart_pool_in_background(pool_workers)
+            results[index] = _pair_pod(inputs[index])
+    return results
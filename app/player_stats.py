@@ -3,11 +3,13 @@ import json
 from typing import Dict, Any, Set, Tuple
 
 from flask import has_app_context
-from sqlalchemy import or_
+from sqlalchemy import func, or_, update
 
 from .db import db
 from .models import Match, Player, PlayerPowerNine, Round, Tournament, TournamentPlayer
 from .services.normalize import normalize_name
+from .services.ratings import delete_player_ratings
+from .services.versions import PLAYER_NAMES_SCOPE, PLAYERS_SCOPE, bump_versions, player_scope
 from .tournament_groups import load_tournament_meta, normalize_cube_id, normalize_group_id
 
 # Definiere die Struktur der Power Nine Karten
@@ -112,31 +114,64 @@ def update_player_power_nine(player_name: str, power_nine_data: Dict[str, bool])
     return isinstance(player_name, str) and isinstance(power_nine_data, dict)
 
 
-def delete_player(player_name: str) -> bool:
+def _detach_match_slot(id_column, snapshot_column, player_id, player_name) -> int:
+    """Friert den Namen als Snapshot ein und löst die Spieler-Referenz (ein UPDATE)."""
+    result = db.session.execute(
+        update(Match)
+        .where(id_column == player_id)
+        .values(
+            {
+                # Vorhandene, nicht-leere Snapshots bleiben unverändert.
+                snapshot_column: func.coalesce(func.nullif(func.trim(snapshot_column), ""), player_name),
+                id_column: None,
+            }
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return int(result.rowcount or 0)
+
+
+def delete_player_with_counts(player_name: str) -> Dict[str, int]:
+    """
+    Löscht einen Spieler mengenbasiert und liefert die betroffenen Zeilen.
+
+    Matches werden nicht geladen: je Slot setzt ein UPDATE den Namens-Snapshot
+    (COALESCE mit bestehendem Snapshot) und entfernt die ID. Alles läuft in
+    einer Transaktion; der Speicherbedarf hängt nicht von der Matchzahl ab.
+    """
+    counts = {
+        "players": 0,
+        "player1_matches": 0,
+        "player2_matches": 0,
+        "tournament_players": 0,
+        "power_nine": 0,
+        "ratings": 0,
+    }
     if not has_app_context():
-        return True
+        return counts
     normalized = normalize_name(player_name)
     row = Player.query.filter_by(normalized_name=normalized).first()
     if row is None:
-        return True
+        return counts
+    player_id, stored_name = row.id, row.name
 
     # Historische Lesbarkeit sichern: Namen als Snapshot in Matches einfrieren.
-    matches = Match.query.filter(or_(Match.player1_id == row.id, Match.player2_id == row.id)).all()
-    for match in matches:
-        if match.player1_id == row.id and not _name_or_none(match.player1_name_snapshot):
-            match.player1_name_snapshot = row.name
-        if match.player2_id == row.id and not _name_or_none(match.player2_name_snapshot):
-            match.player2_name_snapshot = row.name
-        if match.player1_id == row.id:
-            match.player1_id = None
-        if match.player2_id == row.id:
-            match.player2_id = None
+    counts["player1_matches"] = _detach_match_slot(Match.player1_id, Match.player1_name_snapshot, player_id, stored_name)
+    counts["player2_matches"] = _detach_match_slot(Match.player2_id, Match.player2_name_snapshot, player_id, stored_name)
 
     # Turnierzuordnungen und turnierbezogene Kartenreferenzen aufräumen.
-    TournamentPlayer.query.filter_by(player_id=row.id).delete(synchronize_session=False)
-    PlayerPowerNine.query.filter_by(player_id=row.id).delete(synchronize_session=False)
-    db.session.delete(row)
+    counts["tournament_players"] = TournamentPlayer.query.filter_by(player_id=player_id).delete(synchronize_session=False)
+    counts["power_nine"] = PlayerPowerNine.query.filter_by(player_id=player_id).delete(synchronize_session=False)
+    counts["ratings"] = delete_player_ratings(player_id)
+    counts["players"] = Player.query.filter_by(id=player_id).delete(synchronize_session=False)
+    db.session.expunge(row)
+    bump_versions([player_scope(stored_name), PLAYERS_SCOPE, PLAYER_NAMES_SCOPE], commit=False)
     db.session.commit()
+    return counts
+
+
+def delete_player(player_name: str) -> bool:
+    delete_player_with_counts(player_name)
     return True
 
 
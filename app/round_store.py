@@ -0,0 +1,38 @@
+"""Lesen von Rundendateien (`data/<id>/rounds/round_N.csv`).
+
+Lesepfade schreiben nie: die CSV ist die einzige Quelle.
+"""
+
+import csv
+import os
+
+
+def read_round_table(csv_path):
+    """Liefert (fieldnames, rows) einer Rundendatei wie csv.DictReader.
+
+    Fehlt die CSV, wird wie bei open() ein OSError ausgelöst.
+    """
+    with open(csv_path, "r", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        rows = list(reader)
+        return reader.fieldnames, rows
+
+
+def read_round_rows(csv_path):
+    return read_round_table(csv_path)[1]
+
+
+def list_round_numbers(rounds_dir):
+    """Rundennummern aller `round_N.csv` in rounds_dir (unsortiert)."""
+    round_numbers = []
+    try:
+        filenames = os.listdir(rounds_dir)
+    except OSError:
+        return round_numbers
+    for filename in filenames:
+        if filename.startswith("round_") and filename.endswith(".csv"):
+            try:
+                round_numbers.append(int(filename[len("round_"):-len(".csv")]))
+            except ValueError:
+                continue
+    return round_numbers
@@ -1,21 +1,95 @@
-from flask import Blueprint, render_template, request, jsonify, session, redirect, url_for, flash, current_app
+from flask import (
+    Blueprint,
+    Response,
+    current_app,
+    flash,
+    jsonify,
+    make_response,
+    redirect,
+    render_template,
+    request,
+    session,
+    stream_with_context,
+    url_for,
+)
 import uuid
 import random
 import os
 import csv
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timezone
 from collections import Counter, defaultdict
+from functools import lru_cache, wraps
 import json
 import hashlib
 import hmac
+import secrets
 from werkzeug.security import check_password_hash
-from .atomic_io import atomic_write
-from .services.players import get_or_create_player, list_player_names
-from .services.tournaments import set_tournament_status
+from .atomic_io import AtomicBatch, atomic_write
+from .file_locks import results_lock, tournament_lock
+from .round_store import list_round_numbers, read_round_rows, read_round_table
+from .session_store import regenerate_session_id
+from .tournament_archive import (
+    delete_archived_tournament,
+    is_archived,
+    list_archived,
+    read_archived_results,
+    restore_tournament,
+)
+from .services.players import get_or_create_player, get_or_create_players
+from .services.fragment_cache import cached_fragment, invalidate_fragments
+from .services.exports import EXPORT_FORMATS, parse_export_filters, stream_export
+from .services.events import (
+    EVENT_MATCH_RESULT,
+    EVENT_PAIRINGS_UPDATED,
+    EVENT_ROUND_CREATED,
+    latest_event_id,
+    list_events_since,
+    publish_event,
+)
+from .services.tournaments import get_tournament, set_tournament_pairing_mode, set_tournament_status
+from .services.versions import (
+    PLAYERS_SCOPE,
+    TOURNAMENTS_SCOPE,
+    bump_versions,
+    get_versions,
+    player_scope,
+    tournament_scope,
+)
 from .models import Match, Player, PlayerPowerNine, Round, Tournament
 from .db import db
 from .services.normalize import normalize_name
-from .swiss_pairing import generate_swiss_pairings
+from .pairing_cache import (
+    load_cached_round,
+    normalize_idempotency_key,
+    remember_idempotency_key,
+    round_for_idempotency_key,
+    state_fingerprint,
+    store_cached_round,
+)
+from .pairing_executor import pair_pods
+from .services.player_index import (
+    DEFAULT_SIMILAR_LIMIT,
+    DEFAULT_SUGGEST_LIMIT,
+    similar_player_names,
+    suggest_player_names,
+)
+from .services.head_to_head import head_to_head_page, player_head_to_head
+from .services.player_listing import players_page, sort_options as player_sort_options
+from .services.ratings import (
+    apply_match_rating,
+    get_player_rating,
+    rating_scope_for_filter,
+    ratings_for_scope,
+    revert_match_ratings,
+)
+from .seating import (
+    DEFAULT_HISTORY_TOURNAMENTS,
+    DEFAULT_TIME_BUDGET_MS,
+    coseating_weights_by_name,
+    optimize_seating,
+)
 import unicodedata
 from .tournament_groups import (
     DEFAULT_GROUP_ID,
@@ -32,6 +106,7 @@ from .tournament_groups import (
     is_vintage_tournament,
     is_valid_cube_id,
     is_valid_group_id,
+    legacy_file_fallbacks_enabled,
     load_allowed_cubes,
     load_tournament_groups,
     rename_tournament_cube,
@@ -50,6 +125,19 @@ AUTH_EXEMPT_ENDPOINTS = {"home", "main.login", "main.logout", "static", "healthz
 PAIRING_MODE_AUTO = "auto"
 PAIRING_MODE_MANUAL = "manual"
 VALID_PAIRING_MODES = {PAIRING_MODE_AUTO, PAIRING_MODE_MANUAL}
+# Ab so vielen Ereignissen seit dem letzten Abgleich liefert die Round-State-API den vollen Stand.
+ROUND_STATE_EVENT_LIMIT = 200
+# Ereignisse pro Abfrage im SSE-Stream; ein volles Paket wird ohne Warten nachgeladen.
+SSE_EVENT_BATCH_LIMIT = 200
+# Offene SSE-Streams dieses Prozesses (je einer belegt einen Gunicorn-Thread).
+_SSE_STREAMS_GUARD = threading.Lock()
+_sse_open_streams = 0
+# Zeilen/Spalten pro Seite der Direktvergleich-Matrix.
+HEAD_TO_HEAD_PER_PAGE = 20
+HEAD_TO_HEAD_MAX_PER_PAGE = 50
+# Spieler pro Seite auf /players (Keyset-Paging).
+PLAYERS_PER_PAGE = 50
+PLAYERS_MAX_PER_PAGE = 200
 
 
 def _is_deleted_player_name(name):
@@ -66,6 +154,11 @@ def _normalize_pairing_mode(value):
 def _get_tournament_pairing_mode(tournament_id):
     if not tournament_id:
         return PAIRING_MODE_AUTO
+    row = get_tournament(tournament_id)
+    if row is not None and row.pairing_mode:
+        return _normalize_pairing_mode(row.pairing_mode)
+    if not legacy_file_fallbacks_enabled():
+        return PAIRING_MODE_AUTO
     meta = load_tournament_meta()
     payload = meta.get(tournament_id, {})
     return _normalize_pairing_mode(payload.get("pairing_mode"))
@@ -75,6 +168,9 @@ def _set_tournament_pairing_mode(tournament_id, pairing_mode):
     if not tournament_id:
         return False
     normalized_mode = _normalize_pairing_mode(pairing_mode)
+    set_tournament_pairing_mode(tournament_id, normalized_mode)
+    if not legacy_file_fallbacks_enabled():
+        return True
     meta = load_tournament_meta()
     payload = meta.get(tournament_id, {}).copy()
     payload["pairing_mode"] = normalized_mode
@@ -84,6 +180,77 @@ def _set_tournament_pairing_mode(tournament_id, pairing_mode):
     return True
 
 
+def _bump_data_versions(tournament_id=None, player_names=(), catalog=False, players_list=True, commit=True):
+    """Markiert die betroffenen Lesesichten als geändert (ETag/Last-Modified)."""
+    keys = [tournament_scope(tournament_id)] if tournament_id else []
+    keys.extend(player_scope(name) for name in player_names if name and name != "BYE")
+    if players_list:
+        keys.append(PLAYERS_SCOPE)
+    if catalog:
+        keys.append(TOURNAMENTS_SCOPE)
+    bump_versions(keys, commit=commit)
+    # Andere Worker erkennen den Versionssprung am Cache-Key; lokal wird sofort geräumt.
+    for key in keys:
+        invalidate_fragments(key)
+
+
+def _publish_tournament_event(tournament_id, event_type, payload, player_names=(), players_list=False):
+    """Hängt ein Live-Ereignis an und erhöht im selben Commit den Versionsstempel.
+
+    SSE-Streams fragen das Ereignis-Log nur nach einem Versionssprung ab; beides
+    muss deshalb gemeinsam sichtbar werden.
+    """
+    publish_event(tournament_id, event_type, payload, commit=False)
+    _bump_data_versions(tournament_id, player_names=player_names, players_list=players_list)
+
+
+def _as_http_date(value):
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    # HTTP-Datumsangaben haben Sekundenauflösung.
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def _cache_validators(scope_keys, *extra_parts):
+    """Berechnet (ETag, Last-Modified) aus den Versionsstempeln der Scopes.
+
+    Session-abhängige Teile (aktives Turnier, CSRF-Token, Login) fliessen mit
+    ein, weil sie im gerenderten HTML stecken.
+    """
+    versions = get_versions(scope_keys)
+    parts = [f"{key}={version}" for key, (version, _) in sorted(versions.items())]
+    parts.append(str(session.get("tournament_id") or ""))
+    parts.append(hashlib.sha256(str(session.get("csrf_token") or "").encode("utf-8")).hexdigest()[:16])
+    parts.append(str(session.get("auth_user") or ""))
+    parts.extend(str(part) for part in extra_parts)
+    etag = hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:32]
+    stamps = [_as_http_date(updated_at) for _, updated_at in versions.values() if updated_at is not None]
+    return etag, (max(stamps) if stamps else None)
+
+
+def _apply_cache_validators(response, etag, last_modified):
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def _not_modified_response(etag, last_modified):
+    """Liefert eine 304-Antwort, wenn der Client den aktuellen Stand hat, sonst None."""
+    if session.get("_flashes"):
+        # Ausstehende Flash-Meldungen müssen gerendert werden.
+        return None
+    if request.if_none_match:
+        if not request.if_none_match.contains(etag):
+            return None
+    elif last_modified is None or request.if_modified_since is None or last_modified > request.if_modified_since:
+        return None
+    return _apply_cache_validators(current_app.response_class(status=304), etag, last_modified)
+
+
 def _is_authenticated():
     return bool(session.get("is_authenticated"))
 
@@ -159,59 +326,164 @@ def is_player_marked(player_name):
     marked_players = session.get("leg_players_set", [])
     return player_name in marked_players
 
-def find_all_valid_groupings(player_count, allowed_sizes):
+# Obergrenze für die von /api/groupings gelieferten Vorschläge.
+MAX_GROUPING_RESULTS = 200
+# Schutz vor absurden Payloads; realistische Events liegen weit darunter.
+MAX_GROUPING_PLAYERS = 512
+
+
+def _grouping_rank(grouping):
+    # Wenigste Tische zuerst, dann möglichst ausgeglichene Tischgrössen.
+    return (len(grouping), max(grouping) - min(grouping), grouping)
+
+
+@lru_cache(maxsize=256)
+def _enumerate_groupings(player_count, sizes):
+    """
+    Zählt alle Multimengen aus `sizes` (absteigend sortiert) mit Summe
+    player_count auf. Jede Multimenge wird genau einmal als nicht-steigende
+    Folge erzeugt; unerreichbare Reste werden über einen Memo-Cache verworfen.
+    """
+    reachable_cache = {}
+
+    def reachable(remaining, index):
+        key = (remaining, index)
+        if key not in reachable_cache:
+            if remaining == 0:
+                reachable_cache[key] = True
+            else:
+                reachable_cache[key] = any(
+                    sizes[i] <= remaining and reachable(remaining - sizes[i], i)
+                    for i in range(index, len(sizes))
+                )
+        return reachable_cache[key]
+
+    results = set()
+
+    def walk(remaining, index, current):
+        if remaining == 0:
+            results.add(tuple(sorted(current)))
+            return
+        for i in range(index, len(sizes)):
+            size = sizes[i]
+            if size <= remaining and reachable(remaining - size, i):
+                current.append(size)
+                walk(remaining - size, i, current)
+                current.pop()
+
+    walk(player_count, 0, [])
+    return tuple(sorted(results, key=_grouping_rank))
+
+
+def find_all_valid_groupings(player_count, allowed_sizes, limit=None):
     """
     Findet alle möglichen Gruppierungen für die gegebene Spieleranzahl.
     
     Args:
         player_count: Gesamtzahl der Spieler
         allowed_sizes: Liste der erlaubten Tischgrössen
+        limit: optionale Obergrenze für die Anzahl Ergebnisse
     
     Returns:
-        Liste von Tupeln mit möglichen Gruppierungen
+        Liste von Tupeln (aufsteigend sortierte Tischgrössen), gereiht nach
+        wenigsten Tischen und danach gleichmässigster Verteilung
     """
-    print(f"Suche Gruppierungen für {player_count} Spieler mit erlaubten Größen {allowed_sizes}")
-    valid_groupings = []
-    
-    def find_combinations(remaining_players, current_grouping):
-        print(f"  Prüfe: Verbleibend={remaining_players}, Aktuell={current_grouping}")
-        if remaining_players == 0:
-            # Wenn alle Spieler verteilt sind, füge die Gruppierung hinzu
-            sorted_grouping = tuple(sorted(current_grouping))
-            if sorted_grouping not in valid_groupings:
-                print(f"  Gefunden: {sorted_grouping}")
-                valid_groupings.append(sorted_grouping)
-            return
-        
-        # Probiere jede erlaubte Tischgrösse
-        for size in sorted(allowed_sizes, reverse=True):
-            if size <= remaining_players:
-                find_combinations(remaining_players - size, current_grouping + [size])
-    
-    # Starte die rekursive Suche
-    find_combinations(player_count, [])
-    print(f"Gefundene Gruppierungen: {valid_groupings}")
-    return valid_groupings
+    sizes = tuple(sorted({int(size) for size in allowed_sizes if int(size) > 0}, reverse=True))
+    if player_count <= 0 or player_count > MAX_GROUPING_PLAYERS or not sizes:
+        return []
+    groupings = _enumerate_groupings(int(player_count), sizes)
+    if limit is not None:
+        groupings = groupings[:max(0, int(limit))]
+    return list(groupings)
+
+def _last_tournament_info(tournament_id, payload):
+    """Kompaktes Turnierformat aus dem Inhalt einer `<id>_results.json`."""
+    tournament_data = payload.get("tournament_data", {})
+    final_leaderboard = payload.get("final_leaderboard", [])
+
+    # Finde den Gewinner (erster Eintrag im Leaderboard)
+    winner_name = "Unbekannt"
+    if final_leaderboard and len(final_leaderboard) > 0:
+        winner_name = final_leaderboard[0][0]
+
+    tournament_info = {
+        'id': tournament_id,
+        'winner': winner_name,
+        'date': tournament_data.get('end_date', 'Unbekannt'),
+        'rounds': tournament_data.get('total_rounds', 0),
+        'leaderboard': final_leaderboard,
+    }
+    group_id = tournament_data.get("group_id")
+    if not group_id:
+        group_id = get_tournament_group_id(tournament_id)
+    tournament_info["group_id"] = group_id
+    tournament_info["group_name"] = get_group_name(group_id)
+    cube_id = tournament_data.get("cube_id")
+    cube_name = tournament_data.get("cube_name")
+    if not is_valid_cube_id(cube_id):
+        cube_id = get_tournament_cube_id(tournament_id)
+    if not cube_name:
+        cube_name = get_cube_name(cube_id)
+    tournament_info["cube_id"] = cube_id
+    tournament_info["cube_name"] = cube_name
+    return tournament_info
+
+
+def _get_last_tournaments_from_db(limit, group_filter):
+    """Auswahl und Reihenfolge aus der DB; geöffnet werden nur die `limit` Ergebnisdateien."""
+    query = Tournament.query.filter(Tournament.status == TOURNAMENT_STATUS_ENDED)
+    if group_filter:
+        query = query.filter(Tournament.group_id == group_filter)
+    rows = (
+        query.order_by(Tournament.ended_at.desc().nullslast(), Tournament.created_at.desc())
+        .limit(limit)
+        .all()
+    )
+    last_tournaments = []
+    for row in rows:
+        payload = {}
+        file_path = os.path.join("tournament_results", f"{row.id}_results.json")
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            payload = read_archived_results(row.id)
+        except (OSError, ValueError) as e:
+            print(f"Fehler beim Verarbeiten von {file_path}: {str(e)}")
+            payload = {}
+        tournament_info = _last_tournament_info(row.id, payload)
+        if tournament_info["date"] == "Unbekannt" and row.ended_at:
+            tournament_info["date"] = row.ended_at.strftime("%d.%m.%Y %H:%M")
+        last_tournaments.append(tournament_info)
+    return last_tournaments
+
 
 def get_last_tournaments(limit=5, group_filter=None):
     """Lädt die letzten abgeschlossenen Turniere aus dem tournament_results Verzeichnis"""
+    if not legacy_file_fallbacks_enabled():
+        return _get_last_tournaments_from_db(limit, group_filter)
+
     tournament_results_dir = "tournament_results"
-    if not os.path.exists(tournament_results_dir):
-        return []
-    
+
     # Alle Turnier-Dateien finden
     tournament_files = []
-    for file in os.listdir(tournament_results_dir):
-        if file.endswith("_results.json"):
-            file_path = os.path.join(tournament_results_dir, file)
-            try:
-                # Dateiinformationen laden
-                stat_info = os.stat(file_path)
-                modified_time = stat_info.st_mtime
-                tournament_files.append((file_path, modified_time))
-            except Exception as e:
-                print(f"Fehler beim Laden von {file}: {str(e)}")
-    
+    if os.path.exists(tournament_results_dir):
+        for file in os.listdir(tournament_results_dir):
+            if file.endswith("_results.json"):
+                file_path = os.path.join(tournament_results_dir, file)
+                try:
+                    # Dateiinformationen laden
+                    stat_info = os.stat(file_path)
+                    modified_time = stat_info.st_mtime
+                    tournament_files.append((file_path, modified_time))
+                except Exception as e:
+                    print(f"Fehler beim Laden von {file}: {str(e)}")
+    # Archivierte Turniere kommen aus dem Index (ohne Datei-Scan); gelesen wird
+    # nur die Ergebnis-JSON der tatsächlich angezeigten Bündel.
+    for tournament_id, entry in list_archived():
+        if entry.get("has_results"):
+            tournament_files.append((tournament_id, float(entry.get("ended_ts") or 0)))
+
     # Nach Änderungsdatum sortieren (neueste zuerst)
     tournament_files.sort(key=lambda x: x[1], reverse=True)
     
@@ -219,41 +491,18 @@ def get_last_tournaments(limit=5, group_filter=None):
     last_tournaments = []
     for file_path, _ in tournament_files[:limit]:
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                tournament_data = json.load(f)
-                
-                # Finde den Gewinner (erster Eintrag im Leaderboard)
-                winner_name = "Unbekannt"
-                if tournament_data.get('final_leaderboard') and len(tournament_data['final_leaderboard']) > 0:
-                    winner_name = tournament_data['final_leaderboard'][0][0]
-                
+            if file_path.endswith("_results.json"):
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    tournament_data = json.load(f)
                 # Tournament-ID aus dem Dateinamen extrahieren
                 tournament_id = os.path.basename(file_path).replace('_results.json', '')
-                
-                # Erstelle ein kompaktes Turnierformat
-                tournament_info = {
-                    'id': tournament_id,
-                    'winner': winner_name,
-                    'date': tournament_data.get('tournament_data', {}).get('end_date', 'Unbekannt'),
-                    'rounds': tournament_data.get('tournament_data', {}).get('total_rounds', 0),
-                    'leaderboard': tournament_data.get('final_leaderboard', [])
-                }
-                group_id = tournament_data.get("tournament_data", {}).get("group_id")
-                if not group_id:
-                    group_id = get_tournament_group_id(tournament_id)
-                tournament_info["group_id"] = group_id
-                tournament_info["group_name"] = get_group_name(group_id)
-                cube_id = tournament_data.get("tournament_data", {}).get("cube_id")
-                cube_name = tournament_data.get("tournament_data", {}).get("cube_name")
-                if not is_valid_cube_id(cube_id):
-                    cube_id = get_tournament_cube_id(tournament_id)
-                if not cube_name:
-                    cube_name = get_cube_name(cube_id)
-                tournament_info["cube_id"] = cube_id
-                tournament_info["cube_name"] = cube_name
-                if group_filter and tournament_info["group_id"] != group_filter:
-                    continue
-                last_tournaments.append(tournament_info)
+            else:
+                tournament_id = file_path
+                tournament_data = read_archived_results(tournament_id)
+            tournament_info = _last_tournament_info(tournament_id, tournament_data)
+            if group_filter and tournament_info["group_id"] != group_filter:
+                continue
+            last_tournaments.append(tournament_info)
         except Exception as e:
             print(f"Fehler beim Verarbeiten von {file_path}: {str(e)}")
     
@@ -269,35 +518,27 @@ def get_marked_players_for_tournament(tournament_id):
     if not os.path.exists(rounds_dir):
         return []
 
-    round_numbers = []
-    for filename in os.listdir(rounds_dir):
-        if filename.startswith("round_") and filename.endswith(".csv"):
-            try:
-                round_numbers.append(int(filename.replace("round_", "").replace(".csv", "")))
-            except ValueError:
-                continue
+    round_numbers = list_round_numbers(rounds_dir)
 
     for round_num in sorted(round_numbers):
         round_file = os.path.join(rounds_dir, f"round_{round_num}.csv")
         try:
-            with open(round_file, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    p1 = (row.get("player1") or "").strip()
-                    p2 = (row.get("player2") or "").strip()
-                    d1 = (row.get("dropout1") or "false").strip().lower() == "true"
-                    d2 = (row.get("dropout2") or "false").strip().lower() == "true"
-
-                    if p1:
-                        if d1:
-                            marked_players.add(p1)
-                        else:
-                            marked_players.discard(p1)
-                    if p2 and p2 != "BYE":
-                        if d2:
-                            marked_players.add(p2)
-                        else:
-                            marked_players.discard(p2)
+            for row in read_round_rows(round_file):
+                p1 = (row.get("player1") or "").strip()
+                p2 = (row.get("player2") or "").strip()
+                d1 = (row.get("dropout1") or "false").strip().lower() == "true"
+                d2 = (row.get("dropout2") or "false").strip().lower() == "true"
+
+                if p1:
+                    if d1:
+                        marked_players.add(p1)
+                    else:
+                        marked_players.discard(p1)
+                if p2 and p2 != "BYE":
+                    if d2:
+                        marked_players.add(p2)
+                    else:
+                        marked_players.discard(p2)
         except (IOError, OSError):
             continue
 
@@ -329,14 +570,12 @@ def get_active_tournaments(limit=10, group_filter=None):
         rounds_dir = os.path.join(tournament_dir, "rounds")
         round_numbers = []
         latest_ts = os.path.getmtime(tournament_dir)
-        if os.path.exists(rounds_dir):
-            for filename in os.listdir(rounds_dir):
-                if filename.startswith("round_") and filename.endswith(".csv"):
-                    try:
-                        round_numbers.append(int(filename.replace("round_", "").replace(".csv", "")))
-                        latest_ts = max(latest_ts, os.path.getmtime(os.path.join(rounds_dir, filename)))
-                    except ValueError:
-                        continue
+        for round_number in list_round_numbers(rounds_dir):
+            round_numbers.append(round_number)
+            try:
+                latest_ts = max(latest_ts, os.path.getmtime(os.path.join(rounds_dir, f"round_{round_number}.csv")))
+            except OSError:
+                continue
 
         player_count = 0
         player_groups_file = os.path.join(tournament_dir, "player_groups.json")
@@ -384,13 +623,8 @@ def render_index_page(
     selected_cube="vintage",
     group_filter="all",
 ):
-    from .player_stats import get_all_players
-
     tournament_groups = load_tournament_groups()
     allowed_cubes = load_allowed_cubes()
-    known_from_files = set(get_all_players())
-    known_from_db = set(list_player_names())
-    known_player_names = sorted(known_from_files.union(known_from_db), key=lambda name: name.casefold())
     allowed_cube_ids = {cube["id"] for cube in allowed_cubes}
     valid_group_ids = {group["id"] for group in tournament_groups}
     if selected_group_id not in valid_group_ids:
@@ -415,7 +649,7 @@ def render_index_page(
         active_tournaments=active_tournaments,
         tournament_groups=tournament_groups,
         allowed_cubes=allowed_cubes,
-        known_player_names=known_player_names,
+        player_suggest_limit=DEFAULT_SUGGEST_LIMIT,
         selected_group_id=selected_group_id,
         selected_cube=selected_cube,
         selected_group_filter=group_filter or "all",
@@ -433,6 +667,8 @@ def login():
         expected_username = current_app.config.get("APP_LOGIN_USERNAME", "mtg")
 
         if username == expected_username and _is_login_password_valid(password):
+            # Neue Session-ID: eine vor dem Login untergeschobene ID wird wertlos.
+            regenerate_session_id(session)
             session["is_authenticated"] = True
             session["auth_user"] = username
             next_url = request.args.get("next") or request.form.get("next") or url_for("main.index")
@@ -459,6 +695,7 @@ def login():
 def logout():
     session.pop("is_authenticated", None)
     session.pop("auth_user", None)
+    regenerate_session_id(session)
     return redirect(url_for("main.login"))
 
 
@@ -489,6 +726,8 @@ def manage_groups():
 def create_group():
     group_name = request.form.get("group_name", "")
     success, message, _ = create_tournament_group(group_name)
+    if success:
+        _bump_data_versions(catalog=True)
     flash(message, "success" if success else "error")
     return redirect(url_for("main.manage_groups"))
 
@@ -498,6 +737,8 @@ def rename_group():
     group_id = request.form.get("group_id", "")
     group_name = request.form.get("group_name", "")
     success, message = rename_tournament_group(group_id, group_name)
+    if success:
+        _bump_data_versions(catalog=True)
     flash(message, "success" if success else "error")
     return redirect(url_for("main.manage_groups"))
 
@@ -506,6 +747,8 @@ def rename_group():
 def delete_group():
     group_id = request.form.get("group_id", "")
     success, message = delete_tournament_group(group_id)
+    if success:
+        _bump_data_versions(catalog=True)
     flash(message, "success" if success else "error")
     return redirect(url_for("main.manage_groups"))
 
@@ -524,6 +767,8 @@ def manage_cubes():
 def create_cube():
     cube_name = request.form.get("cube_name", "")
     success, message, _ = create_tournament_cube(cube_name)
+    if success:
+        _bump_data_versions(catalog=True)
     flash(message, "success" if success else "error")
     return redirect(url_for("main.manage_cubes"))
 
@@ -533,6 +778,8 @@ def rename_cube():
     cube_id = request.form.get("cube_id", "")
     cube_name = request.form.get("cube_name", "")
     success, message = rename_tournament_cube(cube_id, cube_name)
+    if success:
+        _bump_data_versions(catalog=True)
     flash(message, "success" if success else "error")
     return redirect(url_for("main.manage_cubes"))
 
@@ -541,6 +788,8 @@ def rename_cube():
 def delete_cube():
     cube_id = request.form.get("cube_id", "")
     success, message = delete_tournament_cube(cube_id)
+    if success:
+        _bump_data_versions(catalog=True)
     flash(message, "success" if success else "error")
     return redirect(url_for("main.manage_cubes"))
 
@@ -553,6 +802,9 @@ def load_tournament(tournament_id):
 
     data_dir = os.path.join("data", tournament_id)
     rounds_dir = os.path.join(data_dir, "rounds")
+    if not os.path.exists(data_dir) and is_archived(tournament_id):
+        # Archivierte Turniere beim Öffnen wieder entpacken.
+        restore_tournament(tournament_id)
     if not os.path.exists(data_dir):
         flash("Turnier wurde nicht gefunden.")
         return redirect(url_for("main.index"))
@@ -572,13 +824,7 @@ def load_tournament(tournament_id):
         flash("Turnier geladen, aber es wurden noch keine Runden erstellt.")
         return redirect(url_for("main.index"))
 
-    round_numbers = []
-    for filename in os.listdir(rounds_dir):
-        if filename.startswith("round_") and filename.endswith(".csv"):
-            try:
-                round_numbers.append(int(filename.replace("round_", "").replace(".csv", "")))
-            except ValueError:
-                continue
+    round_numbers = list_round_numbers(rounds_dir)
 
     if not round_numbers:
         flash("Turnier geladen, aber es wurden noch keine Runden erstellt.")
@@ -597,7 +843,7 @@ def api_groupings():
         allowed_sizes = [int(size) for size in group_sizes if int(size) in [6, 8, 10, 12]]
     except (TypeError, ValueError):
         return jsonify([])
-    groupings = find_all_valid_groupings(len(players), allowed_sizes)
+    groupings = find_all_valid_groupings(len(players), allowed_sizes, limit=MAX_GROUPING_RESULTS)
     return jsonify(groupings)
 
 def validate_player_name(name):
@@ -672,6 +918,35 @@ def _stable_shuffle(values, tournament_id, stage, round_number=None):
     rng.shuffle(shuffled)
     return shuffled
 
+
+def _optimize_pods(players, pod_sizes, players_by_name, seed_key, exclude_tournament_id=None):
+    """Verteilt die (bereits gemischten) Spieler auf Pods mit wenig wiederholten Tischnachbarn.
+
+    Ohne Historie oder mit SEATING_OPTIMIZER_ENABLED=false bleibt die
+    Reihenfolge unverändert und wird nur nach pod_sizes aufgeteilt.
+    """
+    config = current_app.config
+    if len(pod_sizes) > 1 and config.get("SEATING_OPTIMIZER_ENABLED", True):
+        weights = coseating_weights_by_name(
+            players_by_name,
+            last_tournaments=int(config.get("SEATING_HISTORY_TOURNAMENTS", DEFAULT_HISTORY_TOURNAMENTS)),
+            exclude_tournament_id=exclude_tournament_id,
+        )
+        if weights:
+            return optimize_seating(
+                players,
+                pod_sizes,
+                weights,
+                time_budget_ms=int(config.get("SEATING_TIME_BUDGET_MS", DEFAULT_TIME_BUDGET_MS)),
+                seed=_get_pairing_seed(seed_key, "seating"),
+            )
+    pods = []
+    start = 0
+    for size in pod_sizes:
+        pods.append(list(players[start:start + size]))
+        start += size
+    return pods
+
 def _create_started_tournament(players, table_size, group_id, cube_id, pairing_mode=PAIRING_MODE_AUTO, set_session_state=True):
     """
     Erstellt ein laufendes Turnier inkl. Runde 1 aus genau einem Tischblock.
@@ -680,8 +955,7 @@ def _create_started_tournament(players, table_size, group_id, cube_id, pairing_m
     tournament_id = str(uuid.uuid4())
     set_tournament_group(tournament_id, group_id, cube_id)
     _set_tournament_pairing_mode(tournament_id, pairing_mode)
-    for player in players:
-        get_or_create_player(player)
+    get_or_create_players(players)
 
     data_dir = os.path.join("data", tournament_id)
     os.makedirs(data_dir, exist_ok=True)
@@ -770,51 +1044,85 @@ def _create_started_tournament(players, table_size, group_id, cube_id, pairing_m
     }
 
 
+def _optional_int(value):
+    return int(value) if str(value if value is not None else "").strip() != "" else None
+
+
 def _sync_round_to_db(tournament_id, round_number, match_list):
-    """Spiegelt eine komplette Runde aus Match-Dicts in die DB."""
+    """Spiegelt eine komplette Runde aus Match-Dicts in die DB.
+
+    Spieler werden gesammelt aufgelöst; Matches werden per Tischnummer
+    abgeglichen, sodass nur geänderte, neue oder entfallene Tische Statements
+    erzeugen.
+    """
     tournament = db.session.get(Tournament, tournament_id)
     if tournament is None:
         return
 
     round_row = Round.query.filter_by(tournament_id=tournament_id, number=round_number).first()
+    existing_matches = {}
     if round_row is None:
         round_row = Round(tournament_id=tournament_id, number=round_number)
         db.session.add(round_row)
         db.session.flush()
     else:
-        Match.query.filter_by(round_id=round_row.id).delete()
+        existing_matches = {
+            match.table_number: match for match in Match.query.filter_by(round_id=round_row.id).all()
+        }
+
+    names = []
+    for match in match_list:
+        names.append(match.get("player1"))
+        if (match.get("player2") or "").strip() != "BYE":
+            names.append(match.get("player2"))
+    players = get_or_create_players(names)
 
+    seen_tables = set()
     for match in match_list:
         player1_name = (match.get("player1") or "").strip()
         player2_name = (match.get("player2") or "").strip()
-        p1 = get_or_create_player(player1_name) if player1_name else None
-        p2 = get_or_create_player(player2_name) if player2_name and player2_name != "BYE" else None
+        p1 = players.get(player1_name) if player1_name else None
+        p2 = players.get(player2_name) if player2_name and player2_name != "BYE" else None
         if p1 is None:
             continue
-        db.session.add(
-            Match(
-                round_id=round_row.id,
-                table_number=int(match.get("table", 0) or 0),
-                table_size=int(match.get("table_size", 0) or 0),
-                group_key=(match.get("group_key") or ""),
-                player1_id=p1.id,
-                player2_id=p2.id if p2 else None,
-                player1_name_snapshot=player1_name or None,
-                player2_name_snapshot=(player2_name if player2_name and player2_name != "BYE" else None),
-                is_bye=(player2_name == "BYE"),
-                score1=int(match["score1"]) if str(match.get("score1", "")).strip() != "" else None,
-                score2=int(match["score2"]) if str(match.get("score2", "")).strip() != "" else None,
-                score_draws=int(match["score_draws"]) if str(match.get("score_draws", "")).strip() != "" else None,
-                dropout1=str(match.get("dropout1", "false")).lower() == "true",
-                dropout2=str(match.get("dropout2", "false")).lower() == "true",
-            )
-        )
+        table_number = int(match.get("table", 0) or 0)
+        values = {
+            "table_size": int(match.get("table_size", 0) or 0),
+            "group_key": (match.get("group_key") or ""),
+            "player1_id": p1.id,
+            "player2_id": p2.id if p2 else None,
+            "player1_name_snapshot": player1_name or None,
+            "player2_name_snapshot": (player2_name if player2_name and player2_name != "BYE" else None),
+            "is_bye": (player2_name == "BYE"),
+            "score1": _optional_int(match.get("score1")),
+            "score2": _optional_int(match.get("score2")),
+            "score_draws": _optional_int(match.get("score_draws")),
+            "dropout1": str(match.get("dropout1", "false")).lower() == "true",
+            "dropout2": str(match.get("dropout2", "false")).lower() == "true",
+        }
+        seen_tables.add(table_number)
+        row = existing_matches.get(table_number)
+        if row is None:
+            row = Match(round_id=round_row.id, table_number=table_number, **values)
+            existing_matches[table_number] = row
+            db.session.add(row)
+            continue
+        for field, value in values.items():
+            # Nur echte Änderungen setzen, damit der Flush unveränderte Tische auslässt.
+            if getattr(row, field) != value:
+                setattr(row, field, value)
+
+    stale_ids = [row.id for table, row in existing_matches.items() if table not in seen_tables and row.id]
+    if stale_ids:
+        revert_match_ratings(tournament_id, stale_ids)
+        Match.query.filter(Match.id.in_(stale_ids)).delete(synchronize_session=False)
 
     tournament.current_round = max(tournament.current_round or 1, int(round_number))
+    _bump_data_versions(tournament_id, catalog=True, commit=False)
     db.session.commit()
 
 
-def _update_match_result_in_db(tournament_id, round_number, table_number, score1, score2, score_draws, dropout1, dropout2):
+def _update_match_result_in_db(tournament_id, round_number, table_number, score1, score2, score_draws, dropout1, dropout2, commit=True):
     round_row = Round.query.filter_by(tournament_id=tournament_id, number=round_number).first()
     if round_row is None:
         return
@@ -826,7 +1134,11 @@ def _update_match_result_in_db(tournament_id, round_number, table_number, score1
     match.score_draws = score_draws
     match.dropout1 = dropout1
     match.dropout2 = dropout2
-    db.session.commit()
+    tournament = db.session.get(Tournament, tournament_id)
+    if tournament is not None:
+        apply_match_rating(match, tournament)
+    if commit:
+        db.session.commit()
 
 def _extract_table_builder_payload():
     raw_payload = (request.form.get("tables_payload") or "").strip()
@@ -907,6 +1219,27 @@ def start_tables():
             }
         )
 
+    # Alle Tische in einem Schritt auflösen; die Turniere finden ihre Spieler danach per IN-Abfrage.
+    players_by_name = get_or_create_players(all_players_seen)
+
+    # Optional: Spieler gleicher Gruppe/Cube neu auf deren Tische verteilen (Tischgrößen bleiben).
+    if request.form.get("optimize_seating") in ("1", "true", "on"):
+        tables_by_kind = {}
+        for table in normalized_tables:
+            tables_by_kind.setdefault((table["group_id"], table["cube_id"]), []).append(table)
+        for tables in tables_by_kind.values():
+            if len(tables) < 2:
+                continue
+            roster = [player for table in tables for player in table["players"]]
+            pods = _optimize_pods(
+                roster,
+                [len(table["players"]) for table in tables],
+                players_by_name,
+                seed_key="|".join(sorted(roster)),
+            )
+            for table, pod in zip(tables, pods):
+                table["players"] = pod
+
     created_tournaments = []
     for table in normalized_tables:
         created_tournaments.append(
@@ -997,8 +1330,7 @@ def pair():
         session["pairing_mode"] = selected_pairing_mode
         set_tournament_group(tournament_id, selected_group_id, selected_cube)
         _set_tournament_pairing_mode(tournament_id, selected_pairing_mode)
-        for player in players:
-            get_or_create_player(player)
+        players_by_name = get_or_create_players(players)
         data_dir = os.path.join("data", tournament_id)
         os.makedirs(data_dir, exist_ok=True)
         
@@ -1007,6 +1339,9 @@ def pair():
         
         # Mische die Spieler deterministisch pro Turnier/Stage
         players = _stable_shuffle(players, tournament_id=tournament_id, stage="pair-initial", round_number=1)
+        # Bei mehreren Pods: wiederholte Tischnachbarn aus den letzten Turnieren vermeiden
+        pods = _optimize_pods(players, selected_grouping, players_by_name, seed_key=tournament_id, exclude_tournament_id=tournament_id)
+        players = [player for pod in pods for player in pod]
         
         pairings = []
         match_list = []
@@ -1110,7 +1445,140 @@ def ensure_data_directory():
             return False
     return True
 
+def _with_tournament_lock(view):
+    """Serialisiert mutierende Requests pro Turnier (Read-Modify-Write der Rundendateien)."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        tournament_id = session.get("tournament_id")
+        if not tournament_id:
+            return view(*args, **kwargs)
+        with tournament_lock(tournament_id):
+            return view(*args, **kwargs)
+    return wrapper
+
+
+RESULTS_FIELDNAMES = [
+    "Tournament",
+    "Timestamp",
+    "Round",
+    "Table",
+    "Player 1",
+    "Score 1",
+    "Player 2",
+    "Score 2",
+    "Draws",
+]
+
+
+def _stage_results_rows(batch, new_rows):
+    """Stellt tournament_data/results.csv mit new_rows im Batch bereit.
+
+    Idempotent pro (Turnier, Runde, Tisch): ein erneutes Speichern überschreibt
+    den bestehenden Eintrag statt Doppelzeilen zu erzeugen.
+    """
+    results_file = os.path.join("tournament_data", "results.csv")
+    fieldnames = list(RESULTS_FIELDNAMES)
+    normalized_rows = []
+    if os.path.isfile(results_file):
+        with open(results_file, "r", newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            for name in reader.fieldnames or []:
+                if name not in fieldnames:
+                    fieldnames.append(name)
+            for row in reader:
+                normalized_rows.append({name: row.get(name, "") for name in fieldnames})
+
+    replaced_keys = {
+        (row.get("Tournament"), str(row.get("Round", "")), str(row.get("Table", "")))
+        for row in new_rows
+    }
+    normalized_rows = [
+        row
+        for row in normalized_rows
+        if (row.get("Tournament"), str(row.get("Round", "")), str(row.get("Table", ""))) not in replaced_keys
+    ]
+    normalized_rows.extend(new_rows)
+
+    def _write_results(csvfile):
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(normalized_rows)
+
+    batch.write(results_file, _write_results, newline="")
+
+
+def _remove_results_rows(tournament_id):
+    """Entfernt alle Zeilen eines Turniers aus tournament_data/results.csv.
+
+    Sonst legt `flask import-legacy` ein gelöschtes Turnier aus der CSV wieder an.
+    """
+    results_file = os.path.join("tournament_data", "results.csv")
+    with results_lock():
+        if not os.path.isfile(results_file):
+            return
+        with open(results_file, "r", newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            fieldnames = reader.fieldnames or list(RESULTS_FIELDNAMES)
+            rows = list(reader)
+        kept_rows = [row for row in rows if row.get("Tournament") != tournament_id]
+        if len(kept_rows) == len(rows):
+            return
+
+        def _write_results(csvfile):
+            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(kept_rows)
+
+        atomic_write(results_file, _write_results, newline="")
+
+
+def _validate_result_scores(score1, score2, score_draws, player2):
+    """Prüft ein Match-Ergebnis; liefert die Fehlermeldung oder None."""
+    try:
+        score1_int = int(score1)
+        score2_int = int(score2)
+        draws_int = int(score_draws)
+    except (TypeError, ValueError):
+        return "Ergebnis enthält ungültige Werte."
+
+    if not (0 <= score1_int <= 2 and 0 <= score2_int <= 2 and 0 <= draws_int <= 2):
+        return "Ergebnis muss im Bereich 0 bis 2 liegen."
+    if score1_int == 2 and score2_int == 2:
+        return "Beide Spieler können nicht 2 Siege haben."
+    if (score1_int + score2_int + draws_int) > 3:
+        return "Ungültiges Ergebnis: Es werden maximal 3 Spiele pro Match gespielt."
+    if player2 == "BYE" and (score1_int != 2 or score2_int != 0 or draws_int != 0):
+        return "BYE-Matches haben immer das Ergebnis 2-0-0."
+    return None
+
+
+def _update_marked_players(match, dropout1, dropout2):
+    """Gleicht die Dropout-Markierungen in der Session mit einem gespeicherten Match ab."""
+    marked_players = session.get("leg_players_set", [])
+    
+    # Für Spieler 1
+    if dropout1 and match['player1'] not in marked_players:
+        marked_players.append(match['player1'])
+        print(f"Dropout-Status zu Spieler 1 hinzugefügt: {match['player1']}")
+    elif not dropout1 and match['player1'] in marked_players:
+        marked_players.remove(match['player1'])
+        print(f"Dropout-Status von Spieler 1 entfernt: {match['player1']}")
+    
+    # Für Spieler 2 (wenn nicht BYE)
+    if match['player2'] != "BYE":
+        if dropout2 and match['player2'] not in marked_players:
+            marked_players.append(match['player2'])
+            print(f"Dropout-Status zu Spieler 2 hinzugefügt: {match['player2']}")
+        elif not dropout2 and match['player2'] in marked_players:
+            marked_players.remove(match['player2'])
+            print(f"Dropout-Status von Spieler 2 entfernt: {match['player2']}")
+    
+    # Aktualisiere die Session
+    session["leg_players_set"] = marked_players
+
+
 @main.route("/save_results", methods=["POST"])
+@_with_tournament_lock
 def save_results():
     tournament_id = session.get("tournament_id")
     guard = _require_mutable_tournament(tournament_id, as_json=True)
@@ -1143,21 +1611,9 @@ def save_results():
     print(f"Dropout1: {dropout1}, Dropout2: {dropout2}")
 
     # Ergebniseingaben serverseitig strikt validieren (auch bei direkten API-Requests).
-    try:
-        score1_int = int(score1)
-        score2_int = int(score2)
-        draws_int = int(score_draws)
-    except (TypeError, ValueError):
-        return jsonify({"success": False, "message": "Ergebnis enthält ungültige Werte."}), 400
-
-    if not (0 <= score1_int <= 2 and 0 <= score2_int <= 2 and 0 <= draws_int <= 2):
-        return jsonify({"success": False, "message": "Ergebnis muss im Bereich 0 bis 2 liegen."}), 400
-    if score1_int == 2 and score2_int == 2:
-        return jsonify({"success": False, "message": "Beide Spieler können nicht 2 Siege haben."}), 400
-    if (score1_int + score2_int + draws_int) > 3:
-        return jsonify({"success": False, "message": "Ungültiges Ergebnis: Es werden maximal 3 Spiele pro Match gespielt."}), 400
-    if player2 == "BYE" and (score1_int != 2 or score2_int != 0 or draws_int != 0):
-        return jsonify({"success": False, "message": "BYE-Matches haben immer das Ergebnis 2-0-0."}), 400
+    score_error = _validate_result_scores(score1, score2, score_draws, player2)
+    if score_error:
+        return jsonify({"success": False, "message": score_error}), 400
     
     # Verarbeite Power Nine Daten nur für Vintage-Turniere
     if is_vintage and player1_power_nine and player1_name:
@@ -1200,34 +1656,32 @@ def save_results():
         matches = []
         fieldnames = []
         try:
-            with open(round_file, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                fieldnames = reader.fieldnames
-                print(f"Feldnamen in CSV: {fieldnames}")
-                if not fieldnames:
-                    print(f"FEHLER: Rundendatei ist leer oder ohne Header: {round_file}")
-                    return jsonify({
-                        "success": False,
-                        "message": "Rundendatei ist leer oder beschädigt. Bitte Seite neu laden und erneut versuchen.",
-                    }), 500
-                fieldnames = list(fieldnames)
-                
-                # Stelle sicher, dass alle benötigten Felder in fieldnames sind
-                required_fields = ['table', 'player1', 'player2', 'score1', 'score2', 'score_draws', 'table_size',
-                                  'dropout1', 'dropout2', 'group_key']
-                for field in required_fields:
-                    if field not in fieldnames:
-                        fieldnames.append(field)
-                        print(f"Feldname '{field}' zur CSV hinzugefügt")
+            fieldnames, rows = read_round_table(round_file)
+            print(f"Feldnamen in CSV: {fieldnames}")
+            if not fieldnames:
+                print(f"FEHLER: Rundendatei ist leer oder ohne Header: {round_file}")
+                return jsonify({
+                    "success": False,
+                    "message": "Rundendatei ist leer oder beschädigt. Bitte Seite neu laden und erneut versuchen.",
+                }), 500
+            fieldnames = list(fieldnames)
+            
+            # Stelle sicher, dass alle benötigten Felder in fieldnames sind
+            required_fields = ['table', 'player1', 'player2', 'score1', 'score2', 'score_draws', 'table_size',
+                              'dropout1', 'dropout2', 'group_key']
+            for field in required_fields:
+                if field not in fieldnames:
+                    fieldnames.append(field)
+                    print(f"Feldname '{field}' zur CSV hinzugefügt")
+            
+            # Lese alle Matches
+            for row in rows:
+                # Stelle sicher, dass jedes Match alle Felder hat
+                for field in fieldnames:
+                    if field not in row:
+                        row[field] = ""
+                matches.append(row)
                 
-                # Lese alle Matches
-                for row in reader:
-                    # Stelle sicher, dass jedes Match alle Felder hat
-                    for field in fieldnames:
-                        if field not in row:
-                            row[field] = ""
-                    matches.append(row)
-                    
             print(f"Matches aus Datei gelesen: {len(matches)}")
         except Exception as e:
             print(f"Fehler beim Lesen der Rundendatei: {e}")
@@ -1264,27 +1718,7 @@ def save_results():
                 match["table_size"] = str(table_size)
                 
                 # Füge Spieler zur markierten Liste hinzu oder entferne sie, basierend auf dropout-Status
-                marked_players = session.get("leg_players_set", [])
-                
-                # Für Spieler 1
-                if dropout1 and match['player1'] not in marked_players:
-                    marked_players.append(match['player1'])
-                    print(f"Dropout-Status zu Spieler 1 hinzugefügt: {match['player1']}")
-                elif not dropout1 and match['player1'] in marked_players:
-                    marked_players.remove(match['player1'])
-                    print(f"Dropout-Status von Spieler 1 entfernt: {match['player1']}")
-                
-                # Für Spieler 2 (wenn nicht BYE)
-                if match['player2'] != "BYE":
-                    if dropout2 and match['player2'] not in marked_players:
-                        marked_players.append(match['player2'])
-                        print(f"Dropout-Status zu Spieler 2 hinzugefügt: {match['player2']}")
-                    elif not dropout2 and match['player2'] in marked_players:
-                        marked_players.remove(match['player2'])
-                        print(f"Dropout-Status von Spieler 2 entfernt: {match['player2']}")
-                
-                # Aktualisiere die Session
-                session["leg_players_set"] = marked_players
+                _update_marked_players(match, dropout1, dropout2)
                 
                 match_found = True
                 print(f"Match aktualisiert: {match}")
@@ -1300,80 +1734,44 @@ def save_results():
             table_size_value = match.get("table_size", "nicht gesetzt")
             print(f"Match {i+1}: Tisch {match.get('table', '')}, {match.get('player1', '')} vs {match.get('player2', '')}, Score: {match.get('score1', '')}-{match.get('score2', '')}-{match.get('score_draws', '0')}, Tischgrösse: {table_size_value}")
         
-        # Datei zurückschreiben (atomar, damit parallele Leser nie eine halbe Datei sehen)
+        # Rundendatei und results.csv gemeinsam schreiben: entweder beide
+        # Änderungen werden sichtbar oder keine.
+        batch = AtomicBatch()
         try:
             def _write_updated_round(f):
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
                 writer.writerows(matches)
 
-            atomic_write(round_file, _write_updated_round, newline="")
-            print(f"Rundendatei erfolgreich aktualisiert")
+            batch.write(round_file, _write_updated_round, newline="")
         except Exception as e:
+            batch.abort()
             print(f"Fehler beim Schreiben der Rundendatei: {e}")
             return jsonify({"success": False, "message": f"Fehler beim Schreiben der Rundendatei: {str(e)}"}), 500
 
-        # Erst nach erfolgreicher Rundendatei-Aktualisierung in results.csv speichern
-        # Idempotent pro (Turnier, Runde, Tisch): ein erneutes Speichern überschreibt
-        # den bestehenden Eintrag statt Doppelzeilen zu erzeugen.
-        results_file = os.path.join("tournament_data", "results.csv")
-        os.makedirs("tournament_data", exist_ok=True)
         try:
-            normalized_rows = []
-            fieldnames = [
-                "Tournament",
-                "Timestamp",
-                "Round",
-                "Table",
-                "Player 1",
-                "Score 1",
-                "Player 2",
-                "Score 2",
-                "Draws",
-            ]
-            if os.path.isfile(results_file):
-                with open(results_file, "r", newline="", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    existing_fieldnames = reader.fieldnames or []
-                    if existing_fieldnames:
-                        for name in existing_fieldnames:
-                            if name not in fieldnames:
-                                fieldnames.append(name)
-                    for row in reader:
-                        normalized = {name: row.get(name, "") for name in fieldnames}
-                        normalized_rows.append(normalized)
-
-            normalized_rows = [
-                row
-                for row in normalized_rows
-                if not (
-                    row.get("Tournament") == tournament_id
-                    and str(row.get("Table", "")) == str(table)
-                    and str(row.get("Round", "")) == str(current_round)
+            # results.csv ist turnierübergreifend: eigener, kurzer Lock bis zum Commit.
+            with results_lock():
+                _stage_results_rows(
+                    batch,
+                    [
+                        {
+                            "Tournament": tournament_id,
+                            "Timestamp": datetime.now().isoformat(),
+                            "Round": str(current_round),
+                            "Table": str(table),
+                            "Player 1": player1,
+                            "Score 1": str(score1),
+                            "Player 2": player2,
+                            "Score 2": str(score2),
+                            "Draws": str(score_draws),
+                        }
+                    ],
                 )
-            ]
-            normalized_rows.append(
-                {
-                    "Tournament": tournament_id,
-                    "Timestamp": datetime.now().isoformat(),
-                    "Round": str(current_round),
-                    "Table": str(table),
-                    "Player 1": player1,
-                    "Score 1": str(score1),
-                    "Player 2": player2,
-                    "Score 2": str(score2),
-                    "Draws": str(score_draws),
-                }
-            )
-
-            def _write_results(csvfile):
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(normalized_rows)
-
-            atomic_write(results_file, _write_results, newline="")
-            print("Ergebnis in results.csv gespeichert")
+                batch.commit()
+            print("Rundendatei und results.csv gespeichert")
         except Exception as e:
+            batch.abort()
             print(f"Fehler beim Speichern in results.csv: {e}")
             return jsonify({"success": False, "message": f"Fehler beim Speichern der Ergebnisse: {str(e)}"}), 500
     except Exception as e:
@@ -1412,9 +1810,274 @@ def save_results():
             dropout2=dropout2,
         )
     except Exception:
-        pass
+        db.session.rollback()
+    _publish_tournament_event(
+        tournament_id,
+        EVENT_MATCH_RESULT,
+        {"round": str(current_round), **response_data["match"]},
+        player_names=(player1, player2),
+        players_list=True,
+    )
     return jsonify(response_data)
 
+
+_BULK_RESULT_FIELDS = frozenset({
+    "table", "player1", "player2", "score1", "score2", "score_draws", "dropout1", "dropout2",
+    "table_size", "player1_power_nine", "player2_power_nine",
+})
+
+
+def _parse_power_nine_payload(raw):
+    """Power-Nine-Angabe einer Ergebniszeile (Objekt oder JSON-Text) prüfen.
+
+    Liefert (daten, fehler); erlaubt sind nur Karten aus POWER_NINE.
+    """
+    from .player_stats import POWER_NINE
+
+    if isinstance(raw, str):
+        try:
+            raw = json.loads(raw)
+        except json.JSONDecodeError:
+            return None, "Ungültige Power-Nine-Daten."
+    if not isinstance(raw, dict):
+        return None, "Ungültige Power-Nine-Daten."
+    unknown_cards = sorted(str(card) for card in raw if card not in POWER_NINE)
+    if unknown_cards:
+        return None, f"Unbekannte Power-Nine-Karten: {', '.join(unknown_cards)}."
+    return {card: bool(has_card) for card, has_card in raw.items()}, None
+
+
+@main.route("/save_results/bulk", methods=["POST"])
+@_with_tournament_lock
+def save_results_bulk():
+    """Speichert die Ergebnisse vieler Tische einer Runde in einem Durchgang.
+
+    Erwartet JSON {"round": n, "results": [{table, player1, player2, score1,
+    score2, score_draws, dropout1, dropout2, table_size, player1_power_nine,
+    player2_power_nine}, ...]} (alternativ Formularfeld `results_json`).
+    Unbekannte Felder werden abgelehnt, Power Nine nur bei Vintage-Turnieren.
+    Alle Zeilen werden zuerst geprüft; bei Fehlern kommt pro Tisch eine Meldung
+    zurück und nichts wird gespeichert. Sonst gibt es genau ein Schreiben der
+    Rundendatei, eine Aktualisierung von results.csv und einen DB-Commit. Jeder
+    Tisch läuft in der DB in einem eigenen Savepoint; scheitert einer, bleiben
+    die übrigen erhalten und die Antwort meldet die betroffenen Tische (207).
+    """
+    tournament_id = session.get("tournament_id")
+    guard = _require_mutable_tournament(tournament_id, as_json=True)
+    if guard is not None:
+        return guard
+
+    raw_payload = request.form.get("results_json", "")
+    if raw_payload:
+        try:
+            payload = json.loads(raw_payload)
+        except json.JSONDecodeError:
+            return jsonify({"success": False, "message": "Ungültige Ergebnis-Daten."}), 400
+    else:
+        payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        return jsonify({"success": False, "message": "Ungültige Ergebnis-Daten."}), 400
+    is_vintage = is_vintage_tournament(tournament_id)
+
+    try:
+        round_number = int(payload.get("round"))
+    except (TypeError, ValueError):
+        return jsonify({"success": False, "message": "Runde fehlt oder ist ungültig."}), 400
+    submitted = payload.get("results")
+    if not isinstance(submitted, list) or not submitted:
+        return jsonify({"success": False, "message": "Keine Ergebnisse übergeben."}), 400
+
+    round_file = os.path.join("data", tournament_id, "rounds", f"round_{round_number}.csv")
+    if not os.path.exists(round_file):
+        return jsonify({"success": False, "message": "Runde wurde nicht gefunden."}), 404
+    fieldnames, matches = read_round_table(round_file)
+    if not fieldnames:
+        return jsonify({
+            "success": False,
+            "message": "Rundendatei ist leer oder beschädigt. Bitte Seite neu laden und erneut versuchen.",
+        }), 500
+    fieldnames = list(fieldnames)
+    for field in ['table', 'player1', 'player2', 'score1', 'score2', 'score_draws', 'table_size',
+                  'dropout1', 'dropout2', 'group_key']:
+        if field not in fieldnames:
+            fieldnames.append(field)
+    for match in matches:
+        for field in fieldnames:
+            match.setdefault(field, "")
+    matches_by_table = {str(match.get("table", "")).strip(): match for match in matches}
+
+    # Erst alles prüfen, dann alles anwenden.
+    errors = []
+    updates = []
+    seen_tables = set()
+    for index, entry in enumerate(submitted, start=1):
+        if not isinstance(entry, dict):
+            errors.append({"index": index, "table": None, "message": "Ungültige Ergebniszeile."})
+            continue
+        table = str(entry.get("table") or "").strip()
+        unknown_fields = sorted(set(entry) - _BULK_RESULT_FIELDS)
+        if unknown_fields:
+            errors.append({
+                "index": index,
+                "table": table,
+                "message": f"Tisch {table}: Unbekannte Felder: {', '.join(map(str, unknown_fields))}.",
+            })
+            continue
+        match = matches_by_table.get(table)
+        if match is None:
+            errors.append({"index": index, "table": table, "message": f"Kein Match für Tisch {table} gefunden."})
+            continue
+        if table in seen_tables:
+            errors.append({"index": index, "table": table, "message": f"Tisch {table} ist mehrfach enthalten."})
+            continue
+        seen_tables.add(table)
+        # Wie save_results: Spielernamen sind optional, müssen aber zum Tisch passen.
+        requested_player1 = str(entry.get("player1") or "").strip()
+        requested_player2 = str(entry.get("player2") or "").strip()
+        match_players = {match.get("player1", "").strip(), match.get("player2", "").strip()}
+        if requested_player1 and requested_player2 and {requested_player1, requested_player2} != match_players:
+            errors.append({"index": index, "table": table, "message": f"Tisch {table}: Spielerpaarung stimmt nicht überein."})
+            continue
+        score1 = str(entry.get("score1", "0")).strip()
+        score2 = str(entry.get("score2", "0")).strip()
+        score_draws = str(entry.get("score_draws", "0")).strip()
+        score_error = _validate_result_scores(score1, score2, score_draws, match.get("player2", "").strip())
+        if score_error:
+            errors.append({"index": index, "table": table, "message": f"Tisch {table}: {score_error}"})
+            continue
+        # Wie save_results: ohne Angabe gilt die bisherige Tischgröße (Standard 6).
+        table_size = str(entry.get("table_size") or match.get("table_size") or "6").strip()
+        if not table_size.isdigit() or int(table_size) not in [6, 8, 10, 12]:
+            errors.append({"index": index, "table": table, "message": f"Tisch {table}: Ungültige Tischgröße."})
+            continue
+        power_nine = {}
+        power_nine_error = None
+        for slot in ("player1", "player2"):
+            raw_power_nine = entry.get(f"{slot}_power_nine")
+            if raw_power_nine in (None, "", {}):
+                continue
+            if not is_vintage:
+                power_nine_error = "Power Nine gibt es nur bei Vintage-Turnieren."
+                break
+            power_nine_data, power_nine_error = _parse_power_nine_payload(raw_power_nine)
+            if power_nine_error:
+                break
+            player_name = match.get(slot, "").strip()
+            # Wie save_results: für ein BYE wird nichts gespeichert.
+            if player_name and player_name != "BYE":
+                power_nine[player_name] = power_nine_data
+        if power_nine_error:
+            errors.append({"index": index, "table": table, "message": f"Tisch {table}: {power_nine_error}"})
+            continue
+        updates.append((match, {
+            "score1": str(int(score1)),
+            "score2": str(int(score2)),
+            "score_draws": str(int(score_draws)),
+            "dropout1": str(entry.get("dropout1", "")).strip().lower() == "true",
+            "dropout2": str(entry.get("dropout2", "")).strip().lower() == "true",
+            "table_size": str(int(table_size)),
+            "power_nine": power_nine,
+        }))
+
+    if errors:
+        return jsonify({
+            "success": False,
+            "message": f"{len(errors)} Ergebnis(se) ungültig, nichts gespeichert.",
+            "errors": errors,
+        }), 400
+
+    timestamp = datetime.now().isoformat()
+    results_rows = []
+    for match, result in updates:
+        match["score1"] = result["score1"]
+        match["score2"] = result["score2"]
+        match["score_draws"] = result["score_draws"]
+        match["dropout1"] = "true" if result["dropout1"] else "false"
+        match["dropout2"] = "true" if result["dropout2"] else "false"
+        match["table_size"] = result["table_size"]
+        _update_marked_players(match, result["dropout1"], result["dropout2"])
+        results_rows.append({
+            "Tournament": tournament_id,
+            "Timestamp": timestamp,
+            "Round": str(round_number),
+            "Table": str(match["table"]),
+            "Player 1": match["player1"],
+            "Score 1": result["score1"],
+            "Player 2": match["player2"],
+            "Score 2": result["score2"],
+            "Draws": result["score_draws"],
+        })
+
+    def _write_updated_round(f):
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(matches)
+
+    batch = AtomicBatch()
+    try:
+        batch.write(round_file, _write_updated_round, newline="")
+        with results_lock():
+            _stage_results_rows(batch, results_rows)
+            batch.commit()
+    except Exception as e:
+        batch.abort()
+        print(f"Fehler beim Speichern der Ergebnisse: {e}")
+        return jsonify({"success": False, "message": f"Fehler beim Speichern der Ergebnisse: {str(e)}"}), 500
+
+    # Dateien sind geschrieben; die DB folgt Tisch für Tisch in eigenen
+    # Savepoints, damit ein Fehler nicht die übrigen Tische mit zurückrollt.
+    failed = []
+    for match, result in updates:
+        table = str(match["table"])
+        try:
+            with db.session.begin_nested():
+                _update_match_result_in_db(
+                    tournament_id=tournament_id,
+                    round_number=round_number,
+                    table_number=int(table),
+                    score1=int(result["score1"]),
+                    score2=int(result["score2"]),
+                    score_draws=int(result["score_draws"]),
+                    dropout1=result["dropout1"],
+                    dropout2=result["dropout2"],
+                    commit=False,
+                )
+                for player_name, power_nine_data in result["power_nine"].items():
+                    _upsert_tournament_power_nine(tournament_id, player_name, power_nine_data)
+        except Exception:
+            current_app.logger.exception(
+                "Ergebnis von Tisch %s (Turnier %s, Runde %s) nicht in die DB übernommen",
+                table, tournament_id, round_number,
+            )
+            failed.append({"table": table, "message": f"Tisch {table}: Ergebnis nicht in die Datenbank übernommen."})
+
+    saved = []
+    player_names = set()
+    # Ein Ereignis pro Tisch (Live-Updates, Round-State-Deltas), ein gemeinsamer Commit.
+    for match, _result in updates:
+        saved_match = {
+            key: match[key]
+            for key in ("table", "player1", "player2", "score1", "score2", "score_draws", "dropout1", "dropout2")
+        }
+        saved.append(saved_match)
+        player_names.update((match["player1"], match["player2"]))
+        publish_event(tournament_id, EVENT_MATCH_RESULT, {"round": str(round_number), **saved_match}, commit=False)
+    _bump_data_versions(tournament_id, player_names=sorted(player_names), players_list=True)
+    if failed:
+        # Rundendatei und results.csv sind gespeichert, die DB nur teilweise.
+        return jsonify({
+            "success": False,
+            "partial": True,
+            "message": f"{len(saved)} Ergebnis(se) gespeichert, {len(failed)} Fehler beim Übernehmen in die Datenbank.",
+            "matches": saved,
+            "errors": failed,
+        }), 207
+    return jsonify({
+        "success": True,
+        "message": f"{len(saved)} Ergebnis(se) gespeichert.",
+        "matches": saved,
+    })
+
 def get_player_opponents(tournament_id, current_round):
     """Lädt die Gegner-Historie für alle Spieler aus den vorherigen Runden."""
     data_dir = os.path.join("data", tournament_id)
@@ -1424,17 +2087,15 @@ def get_player_opponents(tournament_id, current_round):
     for round_num in range(1, current_round + 1):
         round_file = os.path.join(data_dir, "rounds", f"round_{round_num}.csv")
         if os.path.exists(round_file):
-            with open(round_file, "r", encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for match in reader:
-                    player1 = match["player1"]
-                    player2 = match["player2"]
-                    # Debug: Markierte Spieler überprüfen
-                    if player1 in session.get("leg_players_set", []) or player2 in session.get("leg_players_set", []):
-                        print(f"Gegner-Historie Runde {round_num}: {player1} vs {player2}")
-                    # Speichere auch die Runde, in der sie gegeneinander gespielt haben
-                    opponents[player1].append((player2, round_num))
-                    opponents[player2].append((player1, round_num))
+            for match in read_round_rows(round_file):
+                player1 = match["player1"]
+                player2 = match["player2"]
+                # Debug: Markierte Spieler überprüfen
+                if player1 in session.get("leg_players_set", []) or player2 in session.get("leg_players_set", []):
+                    print(f"Gegner-Historie Runde {round_num}: {player1} vs {player2}")
+                # Speichere auch die Runde, in der sie gegeneinander gespielt haben
+                opponents[player1].append((player2, round_num))
+                opponents[player2].append((player1, round_num))
     
     return opponents
 
@@ -1448,13 +2109,11 @@ def get_player_bye_counts(tournament_id, up_to_round):
         if not os.path.exists(round_file):
             continue
         try:
-            with open(round_file, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for match in reader:
-                    if (match.get("player2") or "").strip() == "BYE":
-                        player1 = (match.get("player1") or "").strip()
-                        if player1:
-                            bye_counts[player1] += 1
+            for match in read_round_rows(round_file):
+                if (match.get("player2") or "").strip() == "BYE":
+                    player1 = (match.get("player1") or "").strip()
+                    if player1:
+                        bye_counts[player1] += 1
         except (IOError, OSError):
             continue
 
@@ -1474,50 +2133,48 @@ def validate_round_completion(round_file):
         return False, "Die aktuelle Rundendatei wurde nicht gefunden."
 
     try:
-        with open(round_file, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for idx, match in enumerate(reader, start=1):
-                table = match.get("table", str(idx))
-                player1 = (match.get("player1") or "").strip()
-                player2 = (match.get("player2") or "").strip()
-                raw_score1 = (match.get("score1") or "").strip()
-                raw_score2 = (match.get("score2") or "").strip()
-                raw_draws = (match.get("score_draws") or "").strip()
+        for idx, match in enumerate(read_round_rows(round_file), start=1):
+            table = match.get("table", str(idx))
+            player1 = (match.get("player1") or "").strip()
+            player2 = (match.get("player2") or "").strip()
+            raw_score1 = (match.get("score1") or "").strip()
+            raw_score2 = (match.get("score2") or "").strip()
+            raw_draws = (match.get("score_draws") or "").strip()
 
-                if not player1 or not player2:
-                    return False, f"Tisch {table}: Spielerzuordnung ist unvollständig."
+            if not player1 or not player2:
+                return False, f"Tisch {table}: Spielerzuordnung ist unvollständig."
 
-                # Für normale Matches müssen beide Scores eingetragen sein.
-                if player2 != "BYE" and (raw_score1 == "" or raw_score2 == ""):
-                    return False, f"Tisch {table}: Ergebnis ist noch nicht vollständig eingetragen."
+            # Für normale Matches müssen beide Scores eingetragen sein.
+            if player2 != "BYE" and (raw_score1 == "" or raw_score2 == ""):
+                return False, f"Tisch {table}: Ergebnis ist noch nicht vollständig eingetragen."
 
-                # Leere Draws als 0 behandeln
-                if raw_draws == "":
-                    raw_draws = "0"
+            # Leere Draws als 0 behandeln
+            if raw_draws == "":
+                raw_draws = "0"
 
-                try:
-                    score1 = int(raw_score1) if raw_score1 != "" else None
-                    score2 = int(raw_score2) if raw_score2 != "" else None
-                    draws = int(raw_draws)
-                except ValueError:
-                    return False, f"Tisch {table}: Ergebnis enthält ungültige Werte."
-
-                if player2 == "BYE":
-                    if score1 != 2 or score2 != 0 or draws != 0:
-                        return False, f"Tisch {table}: BYE-Match muss 2-0-0 sein."
-                    continue
+            try:
+                score1 = int(raw_score1) if raw_score1 != "" else None
+                score2 = int(raw_score2) if raw_score2 != "" else None
+                draws = int(raw_draws)
+            except ValueError:
+                return False, f"Tisch {table}: Ergebnis enthält ungültige Werte."
+
+            if player2 == "BYE":
+                if score1 != 2 or score2 != 0 or draws != 0:
+                    return False, f"Tisch {table}: BYE-Match muss 2-0-0 sein."
+                continue
 
-                # Normale Matches: Wertebereich prüfen
-                if score1 is None or score2 is None:
-                    return False, f"Tisch {table}: Ergebnis ist noch nicht vollständig eingetragen."
-                if not (0 <= score1 <= 2 and 0 <= score2 <= 2 and 0 <= draws <= 2):
-                    return False, f"Tisch {table}: Ergebnis muss im Bereich 0 bis 2 liegen."
-                if score1 == 2 and score2 == 2:
-                    return False, f"Tisch {table}: Beide Spieler können nicht 2 Siege haben."
-                if (score1 + score2 + draws) > 3:
-                    return False, f"Tisch {table}: Es werden maximal 3 Spiele pro Match gespielt."
-                if score1 == 0 and score2 == 0 and draws == 0:
-                    return False, f"Tisch {table}: Match ist noch nicht gespielt (0-0-0)."
+            # Normale Matches: Wertebereich prüfen
+            if score1 is None or score2 is None:
+                return False, f"Tisch {table}: Ergebnis ist noch nicht vollständig eingetragen."
+            if not (0 <= score1 <= 2 and 0 <= score2 <= 2 and 0 <= draws <= 2):
+                return False, f"Tisch {table}: Ergebnis muss im Bereich 0 bis 2 liegen."
+            if score1 == 2 and score2 == 2:
+                return False, f"Tisch {table}: Beide Spieler können nicht 2 Siege haben."
+            if (score1 + score2 + draws) > 3:
+                return False, f"Tisch {table}: Es werden maximal 3 Spiele pro Match gespielt."
+            if score1 == 0 and score2 == 0 and draws == 0:
+                return False, f"Tisch {table}: Match ist noch nicht gespielt (0-0-0)."
     except (IOError, OSError) as e:
         return False, f"Fehler beim Prüfen der Rundendatei: {e}"
 
@@ -1535,118 +2192,40 @@ def is_round_unplayed(round_file):
         return False
 
     try:
-        with open(round_file, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for match in reader:
-                player2 = (match.get("player2") or "").strip()
-                if player2 == "BYE":
-                    continue
+        for match in read_round_rows(round_file):
+            player2 = (match.get("player2") or "").strip()
+            if player2 == "BYE":
+                continue
 
-                raw_score1 = (match.get("score1") or "").strip()
-                raw_score2 = (match.get("score2") or "").strip()
-                raw_draws = (match.get("score_draws") or "").strip()
+            raw_score1 = (match.get("score1") or "").strip()
+            raw_score2 = (match.get("score2") or "").strip()
+            raw_draws = (match.get("score_draws") or "").strip()
 
-                # Sobald für ein normales Match irgendetwas gespeichert wurde,
-                # behandeln wir die Runde als begonnen.
-                if raw_score1 != "" or raw_score2 != "" or raw_draws != "":
-                    return False
+            # Sobald für ein normales Match irgendetwas gespeichert wurde,
+            # behandeln wir die Runde als begonnen.
+            if raw_score1 != "" or raw_score2 != "" or raw_draws != "":
+                return False
 
-            return True
+        return True
     except (IOError, OSError):
         return False
 
-@main.route("/next_round", methods=["POST"])
-def next_round():
-    tournament_id = session.get("tournament_id")
-    if not tournament_id:
-        return _tournament_error_response("NO_ACTIVE_TOURNAMENT", "Kein aktives Turnier gefunden.", as_json=False)
+def _build_round_matches(player_groups, leaderboard, opponents, bye_counts):
+    """Paart alle Spielergruppen und nummeriert die Tische in Gruppenreihenfolge durch.
 
-    if check_tournament_status(tournament_id):
-        data_dir = os.path.join("data", tournament_id)
-        rounds_dir = os.path.join(data_dir, "rounds")
-        round_numbers = []
-        if os.path.exists(rounds_dir):
-            for filename in os.listdir(rounds_dir):
-                if filename.startswith("round_") and filename.endswith(".csv"):
-                    try:
-                        round_numbers.append(int(filename.replace("round_", "").replace(".csv", "")))
-                    except ValueError:
-                        continue
-        latest_round = max(round_numbers) if round_numbers else None
-        return _tournament_error_response(
-            "TOURNAMENT_ENDED",
-            "Nächste Runde nicht möglich: Das Turnier ist bereits beendet.",
-            as_json=False,
-            redirect_round=latest_round,
-        )
-
-    data_dir = os.path.join("data", tournament_id)
-    rounds_dir = os.path.join(data_dir, "rounds")
-    os.makedirs(rounds_dir, exist_ok=True)
-
-    # Lade die Spielergruppen
-    player_groups_file = os.path.join(data_dir, 'player_groups.json')
-    if not os.path.exists(player_groups_file):
-        return redirect(url_for('main.index', error="Spielergruppen nicht gefunden"))
-    
-    try:
-        with open(player_groups_file, 'r', encoding='utf-8') as f:
-            player_groups = json.load(f)
-    except (OSError, json.JSONDecodeError) as e:
-        print(f"Fehler beim Lesen der Spielergruppen: {e}")
-        flash("Spielergruppen konnten nicht gelesen werden. Bitte erneut versuchen.")
-        return redirect(url_for("main.index"))
-    
-    # Stelle sicher, dass die markierten Spieler in der Session bleiben
-    session["leg_players_set"] = get_marked_players_for_tournament(tournament_id)
-    
-    # Debug-Ausgabe der markierten Spieler
-    marked_players = session.get("leg_players_set", [])
-    print(f"Markierte Spieler (Dropout): {marked_players}")
-    
-    # Bestimme die aktuelle Runde
-    round_numbers = []
-    for filename in os.listdir(rounds_dir):
-        if filename.startswith('round_') and filename.endswith('.csv'):
-            try:
-                round_numbers.append(int(filename.replace("round_", "").replace(".csv", "")))
-            except ValueError:
-                continue
-    current_round = max(round_numbers) if round_numbers else 0
-    if current_round == 0:
-        flash("Es existiert noch keine Runde, von der aus fortgesetzt werden kann.")
-        return redirect(url_for("main.index"))
-
-    # Runde muss vollständig abgeschlossen sein, bevor neue Paarungen erzeugt werden.
-    current_round_file = os.path.join(rounds_dir, f"round_{current_round}.csv")
-    is_complete, message = validate_round_completion(current_round_file)
-    if not is_complete:
-        flash(f"Nächste Runde nicht möglich: {message}")
-        return redirect(url_for("main.show_round", round_number=current_round))
-
-    # Berechne den Leaderboard für die aktuelle Runde
-    leaderboard = calculate_leaderboard(tournament_id, current_round)
-    
-    # Lade die Gegner-Historie
-    opponents = get_player_opponents(tournament_id, current_round)
-    # Lade BYE-Historie für faire BYE-Vergabe
-    bye_counts = get_player_bye_counts(tournament_id, current_round)
-    
-    # Erstelle neue Paarungen für die nächste Runde
-    match_list = []
-    table_nr = 1
+    Die Gruppen sind unabhängig voneinander und werden über den
+    Pairing-Executor (bei Bedarf parallel) gepaart. Liefert (match_list,
+    diagnostics) mit BYE und unvermeidbaren Wiederholungen pro Gruppe.
+    """
+    # Punkte und Rang einmal für alle Gruppen bestimmen.
+    points_by_player = {player: int(points) for player, points, *_ in leaderboard}
+    leaderboard_rank = {player: index for index, (player, *_rest) in enumerate(leaderboard)}
 
-    # Erstelle Paarungen für jede Gruppe separat
+    pods = []
     for group_key, group_players in player_groups.items():
-        # Extrahiere die Tischgröße aus dem zusammengesetzten Schlüssel
-        table_size = group_key.split('-')[0]
-        
         # Entferne markierte Spieler aus der aktiven Liste
         active_players = [p for p in group_players if not is_player_marked(p)]
         print(f"Aktive Spieler in Gruppe {group_key}: {active_players}")
-        
-        points_by_player = {player: int(points) for player, points, *_ in leaderboard}
-        leaderboard_rank = {player: index for index, (player, *_rest) in enumerate(leaderboard)}
         sorted_players = sorted(
             active_players,
             key=lambda player: (
@@ -1654,13 +2233,26 @@ def next_round():
                 player,
             ),
         )
+        pods.append((group_key, sorted_players))
 
-        pairing_result = generate_swiss_pairings(
-            sorted_players,
-            points_by_player,
-            opponents,
-            bye_counts,
-        )
+    pairing_results = pair_pods(
+        [sorted_players for _group_key, sorted_players in pods],
+        points_by_player,
+        opponents,
+        bye_counts,
+    )
+
+    match_list = []
+    diagnostics = []
+    table_nr = 1
+    for (group_key, _sorted_players), pairing_result in zip(pods, pairing_results):
+        # Extrahiere die Tischgröße aus dem zusammengesetzten Schlüssel
+        table_size = group_key.split('-')[0]
+        diagnostics.append({
+            "group_key": group_key,
+            "bye_player": pairing_result["bye_player"],
+            "repeat_pairs": [list(pair) for pair in pairing_result["repeat_pairs"]],
+        })
 
         bye_player = pairing_result["bye_player"]
         if bye_player:
@@ -1698,6 +2290,174 @@ def next_round():
             })
             table_nr += 1
             print(f"Match: {p1} vs {p2}")
+    return match_list, diagnostics
+
+
+def _next_round_inputs(tournament_id):
+    """Gemeinsame Vorbereitung für next_round und die Vorschau.
+
+    Liefert (player_groups, current_round, None) oder (None, Runde für den
+    Rücksprung, Fehlermeldung). Setzt die Dropout-Markierungen in der Session.
+    """
+    data_dir = os.path.join("data", tournament_id)
+    rounds_dir = os.path.join(data_dir, "rounds")
+
+    # Lade die Spielergruppen
+    player_groups_file = os.path.join(data_dir, 'player_groups.json')
+    if not os.path.exists(player_groups_file):
+        return None, None, "Spielergruppen nicht gefunden"
+    try:
+        with open(player_groups_file, 'r', encoding='utf-8') as f:
+            player_groups = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Fehler beim Lesen der Spielergruppen: {e}")
+        return None, None, "Spielergruppen konnten nicht gelesen werden. Bitte erneut versuchen."
+    
+    # Stelle sicher, dass die markierten Spieler in der Session bleiben
+    session["leg_players_set"] = get_marked_players_for_tournament(tournament_id)
+    
+    # Debug-Ausgabe der markierten Spieler
+    marked_players = session.get("leg_players_set", [])
+    print(f"Markierte Spieler (Dropout): {marked_players}")
+    
+    # Bestimme die aktuelle Runde
+    round_numbers = list_round_numbers(rounds_dir)
+    current_round = max(round_numbers) if round_numbers else 0
+    if current_round == 0:
+        return None, None, "Es existiert noch keine Runde, von der aus fortgesetzt werden kann."
+
+    # Runde muss vollständig abgeschlossen sein, bevor neue Paarungen erzeugt werden.
+    current_round_file = os.path.join(rounds_dir, f"round_{current_round}.csv")
+    is_complete, message = validate_round_completion(current_round_file)
+    if not is_complete:
+        return None, current_round, f"Nächste Runde nicht möglich: {message}"
+    return player_groups, current_round, None
+
+
+def _next_round_fingerprint(tournament_id, current_round, player_groups):
+    """Fingerprint des Turnierstands; erwartet die Dropout-Markierungen in der Session."""
+    return state_fingerprint(
+        os.path.join("data", tournament_id, "rounds"),
+        current_round,
+        player_groups,
+        session.get("leg_players_set", []),
+        _get_tournament_pairing_mode(tournament_id),
+    )
+
+
+def _plan_next_round(tournament_id, current_round, player_groups, fingerprint):
+    """Paarungen für current_round + 1, zwischengespeichert unter dem Fingerprint des Turnierstands.
+
+    Liefert {"matches", "diagnostics", "cached", "pairing_ms"}.
+    """
+    data_dir = os.path.join("data", tournament_id)
+    cached = load_cached_round(data_dir, fingerprint)
+    if cached is not None:
+        print(f"Paarungen für Runde {current_round + 1} aus dem Cache übernommen")
+        return {**cached, "cached": True, "pairing_ms": 0.0}
+
+    started = time.perf_counter()
+    # Berechne den Leaderboard für die aktuelle Runde
+    leaderboard = calculate_leaderboard(tournament_id, current_round)
+    
+    # Lade die Gegner-Historie
+    opponents = get_player_opponents(tournament_id, current_round)
+    # Lade BYE-Historie für faire BYE-Vergabe
+    bye_counts = get_player_bye_counts(tournament_id, current_round)
+
+    match_list, diagnostics = _build_round_matches(player_groups, leaderboard, opponents, bye_counts)
+    store_cached_round(data_dir, fingerprint, match_list, diagnostics)
+    return {
+        "matches": match_list,
+        "diagnostics": diagnostics,
+        "cached": False,
+        "pairing_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
+@main.route("/next_round/preview", methods=["GET"])
+@_with_tournament_lock
+def next_round_preview():
+    """Vorschau der nächsten Runde als JSON, ohne Rundendatei oder DB zu schreiben.
+
+    Das Ergebnis liegt danach unter seinem Fingerprint im Pairing-Cache; ein
+    POST auf /next_round mit diesem `fingerprint` übernimmt genau diese
+    Paarungen, solange sich der Turnierstand nicht geändert hat.
+    """
+    started = time.perf_counter()
+    tournament_id = session.get("tournament_id")
+    guard = _require_mutable_tournament(tournament_id, as_json=True)
+    if guard is not None:
+        return guard
+
+    player_groups, current_round, error = _next_round_inputs(tournament_id)
+    if error is not None:
+        return jsonify({"success": False, "message": error, "round": current_round}), 409
+
+    fingerprint = _next_round_fingerprint(tournament_id, current_round, player_groups)
+    plan = _plan_next_round(tournament_id, current_round, player_groups, fingerprint)
+    diagnostics = plan["diagnostics"]
+    return _no_store(jsonify({
+        "success": True,
+        "round": current_round + 1,
+        "fingerprint": fingerprint,
+        "cached": plan["cached"],
+        "matches": plan["matches"],
+        "byes": [group["bye_player"] for group in diagnostics if group["bye_player"]],
+        "repeat_pairs": [pair for group in diagnostics for pair in group["repeat_pairs"]],
+        "groups": diagnostics,
+        "timing_ms": {
+            "pairing": plan["pairing_ms"],
+            "total": round((time.perf_counter() - started) * 1000, 1),
+        },
+    }))
+
+
+@main.route("/next_round", methods=["POST"])
+@_with_tournament_lock
+def next_round():
+    tournament_id = session.get("tournament_id")
+    if not tournament_id:
+        return _tournament_error_response("NO_ACTIVE_TOURNAMENT", "Kein aktives Turnier gefunden.", as_json=False)
+
+    if check_tournament_status(tournament_id):
+        data_dir = os.path.join("data", tournament_id)
+        rounds_dir = os.path.join(data_dir, "rounds")
+        round_numbers = list_round_numbers(rounds_dir)
+        latest_round = max(round_numbers) if round_numbers else None
+        return _tournament_error_response(
+            "TOURNAMENT_ENDED",
+            "Nächste Runde nicht möglich: Das Turnier ist bereits beendet.",
+            as_json=False,
+            redirect_round=latest_round,
+        )
+
+    data_dir = os.path.join("data", tournament_id)
+    rounds_dir = os.path.join(data_dir, "rounds")
+    os.makedirs(rounds_dir, exist_ok=True)
+
+    # Wiederholter POST (Doppelklick, Retry): zur bereits erzeugten Runde leiten.
+    idempotency_key = normalize_idempotency_key(request.form.get("idempotency_key"))
+    created_round = round_for_idempotency_key(data_dir, idempotency_key)
+    if created_round is not None and os.path.exists(os.path.join(rounds_dir, f"round_{created_round}.csv")):
+        return redirect(url_for('main.show_round', round_number=created_round))
+
+    player_groups, current_round, error = _next_round_inputs(tournament_id)
+    if error is not None:
+        flash(error)
+        if current_round:
+            return redirect(url_for("main.show_round", round_number=current_round))
+        return redirect(url_for("main.index"))
+
+    fingerprint = _next_round_fingerprint(tournament_id, current_round, player_groups)
+    # Bestätigung einer Vorschau: nur übernehmen, wenn der Stand noch derselbe ist.
+    expected_fingerprint = (request.form.get("fingerprint") or "").strip()
+    if expected_fingerprint and expected_fingerprint != fingerprint:
+        flash("Der Turnierstand hat sich seit der Vorschau geändert. Bitte Vorschau neu laden.")
+        return redirect(url_for("main.show_round", round_number=current_round))
+
+    # Erstelle neue Paarungen für die nächste Runde (bei unverändertem Stand aus dem Cache)
+    match_list = _plan_next_round(tournament_id, current_round, player_groups, fingerprint)["matches"]
 
     # Speichere die neue Runde
     next_round_number = current_round + 1
@@ -1712,36 +2472,169 @@ def next_round():
         writer.writeheader()
         writer.writerows(match_list)
 
-    atomic_write(next_round_file, _write_next_round, newline="")
-    _sync_round_to_db(tournament_id, next_round_number, match_list)
+    # Neue Rundendatei und BYE-Ergebnisse in results.csv als ein Batch schreiben.
+    bye_timestamp = datetime.now().isoformat()
+    with results_lock(), AtomicBatch() as batch:
+        batch.write(next_round_file, _write_next_round, newline="")
+        bye_rows = [
+            {
+                "Tournament": tournament_id,
+                "Timestamp": bye_timestamp,
+                "Round": str(next_round_number),
+                "Table": str(match["table"]),
+                "Player 1": match["player1"],
+                "Score 1": "2",  # Automatischer Sieg
+                "Player 2": match["player2"],
+                "Score 2": "0",
+                "Draws": "0",  # Keine Unentschieden bei BYE
+            }
+            for match in match_list
+            if match["player2"] == "BYE"
+        ]
+        if bye_rows:
+            _stage_results_rows(batch, bye_rows)
 
-    # Speichere die BYE Matches in der results.csv
-    results_file = os.path.join("tournament_data", "results.csv")
-    file_exists = os.path.isfile(results_file)
-    
-    with open(results_file, "a", newline="", encoding="utf-8") as csvfile:
-        writer = csv.writer(csvfile)
-        if not file_exists:
-            writer.writerow(["Tournament", "Timestamp", "Table", "Player 1", "Score 1", "Player 2", "Score 2", "Draws"])
-        
-        # Speichere BYE Matches automatisch
-        for match in match_list:
-            if match["player2"] == "BYE":
-                writer.writerow([
-                    tournament_id,
-                    datetime.now().isoformat(),
-                    match["table"],
-                    match["player1"],
-                    "2",  # Automatischer Sieg
-                    match["player2"],
-                    "0",
-                    "0"   # Keine Unentschieden bei BYE
-                ])
+    remember_idempotency_key(data_dir, idempotency_key, next_round_number)
+    _sync_round_to_db(tournament_id, next_round_number, match_list)
+    _publish_tournament_event(
+        tournament_id,
+        EVENT_ROUND_CREATED,
+        {"round": next_round_number, "url": url_for("main.show_round", round_number=next_round_number)},
+    )
 
     # Leite zur show_round Route weiter
     return redirect(url_for('main.show_round', round_number=next_round_number))
 
 
+def _format_sse(event_id, event_type, data):
+    payload = json.dumps(data, ensure_ascii=False)
+    return f"id: {event_id}\nevent: {event_type}\ndata: {payload}\n\n"
+
+
+@main.route("/tournament/<tournament_id>/events", methods=["GET"])
+def tournament_events(tournament_id):
+    """Server-Sent-Events-Stream mit Ergebnis- und Rundenereignissen eines Turniers.
+
+    Der Stream fragt pro Intervall nur den Versionsstempel des Turniers ab und
+    liest das Ereignis-Log erst nach einem Sprung. Nach SSE_MAX_STREAM_SECONDS
+    endet er; der Browser verbindet sich mit Last-Event-ID neu.
+    """
+    if not is_valid_tournament_id(tournament_id):
+        return jsonify({"success": False, "message": "Ungültige Turnier-ID"}), 400
+
+    # Jeder Stream blockiert einen Worker-Thread. Ist das Kontingent dieses
+    # Prozesses erschöpft, beendet 204 die EventSource; die Rundenseite fragt
+    # dann die Round-State-API im Intervall ab.
+    release_slot = _acquire_sse_slot(int(current_app.config.get("SSE_MAX_STREAMS_PER_WORKER", 2)))
+    if release_slot is None:
+        return Response(status=204, headers={"Cache-Control": "no-store"})
+
+    raw_cursor = request.headers.get("Last-Event-ID") or request.args.get("since")
+    try:
+        cursor = int(raw_cursor) if raw_cursor else latest_event_id(tournament_id)
+    except (TypeError, ValueError):
+        cursor = latest_event_id(tournament_id)
+
+    config = current_app.config
+    poll_interval = max(0.05, float(config.get("SSE_POLL_INTERVAL_SECONDS", 1.0)))
+    max_duration = max(0.0, float(config.get("SSE_MAX_STREAM_SECONDS", 30)))
+    keepalive = max(1.0, float(config.get("SSE_KEEPALIVE_SECONDS", 15)))
+    retry_ms = int(config.get("SSE_RETRY_MS", 2000))
+    version_key = tournament_scope(tournament_id)
+
+    def _stream():
+        nonlocal cursor
+        try:
+            yield f"retry: {retry_ms}\n\n"
+            deadline = time.monotonic() + max_duration
+            last_sent = time.monotonic()
+            seen_version = None
+            while True:
+                version = get_versions([version_key])[version_key][0]
+                if version != seen_version:
+                    events = list_events_since(tournament_id, cursor, limit=SSE_EVENT_BATCH_LIMIT)
+                    for event in events:
+                        cursor = event["id"]
+                        yield _format_sse(event["id"], event["type"], event["data"])
+                        last_sent = time.monotonic()
+                    if len(events) < SSE_EVENT_BATCH_LIMIT:
+                        seen_version = version
+                # DB-Verbindung zwischen den Polls nicht blockieren.
+                db.session.remove()
+                now = time.monotonic()
+                if now >= deadline:
+                    break
+                if now - last_sent >= keepalive:
+                    yield ": keepalive\n\n"
+                    last_sent = now
+                time.sleep(min(poll_interval, deadline - now))
+        finally:
+            release_slot()
+
+    response = Response(
+        stream_with_context(_stream()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+    # Freigabe am Stream-Ende und, falls der Stream nie gelesen wird, beim Schliessen der Antwort.
+    response.call_on_close(release_slot)
+    return response
+
+
+def _acquire_sse_slot(limit):
+    """Belegt einen SSE-Platz; liefert eine idempotente Freigabe oder None bei vollem Kontingent."""
+    global _sse_open_streams
+    with _SSE_STREAMS_GUARD:
+        if _sse_open_streams >= limit:
+            return None
+        _sse_open_streams += 1
+    released = False
+
+    def _release():
+        global _sse_open_streams
+        nonlocal released
+        with _SSE_STREAMS_GUARD:
+            if not released:
+                released = True
+                _sse_open_streams -= 1
+
+    return _release
+
+
+@main.route("/export/matches", methods=["GET"])
+def export_matches():
+    """Match-Historie als CSV/JSON, gestreamt und optional gefiltert.
+
+    Query-Parameter: format (csv|json), tournament, group, cube, from, to
+    (Datumsangaben als JJJJ-MM-TT, bezogen auf die Rundenerstellung).
+    """
+    export_format = (request.args.get("format") or "csv").strip().lower()
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({"success": False, "message": "Unbekanntes Exportformat. Erlaubt: csv, json."}), 400
+    try:
+        filters = parse_export_filters(
+            tournament_id=request.args.get("tournament"),
+            group_id=request.args.get("group"),
+            cube_id=request.args.get("cube"),
+            date_from=request.args.get("from"),
+            date_to=request.args.get("to"),
+        )
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+
+    filename = f"matches_{datetime.now().strftime('%Y%m%d_%H%M')}.{export_format}"
+    mimetype = "application/json" if export_format == "json" else "text/csv"
+    return Response(
+        stream_with_context(stream_export(export_format, filters)),
+        mimetype=mimetype,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Cache-Control": "no-store",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @main.route("/tournament/pairing_mode", methods=["POST"])
 def update_pairing_mode():
     tournament_id = session.get("tournament_id")
@@ -1749,11 +2642,13 @@ def update_pairing_mode():
         return jsonify({"success": False, "message": "Kein aktives Turnier gefunden."}), 400
     pairing_mode = _normalize_pairing_mode(request.form.get("pairing_mode"))
     _set_tournament_pairing_mode(tournament_id, pairing_mode)
+    _bump_data_versions(tournament_id, players_list=False)
     session["pairing_mode"] = pairing_mode
     return jsonify({"success": True, "pairing_mode": pairing_mode})
 
 
 @main.route("/round/<int:round_number>/save_pairings", methods=["POST"])
+@_with_tournament_lock
 def save_round_pairings(round_number):
     tournament_id = session.get("tournament_id")
     guard = _require_mutable_tournament(tournament_id, as_json=True)
@@ -1781,21 +2676,19 @@ def save_round_pairings(round_number):
     if not isinstance(payload_matches, list) or not payload_matches:
         return jsonify({"success": False, "message": "Keine Pairing-Daten übergeben."}), 400
 
-    with open(round_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        original_rows = list(reader)
-        fieldnames = reader.fieldnames or [
-            "table",
-            "player1",
-            "player2",
-            "score1",
-            "score2",
-            "score_draws",
-            "dropout1",
-            "dropout2",
-            "table_size",
-            "group_key",
-        ]
+    fieldnames, original_rows = read_round_table(round_file)
+    fieldnames = fieldnames or [
+        "table",
+        "player1",
+        "player2",
+        "score1",
+        "score2",
+        "score_draws",
+        "dropout1",
+        "dropout2",
+        "table_size",
+        "group_key",
+    ]
 
     original_by_table = {str((row.get("table") or "").strip()): row for row in original_rows}
     submitted_by_table = {}
@@ -1864,6 +2757,7 @@ def save_round_pairings(round_number):
     atomic_write(round_file, _write_pairings, newline="")
 
     _sync_round_to_db(tournament_id, round_number, updated_rows)
+    _publish_tournament_event(tournament_id, EVENT_PAIRINGS_UPDATED, {"round": round_number})
     return jsonify({"success": True, "message": "Paarungen wurden gespeichert."})
 
 @main.route("/start_tournament", methods=["GET", "POST"])
@@ -1909,13 +2803,7 @@ def continue_tournament():
         flash("Für dieses Turnier sind noch keine Runden vorhanden.")
         return redirect(url_for("main.index"))
 
-    round_numbers = []
-    for filename in os.listdir(rounds_dir):
-        if filename.startswith("round_") and filename.endswith(".csv"):
-            try:
-                round_numbers.append(int(filename.replace("round_", "").replace(".csv", "")))
-            except ValueError:
-                continue
+    round_numbers = list_round_numbers(rounds_dir)
 
     if not round_numbers:
         flash("Für dieses Turnier sind noch keine Runden vorhanden.")
@@ -1924,6 +2812,7 @@ def continue_tournament():
     return redirect(url_for("main.show_round", round_number=max(round_numbers)))
 
 @main.route("/end_tournament", methods=["POST"])
+@_with_tournament_lock
 def end_tournament():
     tournament_id = session.get("tournament_id")
     if not tournament_id:
@@ -1934,13 +2823,7 @@ def end_tournament():
     rounds_dir = os.path.join(data_dir, "rounds")
     total_rounds = 0
     if os.path.exists(rounds_dir):
-        round_numbers = []
-        for filename in os.listdir(rounds_dir):
-            if filename.startswith("round_") and filename.endswith(".csv"):
-                try:
-                    round_numbers.append(int(filename.replace("round_", "").replace(".csv", "")))
-                except ValueError:
-                    continue
+        round_numbers = list_round_numbers(rounds_dir)
         total_rounds = max(round_numbers) if round_numbers else 0
         if check_tournament_status(tournament_id):
             flash("Turnier ist bereits beendet. Es wurden keine weiteren Änderungen vorgenommen.")
@@ -2000,22 +2883,23 @@ def end_tournament():
     os.makedirs(tournament_results_dir, exist_ok=True)
     
     results_file = os.path.join(tournament_results_dir, f"{tournament_id}_results.json")
-    atomic_write(
-        results_file,
-        lambda f: json.dump({
-            "tournament_data": tournament_data,
-            "final_leaderboard": final_leaderboard
-        }, f),
-    )
+    # Ergebnis-JSON und end_time.txt (für konsistente Endstatus-Prüfung) gemeinsam schreiben.
+    end_time_file = os.path.join(data_dir, "end_time.txt")
+    with AtomicBatch() as batch:
+        batch.write(
+            results_file,
+            lambda f: json.dump({
+                "tournament_data": tournament_data,
+                "final_leaderboard": final_leaderboard
+            }, f),
+        )
+        batch.write(end_time_file, lambda f: f.write(datetime.now().strftime("%d.%m.%Y %H:%M")))
     
     # Speichere den Status des Turniers in der Session
     # Entferne nicht die tournament_id, damit der Benutzer zurückkehren kann
     session["tournament_ended"] = True
     set_tournament_status(tournament_id, TOURNAMENT_STATUS_ENDED)
-    
-    # Erstelle eine end_time.txt-Datei im Turnierverzeichnis für konsistente Endstatus-Prüfung
-    end_time_file = os.path.join(data_dir, "end_time.txt")
-    atomic_write(end_time_file, lambda f: f.write(datetime.now().strftime("%d.%m.%Y %H:%M")))
+    _bump_data_versions(tournament_id, catalog=True, players_list=False)
     
     return render_template(
         "tournament_end.html",
@@ -2023,6 +2907,43 @@ def end_tournament():
         leaderboard=final_leaderboard
     )
 
+def _load_round_matches(round_file):
+    """Rundenzeilen im Format der Rundenansicht (Template und Round-State-API)."""
+    matches = []
+    for row in read_round_rows(round_file):
+        # Setze Standardwerte für Felder, falls sie nicht existieren
+        if 'player1' not in row or 'player2' not in row:
+            continue
+        matches.append({
+            'player1': row['player1'],
+            'player2': row['player2'],
+            'table': row.get('table', ''),
+            'score1': row.get('score1', '0'),
+            'score2': row.get('score2', '0'),
+            'score_draws': row.get('score_draws', '0'),
+            'dropout1': row.get('dropout1', 'false'),
+            'dropout2': row.get('dropout2', 'false'),
+            'table_size': row.get('table_size', ''),
+            'group_key': row.get('group_key', row.get('table_size', ''))
+        })
+    return matches
+
+
+def _round_power_nine(tournament_id, matches):
+    """{Spieler: {Karte: bool}} für alle Spieler der Matches (ohne BYE), vollständig befüllt."""
+    from .player_stats import POWER_NINE
+
+    tournament_power_nine = get_tournament_power_nine(tournament_id)
+    power_nine = {}
+    for match in matches:
+        for player in (match['player1'], match['player2']):
+            if player == "BYE" or player in power_nine:
+                continue
+            cards = tournament_power_nine.get(player, {})
+            power_nine[player] = {card: bool(cards.get(card, False)) for card in POWER_NINE}
+    return power_nine
+
+
 @main.route("/round/<int:round_number>")
 def show_round(round_number):
     """Zeigt die Paarungen und Ergebnisse für eine bestimmte Runde an"""
@@ -2043,6 +2964,7 @@ def show_round(round_number):
         if not os.path.exists(end_time_file):
             try:
                 atomic_write(end_time_file, lambda f: f.write(datetime.now().strftime("%d.%m.%Y %H:%M")))
+                _bump_data_versions(tournament_id, catalog=True, players_list=False)
                 session["tournament_ended"] = True
                 print(f"Turnier {tournament_id} wurde als beendet markiert durch ensure_marked_as_ended Parameter")
             except Exception as e:
@@ -2054,47 +2976,22 @@ def show_round(round_number):
         # Keine Rundendatei gefunden - zurück zum Index leiten
         flash(f"Runde {round_number} existiert nicht.")
         return redirect(url_for('main.index'))
+
+    # Conditional GET: unveränderte Runden ohne CSV-Parsing/Leaderboard beantworten.
+    etag = last_modified = None
+    if not ensure_marked_as_ended:
+        etag, last_modified = _cache_validators(
+            [tournament_scope(tournament_id), TOURNAMENTS_SCOPE],
+            "round",
+            round_number,
+        )
+        not_modified = _not_modified_response(etag, last_modified)
+        if not_modified is not None:
+            return not_modified
         
     # Bestimme die maximale Rundenzahl
-    total_rounds = 0
     rounds_dir = os.path.join(data_dir, "rounds")
-    if os.path.exists(rounds_dir):
-        for filename in os.listdir(rounds_dir):
-            if filename.startswith("round_") and filename.endswith(".csv"):
-                try:
-                    round_num = int(filename.replace("round_", "").replace(".csv", ""))
-                    total_rounds = max(total_rounds, round_num)
-                except ValueError:
-                    continue
-    
-    # Lade die aktuellen Rundendaten
-    matches = []
-    with open(round_file, 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            # Setze Standardwerte für Felder, falls sie nicht existieren
-            if 'player1' not in row or 'player2' not in row:
-                continue
-            
-            # Transformiere Rohdaten in ein passendes Format für unser Template
-            match = {
-                'player1': row['player1'],
-                'player2': row['player2'],
-                'table': row.get('table', ''),
-                'score1': row.get('score1', '0'),
-                'score2': row.get('score2', '0'),
-                'score_draws': row.get('score_draws', '0'),
-                'dropout1': row.get('dropout1', 'false'),
-                'dropout2': row.get('dropout2', 'false'),
-                'table_size': row.get('table_size', ''),
-                'group_key': row.get('group_key', row.get('table_size', ''))
-            }
-                
-            matches.append(match)
-    
-    # Lade das Leaderboard für das Turnier bis zu dieser Runde
-    leaderboard = calculate_leaderboard(tournament_id, round_number)
-    bye_counts = get_player_bye_counts(tournament_id, round_number)
+    total_rounds = max(list_round_numbers(rounds_dir), default=0)
     
     # Prüfe, ob das Turnier beendet ist - zweifache Prüfung für Konsistenz
     tournament_ended = check_tournament_status(tournament_id)
@@ -2102,52 +2999,158 @@ def show_round(round_number):
     round_is_unplayed = is_round_unplayed(round_file)
     current_pairing_mode = _get_tournament_pairing_mode(tournament_id)
     
-    # Lade Power-Nine-Daten nur für Vintage-Turniere
-    all_players_data = {}
-    tournament_power_nine = get_tournament_power_nine(tournament_id) if is_vintage else {}
-    
-    # Erstelle ein Dictionary mit den Spielerdaten für das Template
-    if is_vintage:
-        from .player_stats import POWER_NINE
-        for match in matches:
-            player1 = match['player1']
-            player2 = match['player2']
-            
-            # Füge Spieler 1 hinzu, falls noch nicht vorhanden
-            if player1 not in all_players_data:
-                all_players_data[player1] = {
-                    'power_nine': tournament_power_nine.get(player1, {})
-                }
-                # Stelle sicher, dass alle Power Nine Karten vorhanden sind
-                for card in POWER_NINE:
-                    if card not in all_players_data[player1]['power_nine']:
-                        all_players_data[player1]['power_nine'][card] = False
-            
-            # Füge Spieler 2 hinzu, falls noch nicht vorhanden und kein BYE
-            if player2 != "BYE" and player2 not in all_players_data:
-                all_players_data[player2] = {
-                    'power_nine': tournament_power_nine.get(player2, {})
-                }
-                # Stelle sicher, dass alle Power Nine Karten vorhanden sind
-                for card in POWER_NINE:
-                    if card not in all_players_data[player2]['power_nine']:
-                        all_players_data[player2]['power_nine'][card] = False
-    
-    return render_template(
+    # Ereignis-Cursor vor den Versionen lesen (wie in round_state()).
+    event_cursor = latest_event_id(tournament_id)
+    versions = get_versions([tournament_scope(tournament_id), TOURNAMENTS_SCOPE])
+    # Gleiche Token-Erzeugung wie der CSRF-Context-Processor, aber vor dem
+    # Rendern: gecachte Fragmente enthalten nur den Platzhalter.
+    csrf_value = session.get("csrf_token")
+    if not csrf_value:
+        csrf_value = secrets.token_urlsafe(32)
+        session["csrf_token"] = csrf_value
+
+    def _render_round_tables(csrf_placeholder):
+        # Lade die aktuellen Rundendaten
+        matches = _load_round_matches(round_file)
+        
+        # Lade das Leaderboard für das Turnier bis zu dieser Runde
+        leaderboard = calculate_leaderboard(tournament_id, round_number)
+
+        # Lade Power-Nine-Daten nur für Vintage-Turniere
+        all_players_data = {}
+        if is_vintage:
+            power_nine = _round_power_nine(tournament_id, matches)
+            all_players_data = {name: {'power_nine': cards} for name, cards in power_nine.items()}
+        
+        return render_template(
+            'partials/round_tables.html',
+            tournament_id=tournament_id,
+            matches=matches,
+            leaderboard=leaderboard,
+            tournament_ended=tournament_ended,
+            all_players_data=all_players_data,
+            is_vintage_tournament=is_vintage,
+            csrf_token=lambda: csrf_placeholder,
+        )
+
+    def _render_tournament_switcher(_csrf_placeholder):
+        return render_template(
+            'partials/tournament_switcher.html',
+            tournament_id=tournament_id,
+            running_tournaments=get_active_tournaments(limit=50),
+        )
+
+    # Fragment-Cache: Matches/Leaderboard/Power Nine und Turnier-Switcher
+    # werden nur nach einem Versionssprung neu aufgebaut.
+    round_tables_html = cached_fragment(
+        (
+            tournament_scope(tournament_id),
+            "round_tables",
+            round_number,
+            versions[tournament_scope(tournament_id)][0],
+            bool(tournament_ended),
+        ),
+        _render_round_tables,
+        csrf_token=csrf_value,
+    )
+    tournament_switcher_html = cached_fragment(
+        (TOURNAMENTS_SCOPE, "tournament_switcher", versions[TOURNAMENTS_SCOPE][0], tournament_id),
+        _render_tournament_switcher,
+    )
+
+    response = make_response(render_template(
         'pair.html',
         tournament_id=tournament_id,
-        matches=matches,
         current_round=round_number,
         total_rounds=total_rounds,
-        leaderboard=leaderboard,
-        bye_counts=bye_counts,
         tournament_ended=tournament_ended,
-        all_players_data=all_players_data,
         is_vintage_tournament=is_vintage,
-        running_tournaments=get_active_tournaments(limit=50),
         round_is_unplayed=round_is_unplayed,
         current_pairing_mode=current_pairing_mode,
+        round_tables_html=round_tables_html,
+        tournament_switcher_html=tournament_switcher_html,
+        round_state_version=versions[tournament_scope(tournament_id)][0],
+        round_state_cursor=event_cursor,
+        live_fallback_poll_ms=int(current_app.config.get("SSE_FALLBACK_POLL_MS", 5000)),
+    ))
+    if etag is not None:
+        _apply_cache_validators(response, etag, last_modified)
+    return response
+
+@main.route("/round/<int:round_number>/state", methods=["GET"])
+def round_state(round_number):
+    """Rundenstand als kompaktes JSON: Matches, Tabelle und Versionsstempel.
+
+    Der Client schickt `since` (Version) und `cursor` (Ereignis-ID) seiner
+    letzten Antwort zurück. Bei unverändertem Stempel kommt nur `unchanged`;
+    wurden seither ausschliesslich Ergebnisse gemeldet, enthält `matches` nur
+    die betroffenen Tische. Sonst (neue Paarungen, Turnierende, ...) folgt der
+    vollständige Stand.
+    """
+    tournament_id = session.get("tournament_id")
+    if not tournament_id:
+        return jsonify({"success": False, "message": "Kein aktives Turnier gefunden."}), 400
+
+    rounds_dir = os.path.join("data", tournament_id, "rounds")
+    round_file = os.path.join(rounds_dir, f"round_{round_number}.csv")
+    if not os.path.exists(round_file):
+        return jsonify({"success": False, "message": "Runde wurde nicht gefunden."}), 404
+
+    # Stempel vor dem Lesen erfassen: eine parallele Änderung führt höchstens
+    # zu einem zusätzlichen Abgleich, nie zu einem verpassten.
+    cursor = latest_event_id(tournament_id)
+    version_key = tournament_scope(tournament_id)
+    version = get_versions([version_key])[version_key][0]
+    payload = {"success": True, "round": round_number, "version": version, "cursor": cursor}
+
+    since = request.args.get("since", type=int)
+    if since is not None and since == version:
+        payload["unchanged"] = True
+        return _no_store(jsonify(payload))
+
+    changed_tables = _round_state_changed_tables(
+        tournament_id, round_number, since, request.args.get("cursor", type=int)
+    )
+    matches = _load_round_matches(round_file)
+    if changed_tables is not None:
+        matches = [match for match in matches if str(match["table"]) in changed_tables]
+
+    payload.update(
+        full=changed_tables is None,
+        matches=matches,
+        standings=[list(entry) for entry in calculate_leaderboard(tournament_id, round_number)],
+        total_rounds=max(list_round_numbers(rounds_dir), default=0),
+        tournament_ended=bool(check_tournament_status(tournament_id)),
     )
+    if is_vintage_tournament(tournament_id):
+        payload["power_nine"] = _round_power_nine(tournament_id, matches)
+    return _no_store(jsonify(payload))
+
+
+def _round_state_changed_tables(tournament_id, round_number, since, cursor):
+    """Tische der Runde, die sich seit `cursor` geändert haben, oder None für "alles".
+
+    Deltas gibt es nur, wenn das Ereignis-Log die Änderung vollständig
+    beschreibt: ausschliesslich Ergebnis-Ereignisse und keine Kappung.
+    """
+    if since is None or cursor is None:
+        return None
+    events = list_events_since(tournament_id, cursor, limit=ROUND_STATE_EVENT_LIMIT)
+    if not events or len(events) >= ROUND_STATE_EVENT_LIMIT:
+        return None
+    tables = set()
+    for event in events:
+        if event["type"] != EVENT_MATCH_RESULT:
+            return None
+        if str(event["data"].get("round")) == str(round_number):
+            tables.add(str(event["data"].get("table")))
+    return tables
+
+
+def _no_store(response):
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
 
 def calculate_opponents_match_percentage(player, stats):
     """Berechnet den OMW% (Opponents Match Win Percentage) für einen Spieler."""
@@ -2245,81 +3248,79 @@ def calculate_leaderboard(tournament_id, up_to_round):
         if os.path.exists(round_file):
             print(f"Verarbeite Runde {round_num}")
             try:
-                with open(round_file, "r", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    for match in reader:
-                        try:
-                            player1 = match["player1"]
-                            player2 = match["player2"]
-                            if not player1 or not player2:
-                                continue
-
-                            # Wenn es ein BYE Match ist, bekommt der aktive Spieler 2 Siege
-                            if player2 == "BYE":
-                                score1 = 2
-                                score2 = 0
-                                score_draws = 0
-                            # Nur wenn beide Scores eingetragen sind
-                            elif match["score1"] and match["score2"]:
-                                score1 = int(match["score1"])
-                                score2 = int(match["score2"])
-
-                                # Unentschieden berücksichtigen, falls vorhanden
-                                score_draws = 0
-                                if "score_draws" in match and match["score_draws"]:
-                                    score_draws = int(match["score_draws"])
-                            else:
-                                continue  # Überspringe Matches ohne Ergebnis
-                        except (KeyError, TypeError, ValueError) as e:
-                            # Korrupte oder unvollständige CSV-Zeile überspringen statt 500
-                            print(f"Überspringe ungültige Match-Zeile in Runde {round_num}: {e}")
+                for match in read_round_rows(round_file):
+                    try:
+                        player1 = match["player1"]
+                        player2 = match["player2"]
+                        if not player1 or not player2:
                             continue
 
-                        
-                        # Debug-Ausgabe
-                        print(f"  Match: {player1} vs {player2}, Ergebnis: {score1}-{score2}-{score_draws}")
-                        
+                        # Wenn es ein BYE Match ist, bekommt der aktive Spieler 2 Siege
                         if player2 == "BYE":
-                            # BYE zählt nur für den aktiven Spieler.
-                            # BYE darf keine eigenen Stats/Opponents erzeugen und keine Tiebreaker verfälschen.
-                            stats[player1]['points'] += 3
-                            stats[player1]['wins'] += 1
-                            stats[player1]['total_wins'] += score1
-                            stats[player1]['total_losses'] += score2
-                            stats[player1]['total_draws'] += score_draws
-                            stats[player1]['matches'] += 1
-                            continue
+                            score1 = 2
+                            score2 = 0
+                            score_draws = 0
+                        # Nur wenn beide Scores eingetragen sind
+                        elif match["score1"] and match["score2"]:
+                            score1 = int(match["score1"])
+                            score2 = int(match["score2"])
+
+                            # Unentschieden berücksichtigen, falls vorhanden
+                            score_draws = 0
+                            if "score_draws" in match and match["score_draws"]:
+                                score_draws = int(match["score_draws"])
+                        else:
+                            continue  # Überspringe Matches ohne Ergebnis
+                    except (KeyError, TypeError, ValueError) as e:
+                        # Korrupte oder unvollständige CSV-Zeile überspringen statt 500
+                        print(f"Überspringe ungültige Match-Zeile in Runde {round_num}: {e}")
+                        continue
 
-                        # Aktualisiere die Gegner-Listen
-                        stats[player1]['opponents'].append(player2)
-                        stats[player2]['opponents'].append(player1)
                         
-                        # Aktualisiere die Statistiken für beide Spieler
-                        if score1 > score2:
-                            stats[player1]['points'] += 3  # 3 Punkte für Sieg
-                            stats[player1]['wins'] += 1
-                            stats[player2]['losses'] += 1
-                        elif score2 > score1:
-                            stats[player2]['points'] += 3  # 3 Punkte für Sieg
-                            stats[player2]['wins'] += 1
-                            stats[player1]['losses'] += 1
-                        else:
-                            # Bei Gleichstand als Unentschieden werten
-                            stats[player1]['points'] += 1  # 1 Punkt für Unentschieden
-                            stats[player2]['points'] += 1  # 1 Punkt für Unentschieden
-                            stats[player1]['draws'] += 1
-                            stats[player2]['draws'] += 1
+                    # Debug-Ausgabe
+                    print(f"  Match: {player1} vs {player2}, Ergebnis: {score1}-{score2}-{score_draws}")
                         
-                        # Aktualisiere die Gesamtsiege, -niederlagen und -unentschieden
+                    if player2 == "BYE":
+                        # BYE zählt nur für den aktiven Spieler.
+                        # BYE darf keine eigenen Stats/Opponents erzeugen und keine Tiebreaker verfälschen.
+                        stats[player1]['points'] += 3
+                        stats[player1]['wins'] += 1
                         stats[player1]['total_wins'] += score1
                         stats[player1]['total_losses'] += score2
                         stats[player1]['total_draws'] += score_draws
-                        stats[player2]['total_wins'] += score2
-                        stats[player2]['total_losses'] += score1
-                        stats[player2]['total_draws'] += score_draws
-                        
                         stats[player1]['matches'] += 1
-                        stats[player2]['matches'] += 1
+                        continue
+
+                    # Aktualisiere die Gegner-Listen
+                    stats[player1]['opponents'].append(player2)
+                    stats[player2]['opponents'].append(player1)
+                        
+                    # Aktualisiere die Statistiken für beide Spieler
+                    if score1 > score2:
+                        stats[player1]['points'] += 3  # 3 Punkte für Sieg
+                        stats[player1]['wins'] += 1
+                        stats[player2]['losses'] += 1
+                    elif score2 > score1:
+                        stats[player2]['points'] += 3  # 3 Punkte für Sieg
+                        stats[player2]['wins'] += 1
+                        stats[player1]['losses'] += 1
+                    else:
+                        # Bei Gleichstand als Unentschieden werten
+                        stats[player1]['points'] += 1  # 1 Punkt für Unentschieden
+                        stats[player2]['points'] += 1  # 1 Punkt für Unentschieden
+                        stats[player1]['draws'] += 1
+                        stats[player2]['draws'] += 1
+                        
+                    # Aktualisiere die Gesamtsiege, -niederlagen und -unentschieden
+                    stats[player1]['total_wins'] += score1
+                    stats[player1]['total_losses'] += score2
+                    stats[player1]['total_draws'] += score_draws
+                    stats[player2]['total_wins'] += score2
+                    stats[player2]['total_losses'] += score1
+                    stats[player2]['total_draws'] += score_draws
+                        
+                    stats[player1]['matches'] += 1
+                    stats[player2]['matches'] += 1
             except (IOError, OSError, csv.Error) as e:
                 print(f"Fehler beim Lesen der Runde {round_num}: {e}")
         else:
@@ -2364,6 +3365,16 @@ def calculate_leaderboard(tournament_id, up_to_round):
     ))
     return leaderboard
 
+def _tournament_player_names(tournament_id):
+    """Alle Spielernamen eines Turniers laut DB (inkl. Snapshots gelöschter Spieler)."""
+    rows = (
+        db.session.query(Match.player1_name_snapshot, Match.player2_name_snapshot)
+        .join(Round, Match.round_id == Round.id)
+        .filter(Round.tournament_id == tournament_id)
+        .all()
+    )
+    return sorted({name for row in rows for name in row if name})
+
 @main.route("/delete_tournament/<tournament_id>", methods=["POST"])
 def delete_tournament(tournament_id):
     """Löscht ein Turnier (laufend oder vergangen)."""
@@ -2378,18 +3389,23 @@ def delete_tournament(tournament_id):
     # Prüfe, ob das Turnier existiert (entweder als laufendes oder archiviertes Turnier)
     has_results = os.path.exists(results_file)
     has_data = os.path.exists(data_dir) and os.path.isdir(data_dir)
-    if not has_results and not has_data:
+    has_bundle = is_archived(tournament_id)
+    if not has_results and not has_data and not has_bundle:
         return jsonify({"success": False, "message": "Turnier nicht gefunden"}), 404
     
+    affected_players = _tournament_player_names(tournament_id)
     try:
         # Lösche Archivdatei falls vorhanden
         if has_results:
             os.remove(results_file)
+        if has_bundle:
+            delete_archived_tournament(tournament_id)
 
         # Lösche zugehörige Daten im data-Verzeichnis
         if has_data:
             import shutil
             shutil.rmtree(data_dir)
+        _remove_results_rows(tournament_id)
 
         # Falls aktuell geladenes Turnier gelöscht wurde, Session bereinigen
         if session.get("tournament_id") == tournament_id:
@@ -2398,21 +3414,15 @@ def delete_tournament(tournament_id):
             session.pop("tournament_ended", None)
 
         remove_tournament_group(tournament_id)
+        _bump_data_versions(tournament_id, player_names=affected_players, catalog=True)
         
         return jsonify({"success": True, "message": "Turnier erfolgreich gelöscht"})
     except Exception as e:
         return jsonify({"success": False, "message": f"Fehler beim Löschen: {str(e)}"}), 500
 
-@main.route("/players")
-def players_list():
-    """Zeigt eine Übersichtsseite mit allen Spielern"""
-    # Importiere das player_stats Modul
-    from .player_stats import (
-        get_all_players,
-        load_player_data,
-        get_player_statistics,
-        get_played_group_and_cube_ids,
-    )
+def _stats_filter_from_args():
+    """Gruppen-/Cube-Filter der Spielerseiten aus den Query-Parametern (nur gespielte Werte)."""
+    from .player_stats import get_played_group_and_cube_ids
 
     played_group_ids, played_cube_ids = get_played_group_and_cube_ids()
     tournament_groups = [g for g in load_tournament_groups() if g["id"] in played_group_ids]
@@ -2432,59 +3442,69 @@ def players_list():
         stats_scope = "global"
     if selected_cube_id != "all" and selected_cube_id not in valid_cube_ids:
         selected_cube_id = "all"
+    return {
+        "stats_scope": stats_scope,
+        "selected_group_id": selected_group_id,
+        "selected_cube_id": selected_cube_id,
+        "tournament_groups": tournament_groups,
+        "cube_filter_options": cube_filter_options,
+        "stats_group_id": selected_group_id if stats_scope == "group" else None,
+        "stats_cube_id": None if selected_cube_id == "all" else selected_cube_id,
+    }
 
-    stats_group_id = selected_group_id if stats_scope == "group" else None
-    
-    # Sammle alle Spieler
-    all_players = get_all_players()
-    
-    # Bereite die Spielerdaten für die Anzeige vor
-    players_data = {}
-    for player in all_players:
-        # Überspringe gelöschte Spieler
-        if _is_deleted_player_name(player):
-            continue
-            
-        # Lade Spielerdaten und Statistiken
-        player_data = load_player_data(player)
-        player_stats = get_player_statistics(
-            player,
-            group_id=stats_group_id,
-            cube_filter=selected_cube_id,
-        )
-        has_active_match_filter = stats_scope == "group" or selected_cube_id != "all"
-        if has_active_match_filter and player_stats.get("total_matches", 0) <= 0:
-            # Nur Spieler zeigen, die im aktiven Filter wirklich Matches haben.
-            continue
-        
-        # Power Nine wird nur im Vintage-Filter angezeigt
-        power_nine_count = player_stats.get("power_nine_total", 0) if selected_cube_id == "vintage" else 0
-        
-        # Speichere strukturierte Daten für die Anzeige
-        players_data[player] = {
-            "power_nine_count": power_nine_count,
-            "tournaments_played": player_stats.get("tournaments_played", 0),
-            "match_win_percentage": player_stats.get("match_win_percentage", 0),
-            "total_matches": player_stats.get("total_matches", 0)
-        }
-    
-    # Sortiere die Spieler nach Gewinnrate (absteigend)
-    sorted_players = dict(sorted(
-        players_data.items(), 
-        key=lambda item: item[1]["match_win_percentage"], 
-        reverse=True
-    ))
-    
-    return render_template(
+
+@main.route("/players")
+def players_list():
+    """Zeigt eine Übersichtsseite mit allen Spielern (sortiert, seitenweise per Keyset)"""
+    etag, last_modified = _cache_validators(
+        [PLAYERS_SCOPE, TOURNAMENTS_SCOPE],
+        "players",
+        request.query_string.decode("utf-8", "replace"),
+    )
+    not_modified = _not_modified_response(etag, last_modified)
+    if not_modified is not None:
+        return not_modified
+
+    stats_filter = _stats_filter_from_args()
+    stats_scope = stats_filter["stats_scope"]
+    selected_group_id = stats_filter["selected_group_id"]
+    selected_cube_id = stats_filter["selected_cube_id"]
+    stats_group_id = stats_filter["stats_group_id"]
+
+    # Sortierung, Filter und Paging laufen in einer SQL-Abfrage; nur die Seite wird geladen.
+    listing = players_page(
+        group_id=stats_group_id,
+        cube_id=stats_filter["stats_cube_id"],
+        sort=request.args.get("sort"),
+        order=request.args.get("order"),
+        min_matches=max(0, request.args.get("min_matches", 0, type=int) or 0),
+        after=request.args.get("after"),
+        per_page=min(PLAYERS_MAX_PER_PAGE, max(1, request.args.get("per_page", PLAYERS_PER_PAGE, type=int) or PLAYERS_PER_PAGE)),
+    )
+    # Elo-Wertung des aktiven Filters, nur für die Spieler dieser Seite.
+    rating_by_player_id = ratings_for_scope(
+        rating_scope_for_filter(stats_group_id, selected_cube_id),
+        player_ids=[player["id"] for player in listing["players"]],
+    )
+    players = []
+    for player in listing["players"]:
+        rating = rating_by_player_id.get(player["id"])
+        players.append({**player, "rating": round(rating[0]) if rating else None})
+
+    show_power_nine_stats = selected_cube_id == "vintage"
+    response = make_response(render_template(
         "players_list.html",
-        players=sorted_players,
+        players=players,
+        listing=listing,
+        sort_options=player_sort_options(show_power_nine_stats),
         stats_scope=stats_scope,
         selected_group_id=selected_group_id,
-        tournament_groups=tournament_groups,
+        tournament_groups=stats_filter["tournament_groups"],
         selected_cube_id=selected_cube_id,
-        cube_filter_options=cube_filter_options,
-        show_power_nine_stats=(selected_cube_id == "vintage"),
-    )
+        cube_filter_options=stats_filter["cube_filter_options"],
+        show_power_nine_stats=show_power_nine_stats,
+    ))
+    return _apply_cache_validators(response, etag, last_modified)
 
 @main.route("/player/<player_name>")
 def player_profile(player_name):
@@ -2495,7 +3515,8 @@ def player_profile(player_name):
         return redirect(url_for('main.players_list'))
 
     # Hard-delete Guard: Profile nur für aktuell existierende DB-Spieler rendern.
-    if Player.query.filter_by(normalized_name=normalize_name(player_name)).first() is None:
+    player_row = Player.query.filter_by(normalized_name=normalize_name(player_name)).first()
+    if player_row is None:
         flash("Dieser Spieler existiert nicht mehr.")
         return redirect(url_for('main.players_list'))
     
@@ -2503,29 +3524,26 @@ def player_profile(player_name):
     from .player_stats import (
         load_player_data,
         get_player_statistics,
-        get_played_group_and_cube_ids,
         POWER_NINE,
     )
 
-    played_group_ids, played_cube_ids = get_played_group_and_cube_ids()
-    tournament_groups = [g for g in load_tournament_groups() if g["id"] in played_group_ids]
-    cube_filter_options = [{"id": "all", "name": "Alle Cubes"}] + [
-        cube for cube in load_allowed_cubes() if cube["id"] in played_cube_ids
-    ]
-    valid_group_ids = {group["id"] for group in tournament_groups}
-    valid_cube_ids = {cube["id"] for cube in cube_filter_options if cube["id"] != "all"}
-    stats_scope = request.args.get("scope", "global")
-    selected_group_id = request.args.get("group_id", DEFAULT_GROUP_ID)
-    selected_cube_id = (request.args.get("cube", "all") or "all").strip().lower()
-    if selected_group_id not in valid_group_ids:
-        selected_group_id = tournament_groups[0]["id"] if tournament_groups else DEFAULT_GROUP_ID
-    if stats_scope != "group":
-        stats_scope = "global"
-    if stats_scope == "group" and not valid_group_ids:
-        stats_scope = "global"
-    if selected_cube_id != "all" and selected_cube_id not in valid_cube_ids:
-        selected_cube_id = "all"
-    stats_group_id = selected_group_id if stats_scope == "group" else None
+    etag, last_modified = _cache_validators(
+        [player_scope(player_name), TOURNAMENTS_SCOPE],
+        "player",
+        player_name,
+        request.query_string.decode("utf-8", "replace"),
+    )
+    not_modified = _not_modified_response(etag, last_modified)
+    if not_modified is not None:
+        return not_modified
+
+    stats_filter = _stats_filter_from_args()
+    stats_scope = stats_filter["stats_scope"]
+    selected_group_id = stats_filter["selected_group_id"]
+    selected_cube_id = stats_filter["selected_cube_id"]
+    tournament_groups = stats_filter["tournament_groups"]
+    cube_filter_options = stats_filter["cube_filter_options"]
+    stats_group_id = stats_filter["stats_group_id"]
     
     # Lade Spielerdaten
     player_data = load_player_data(player_name)
@@ -2534,12 +3552,17 @@ def player_profile(player_name):
         group_id=stats_group_id,
         cube_filter=selected_cube_id,
     )
+    rating = get_player_rating(player_row.id, rating_scope_for_filter(stats_group_id, selected_cube_id))
+    head_to_head = player_head_to_head(player_row.name, stats_group_id, stats_filter["stats_cube_id"])
     
-    return render_template(
+    response = make_response(render_template(
         "player_profile.html",
         player_name=player_name,
         player_data=player_data,
         player_stats=player_stats,
+        player_rating=round(rating[0]) if rating else None,
+        player_rated_matches=rating[1] if rating else 0,
+        head_to_head=head_to_head,
         power_nine=POWER_NINE,
         stats_scope=stats_scope,
         selected_group_id=selected_group_id,
@@ -2547,24 +3570,91 @@ def player_profile(player_name):
         selected_cube_id=selected_cube_id,
         cube_filter_options=cube_filter_options,
         show_power_nine_stats=(selected_cube_id == "vintage"),
+    ))
+    return _apply_cache_validators(response, etag, last_modified)
+
+def _head_to_head_page_from_args(stats_filter):
+    return head_to_head_page(
+        stats_filter["stats_group_id"],
+        stats_filter["stats_cube_id"],
+        page=request.args.get("page", 1, type=int) or 1,
+        col_page=request.args.get("col_page", 1, type=int) or 1,
+        per_page=min(HEAD_TO_HEAD_MAX_PER_PAGE, max(1, request.args.get("per_page", HEAD_TO_HEAD_PER_PAGE, type=int) or HEAD_TO_HEAD_PER_PAGE)),
+    )
+
+
+@main.route("/head_to_head")
+def head_to_head_matrix():
+    """Vereinsweite Direktvergleich-Matrix, seitenweise nach Zeilen und Spalten."""
+    etag, last_modified = _cache_validators(
+        [PLAYERS_SCOPE, TOURNAMENTS_SCOPE],
+        "head_to_head",
+        request.query_string.decode("utf-8", "replace"),
     )
+    not_modified = _not_modified_response(etag, last_modified)
+    if not_modified is not None:
+        return not_modified
+
+    stats_filter = _stats_filter_from_args()
+    matrix = _head_to_head_page_from_args(stats_filter)
+    cells = {(cell["player"], cell["opponent"]): cell for cell in matrix["cells"]}
+    response = make_response(render_template(
+        "head_to_head.html",
+        matrix=matrix,
+        cells=cells,
+        **{key: value for key, value in stats_filter.items() if key not in ("stats_group_id", "stats_cube_id")},
+    ))
+    return _apply_cache_validators(response, etag, last_modified)
+
+
+@main.route("/api/head_to_head", methods=["GET"])
+def api_head_to_head():
+    """Matrix-Ausschnitt als JSON; `cells` enthält nur gespielte Paarungen."""
+    stats_filter = _stats_filter_from_args()
+    return jsonify({"success": True, **_head_to_head_page_from_args(stats_filter)})
+
 
 @main.route("/player/<player_name>/delete", methods=["POST"])
 def delete_player(player_name):
     """Löscht einen Spieler aus allen Daten"""
     # Importiere das player_stats Modul
-    from .player_stats import delete_player
+    from .player_stats import delete_player_with_counts
     
     # Lösche den Spieler aus allen Daten
-    success = delete_player(player_name)
+    try:
+        affected = delete_player_with_counts(player_name)
+        success = True
+    except Exception:
+        db.session.rollback()
+        success = False
     
     if success:
         # Zeige Erfolgsmeldung an
-        return jsonify({"success": True, "message": f"Spieler {player_name} wurde erfolgreich aus allen Daten entfernt"})
+        return jsonify({
+            "success": True,
+            "message": f"Spieler {player_name} wurde erfolgreich aus allen Daten entfernt",
+            "affected": affected,
+        })
     else:
         # Zeige Fehlermeldung an
         return jsonify({"success": False, "message": f"Es gab ein Problem beim Löschen des Spielers {player_name}. Bitte überprüfen Sie die Logs."})
 
+@main.route("/api/players/suggest", methods=["GET"])
+def api_player_suggest():
+    """Autovervollständigung: bekannte Spielernamen, deren Name oder ein Wort mit `q` beginnt."""
+    query = (request.args.get("q") or "").strip()[:50]
+    limit = request.args.get("limit", DEFAULT_SUGGEST_LIMIT, type=int) or DEFAULT_SUGGEST_LIMIT
+    return jsonify({"success": True, "query": query, "names": suggest_player_names(query, limit)})
+
+
+@main.route("/api/players/similar", methods=["GET"])
+def api_player_similar():
+    """Bekannte Spielernamen, die `name` ähneln (Tippfehler-Hinweis beim Hinzufügen)."""
+    name = (request.args.get("name") or "").strip()[:50]
+    limit = request.args.get("limit", DEFAULT_SIMILAR_LIMIT, type=int) or DEFAULT_SIMILAR_LIMIT
+    return jsonify({"success": True, "name": name, "names": similar_player_names(name, limit)})
+
+
 @main.route("/api/player/<player_name>/power_nine", methods=["GET"])
 def get_player_power_nine(player_name):
     """API-Route zum Abrufen der Power Nine Karten eines Spielers im aktuellen Turnier"""
@@ -2651,6 +3741,36 @@ def update_player_power_nine_api(player_name):
             "message": f"Fehler beim Aktualisieren der Power Nine Karten für {player_name}."
         })
 
+def _upsert_tournament_power_nine(tournament_id, player_name, power_nine_data):
+    """Setzt die Power-Nine-Karten eines Spielers im Turnier, ohne Commit oder Rollback.
+
+    Liefert den Spieler (None bei leerem Namen); Fehler gehen an den Aufrufer,
+    der damit z.B. nur den eigenen Savepoint zurückrollt.
+    """
+    player = get_or_create_player(player_name)
+    if player is None:
+        return None
+    existing_rows = PlayerPowerNine.query.filter_by(
+        tournament_id=tournament_id,
+        player_id=player.id,
+    ).all()
+    by_card = {row.card_name: row for row in existing_rows}
+    for card_name, has_card in (power_nine_data or {}).items():
+        row = by_card.get(card_name)
+        if row is None:
+            db.session.add(
+                PlayerPowerNine(
+                    tournament_id=tournament_id,
+                    player_id=player.id,
+                    card_name=card_name,
+                    has_card=bool(has_card),
+                )
+            )
+        else:
+            row.has_card = bool(has_card)
+    return player
+
+
 def update_tournament_power_nine(tournament_id, player_name, power_nine_data):
     """
     Aktualisiert die Power Nine Karten eines Spielers für ein bestimmtes Turnier.
@@ -2660,27 +3780,10 @@ def update_tournament_power_nine(tournament_id, player_name, power_nine_data):
     if not is_vintage_tournament(tournament_id):
         return True
     try:
-        player = get_or_create_player(player_name)
+        player = _upsert_tournament_power_nine(tournament_id, player_name, power_nine_data)
         if player is None:
             return False
-        existing_rows = PlayerPowerNine.query.filter_by(
-            tournament_id=tournament_id,
-            player_id=player.id,
-        ).all()
-        by_card = {row.card_name: row for row in existing_rows}
-        for card_name, has_card in (power_nine_data or {}).items():
-            row = by_card.get(card_name)
-            if row is None:
-                db.session.add(
-                    PlayerPowerNine(
-                        tournament_id=tournament_id,
-                        player_id=player.id,
-                        card_name=card_name,
-                        has_card=bool(has_card),
-                    )
-                )
-            else:
-                row.has_card = bool(has_card)
+        _bump_data_versions(tournament_id, player_names=(player.name,), commit=False)
         db.session.commit()
         return True
     except Exception as e:
@@ -2737,12 +3840,18 @@ def check_tournament_status(tournament_id):
         if db_tournament_ended:
             return True
 
+    if not legacy_file_fallbacks_enabled():
+        # Nach dem Legacy-Import ist die DB vollständig; keine Dateiprüfungen pro Request.
+        if session.get("tournament_id") == tournament_id:
+            session["tournament_ended"] = False
+        return False
+
     # Legacy-/Datei-Indikatoren als Kompatibilitätsfallback
     data_dir = os.path.join("data", tournament_id)
     end_time_file = os.path.join(data_dir, "end_time.txt")
     file_tournament_ended = os.path.exists(end_time_file)
     results_file = os.path.join("tournament_results", f"{tournament_id}_results.json")
-    archived_tournament_ended = os.path.exists(results_file)
+    archived_tournament_ended = os.path.exists(results_file) or is_archived(tournament_id)
     
     # Session-Status darf nur für das AKTUELLE Turnier gelten, sonst entstehen False-Positives.
     tournament_ended = file_tournament_ended or archived_tournament_ended
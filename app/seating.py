@@ -0,0 +1,182 @@
+"""Sitzverteilung auf Pods mit möglichst wenig wiederholten Tischnachbarn.
+
+Stammspieler landen sonst Woche für Woche in denselben Pods. Aus den letzten
+K Turnieren wird gezählt, wie oft zwei Spieler schon im selben Pod sassen
+(Pods sind pro Turnier fest, Runde 1 reicht also); die Suche verteilt den
+Roster dann so auf die vorgegebenen Pod-Größen, dass die Summe dieser Zähler
+innerhalb der Pods möglichst klein wird.
+
+Die Suche ist ein Simulated Annealing über Tausch-Schritte (zwei Spieler aus
+verschiedenen Pods tauschen) mit festem Zeitbudget. Pro Spieler und Pod wird
+die Summe seiner Gewichte zum Pod mitgeführt, sodass ein Tausch in O(1)
+bewertet und in O(Nachbarn) übernommen wird.
+"""
+
+import math
+import random
+import time
+from collections import defaultdict
+
+from sqlalchemy import select
+
+from .db import db
+from .models import Match, Round, Tournament
+
+
+DEFAULT_HISTORY_TOURNAMENTS = 8
+DEFAULT_TIME_BUDGET_MS = 200
+
+
+def load_coseating_history(player_ids, last_tournaments=DEFAULT_HISTORY_TOURNAMENTS, exclude_tournament_id=None):
+    """{frozenset({id_a, id_b}): Anzahl gemeinsamer Pods} für Spieler aus player_ids.
+
+    Eine Abfrage: Runde-1-Matches der letzten `last_tournaments` Turniere
+    (über den Index auf tournaments.created_at), gruppiert nach Turnier und
+    group_key im Speicher.
+    """
+    wanted = {player_id for player_id in player_ids if player_id}
+    if len(wanted) < 2 or last_tournaments <= 0:
+        return {}
+
+    recent = select(Tournament.id).order_by(Tournament.created_at.desc())
+    if exclude_tournament_id:
+        recent = recent.where(Tournament.id != exclude_tournament_id)
+    recent = recent.limit(int(last_tournaments)).subquery()
+
+    rows = db.session.execute(
+        select(Round.tournament_id, Match.group_key, Match.player1_id, Match.player2_id)
+        .join(Match, Match.round_id == Round.id)
+        .where(Round.number == 1, Round.tournament_id.in_(select(recent.c.id)))
+    ).all()
+
+    pods = defaultdict(set)
+    for tournament_id, group_key, player1_id, player2_id in rows:
+        members = pods[(tournament_id, group_key or "")]
+        for player_id in (player1_id, player2_id):
+            if player_id in wanted:
+                members.add(player_id)
+
+    weights = defaultdict(int)
+    for members in pods.values():
+        ordered = sorted(members)
+        for index, player_a in enumerate(ordered):
+            for player_b in ordered[index + 1:]:
+                weights[frozenset((player_a, player_b))] += 1
+    return dict(weights)
+
+
+def coseating_weights_by_name(players_by_name, last_tournaments=DEFAULT_HISTORY_TOURNAMENTS, exclude_tournament_id=None):
+    """Wie load_coseating_history, aber mit Spielernamen statt IDs ({Name: Player})."""
+    names_by_id = {row.id: name for name, row in players_by_name.items() if row is not None}
+    history = load_coseating_history(names_by_id, last_tournaments, exclude_tournament_id)
+    weights = {}
+    for pair, count in history.items():
+        player_a, player_b = tuple(pair)
+        weights[frozenset((names_by_id[player_a], names_by_id[player_b]))] = count
+    return weights
+
+
+def seating_cost(pods, weights):
+    """Summe der Gewichte aller Paare, die im selben Pod sitzen."""
+    total = 0
+    for pod in pods:
+        for index, player_a in enumerate(pod):
+            for player_b in pod[index + 1:]:
+                total += weights.get(frozenset((player_a, player_b)), 0)
+    return total
+
+
+def optimize_seating(players, pod_sizes, weights, time_budget_ms=DEFAULT_TIME_BUDGET_MS, seed=0, max_steps=None):
+    """Verteilt `players` auf Pods der Größen `pod_sizes` und liefert die Pods als Listen.
+
+    Startpunkt ist die Reihenfolge von `players` (z.B. ein stabiler Shuffle),
+    aufgeteilt nach pod_sizes; ohne Historie bleibt sie unverändert. Die
+    Reihenfolge innerhalb eines Pods folgt dieser Startreihenfolge.
+    """
+    players = list(players)
+    pod_sizes = [int(size) for size in pod_sizes]
+    if sum(pod_sizes) != len(players):
+        raise ValueError("Pod-Größen passen nicht zur Spielerzahl.")
+
+    pod_of = {}
+    start = 0
+    for pod_index, size in enumerate(pod_sizes):
+        for player in players[start:start + size]:
+            pod_of[player] = pod_index
+        start += size
+
+    # Nachbarschaft nur für Spieler dieses Rosters, ohne Null-Gewichte.
+    neighbours = defaultdict(dict)
+    for pair, weight in weights.items():
+        if weight <= 0 or len(pair) != 2:
+            continue
+        player_a, player_b = tuple(pair)
+        if player_a in pod_of and player_b in pod_of:
+            neighbours[player_a][player_b] = weight
+            neighbours[player_b][player_a] = weight
+
+    if len(pod_sizes) < 2 or not neighbours:
+        return _pods_in_start_order(players, pod_of, len(pod_sizes))
+
+    # load[p][k]: Summe der Gewichte von p zu allen Spielern in Pod k.
+    load = {player: [0] * len(pod_sizes) for player in players}
+    cost = 0
+    for player, adjacent in neighbours.items():
+        for other, weight in adjacent.items():
+            load[player][pod_of[other]] += weight
+            if pod_of[other] == pod_of[player] and player < other:
+                cost += weight
+
+    rng = random.Random(seed)
+    candidates = [player for player in players if player in neighbours]
+    best_cost = cost
+    best_assignment = dict(pod_of)
+    budget = max(0.0, float(time_budget_ms)) / 1000.0
+    started = time.perf_counter()
+    initial_temperature = max(1.0, max(max(adjacent.values()) for adjacent in neighbours.values()))
+    steps = 0
+
+    while best_cost > 0:
+        if max_steps is not None and steps >= max_steps:
+            break
+        if steps % 256 == 0:
+            elapsed = time.perf_counter() - started
+            if elapsed >= budget:
+                break
+            temperature = initial_temperature * (1.0 - elapsed / budget) + 1e-3
+        steps += 1
+
+        # Einer der Tauschpartner hat Historie, sonst ändert der Tausch nichts.
+        player_a = rng.choice(candidates)
+        player_b = rng.choice(players)
+        pod_a, pod_b = pod_of[player_a], pod_of[player_b]
+        if pod_a == pod_b:
+            continue
+        shared = neighbours[player_a].get(player_b, 0)
+        delta = (
+            load[player_b][pod_a] - shared - load[player_a][pod_a]
+            + load[player_a][pod_b] - shared - load[player_b][pod_b]
+        )
+        if delta > 0 and rng.random() >= math.exp(-delta / temperature):
+            continue
+
+        for other, weight in neighbours[player_a].items():
+            load[other][pod_a] -= weight
+            load[other][pod_b] += weight
+        for other, weight in neighbours[player_b].items():
+            load[other][pod_b] -= weight
+            load[other][pod_a] += weight
+        pod_of[player_a], pod_of[player_b] = pod_b, pod_a
+        cost += delta
+        if cost < best_cost:
+            best_cost = cost
+            best_assignment = dict(pod_of)
+
+    return _pods_in_start_order(players, best_assignment, len(pod_sizes))
+
+
+def _pods_in_start_order(players, pod_of, pod_count):
+    pods = [[] for _ in range(pod_count)]
+    for player in players:
+        pods[pod_of[player]].append(player)
+    return pods
@@ -0,0 +1,61 @@
+"""Ereignis-Log pro Turnier für Live-Updates (Server-Sent Events).
+
+Schreibende Requests hängen kompakte Ereignisse an (Ergebnis gespeichert,
+Runde erstellt). Der SSE-Stream eines beliebigen Workers liest sie anhand der
+fortlaufenden ID nach; damit funktioniert Pub/Sub ohne zusätzlichen Broker
+über alle Gunicorn-Worker hinweg.
+"""
+
+import json
+
+from ..db import db
+from ..models import TournamentEvent
+
+
+EVENT_MATCH_RESULT = "match_result"
+EVENT_ROUND_CREATED = "round_created"
+EVENT_PAIRINGS_UPDATED = "pairings_updated"
+
+
+def publish_event(tournament_id, event_type, payload, commit=True):
+    row = TournamentEvent(
+        tournament_id=tournament_id,
+        event_type=event_type,
+        payload=json.dumps(payload or {}, ensure_ascii=False),
+    )
+    db.session.add(row)
+    if commit:
+        db.session.commit()
+    return row
+
+
+def latest_event_id(tournament_id):
+    value = (
+        db.session.query(db.func.max(TournamentEvent.id))
+        .filter(TournamentEvent.tournament_id == tournament_id)
+        .scalar()
+    )
+    return int(value or 0)
+
+
+def list_events_since(tournament_id, after_id=0, limit=200):
+    """Liefert Ereignisse mit ID > after_id als Dicts in Reihenfolge."""
+    rows = (
+        TournamentEvent.query
+        .filter(TournamentEvent.tournament_id == tournament_id, TournamentEvent.id > int(after_id or 0))
+        .order_by(TournamentEvent.id.asc())
+        .limit(limit)
+        .all()
+    )
+    events = []
+    for row in rows:
+        try:
+            payload = json.loads(row.payload or "{}")
+        except (TypeError, ValueError):
+            payload = {}
+        events.append({"id": row.id, "type": row.event_type, "data": payload})
+    return events
+
+
+def delete_events(tournament_id):
+    TournamentEvent.query.filter_by(tournament_id=tournament_id).delete(synchronize_session=False)
@@ -0,0 +1,179 @@
+"""Streaming-Export der Match-Historie als CSV oder JSON.
+
+Die Abfrage läuft mit `yield_per`: SQLAlchemy holt die Zeilen blockweise über
+einen serverseitigen Cursor (PostgreSQL) bzw. schrittweise aus SQLite, und die
+Serialisierer geben jeden Block sofort weiter. Speicherbedarf und Zeit bis
+zum ersten Byte hängen damit nicht vom Umfang der Historie ab.
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import aliased
+
+from ..db import db
+from ..models import Match, Player, Round, Tournament
+
+
+EXPORT_FORMATS = ("csv", "json")
+DEFAULT_CHUNK_SIZE = 1000
+EXPORT_COLUMNS = [
+    "tournament_id",
+    "group_id",
+    "cube_id",
+    "tournament_status",
+    "round",
+    "round_created_at",
+    "table",
+    "table_size",
+    "group_key",
+    "player1",
+    "player2",
+    "is_bye",
+    "score1",
+    "score2",
+    "score_draws",
+    "dropout1",
+    "dropout2",
+]
+
+
+def _parse_date(value, label):
+    text = (value or "").strip()
+    if not text:
+        return None
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        raise ValueError(f"Ungültiges Datum für '{label}' (erwartet JJJJ-MM-TT): {text}")
+
+
+def parse_export_filters(tournament_id=None, group_id=None, cube_id=None, date_from=None, date_to=None):
+    """Bereinigt die Filter; ValueError bei ungültigem Datum oder Zeitraum."""
+    filters = {
+        "tournament_id": (tournament_id or "").strip() or None,
+        "group_id": (group_id or "").strip() or None,
+        "cube_id": (cube_id or "").strip() or None,
+        "date_from": _parse_date(date_from, "from"),
+        "date_to": _parse_date(date_to, "to"),
+    }
+    if filters["date_from"] and filters["date_to"] and filters["date_from"] > filters["date_to"]:
+        raise ValueError("Der Zeitraum ist leer: 'from' liegt nach 'to'.")
+    return filters
+
+
+def match_history_query(tournament_id=None, group_id=None, cube_id=None, date_from=None, date_to=None):
+    """Select über Matches mit Turnier-/Rundenkontext, stabil sortiert.
+
+    Der Zeitraum bezieht sich auf das Erstellungsdatum der Runde (inklusive
+    beider Grenzen).
+    """
+    player1 = aliased(Player)
+    player2 = aliased(Player)
+    stmt = (
+        select(
+            Tournament.id.label("tournament_id"),
+            Tournament.group_id.label("group_id"),
+            Tournament.cube_id.label("cube_id"),
+            Tournament.status.label("tournament_status"),
+            Round.number.label("round"),
+            Round.created_at.label("round_created_at"),
+            Match.table_number.label("table"),
+            Match.table_size.label("table_size"),
+            Match.group_key.label("group_key"),
+            func.coalesce(player1.name, Match.player1_name_snapshot).label("player1"),
+            func.coalesce(player2.name, Match.player2_name_snapshot).label("player2"),
+            Match.is_bye.label("is_bye"),
+            Match.score1.label("score1"),
+            Match.score2.label("score2"),
+            Match.score_draws.label("score_draws"),
+            Match.dropout1.label("dropout1"),
+            Match.dropout2.label("dropout2"),
+        )
+        .join(Round, Match.round_id == Round.id)
+        .join(Tournament, Round.tournament_id == Tournament.id)
+        .outerjoin(player1, Match.player1_id == player1.id)
+        .outerjoin(player2, Match.player2_id == player2.id)
+    )
+    if tournament_id:
+        stmt = stmt.where(Tournament.id == tournament_id)
+    if group_id:
+        stmt = stmt.where(Tournament.group_id == group_id)
+    if cube_id:
+        stmt = stmt.where(Tournament.cube_id == cube_id)
+    if date_from:
+        stmt = stmt.where(Round.created_at >= datetime.combine(date_from, time.min))
+    if date_to:
+        stmt = stmt.where(Round.created_at < datetime.combine(date_to + timedelta(days=1), time.min))
+    return stmt.order_by(Tournament.created_at, Tournament.id, Round.number, Match.table_number)
+
+
+def iter_match_history(filters, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Liefert Export-Zeilen als Dicts, blockweise aus der DB gelesen."""
+    stmt = match_history_query(**filters).execution_options(yield_per=max(1, int(chunk_size)))
+    result = db.session.execute(stmt)
+    try:
+        for row in result:
+            payload = dict(row._mapping)
+            if payload["is_bye"]:
+                payload["player2"] = "BYE"
+            yield payload
+    finally:
+        result.close()
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        # Gleiche Schreibweise wie in den Rundendateien.
+        return "true" if value else "false"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def iter_csv(rows, chunk_size=DEFAULT_CHUNK_SIZE):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    pending = 0
+    for row in rows:
+        writer.writerow([_csv_value(row[column]) for column in EXPORT_COLUMNS])
+        pending += 1
+        if pending >= chunk_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+    yield buffer.getvalue()
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Nicht serialisierbar: {type(value).__name__}")
+
+
+def iter_json(rows, chunk_size=DEFAULT_CHUNK_SIZE):
+    """JSON-Array, das Element für Element geschrieben wird."""
+    parts = ["["]
+    separator = ""
+    for row in rows:
+        parts.append(separator + json.dumps(row, ensure_ascii=False, default=_json_default))
+        separator = ","
+        if len(parts) >= chunk_size:
+            yield "".join(parts)
+            parts = []
+    parts.append("]")
+    yield "".join(parts)
+
+
+def stream_export(export_format, filters, chunk_size=DEFAULT_CHUNK_SIZE):
+    rows = iter_match_history(filters, chunk_size=chunk_size)
+    if export_format == "json":
+        return iter_json(rows, chunk_size=chunk_size)
+    return iter_csv(rows, chunk_size=chunk_size)
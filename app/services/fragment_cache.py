@@ -0,0 +1,93 @@
+"""Prozesslokaler LRU-Cache für gerenderte Template-Fragmente.
+
+Die Schlüssel enthalten den Versionsstempel aus `data_versions`; ein Worker
+liefert daher nie HTML aus, das ein anderer Worker inzwischen überholt hat.
+Schreibpfade verwerfen zusätzlich die lokalen Einträge des betroffenen
+Turniers, damit veraltete Fragmente nicht bis zur LRU-Verdrängung Speicher
+belegen.
+"""
+
+import threading
+from collections import OrderedDict
+
+from flask import current_app
+from markupsafe import Markup, escape
+
+
+# Platzhalter für csrf_token() in gecachten Fragmenten; wird pro Request ersetzt.
+CSRF_SENTINEL = "__FRAGMENT_CSRF_TOKEN__"
+_EXTENSION_KEY = "fragment_cache"
+
+
+class FragmentCache:
+    def __init__(self, max_entries=256):
+        self.max_entries = max(1, int(max_entries))
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            html = self._entries.get(key)
+            if html is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return html
+
+    def set(self, key, html):
+        with self._lock:
+            self._entries[key] = html
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, scope):
+        """Entfernt alle Einträge, deren Schlüssel mit (scope, ...) beginnt."""
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == scope]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def get_fragment_cache(app=None):
+    app = app or current_app
+    cache = app.extensions.get(_EXTENSION_KEY)
+    if cache is None:
+        cache = FragmentCache(app.config.get("FRAGMENT_CACHE_MAX_ENTRIES", 256))
+        app.extensions[_EXTENSION_KEY] = cache
+    return cache
+
+
+def cached_fragment(key, render_fn, csrf_token=None):
+    """Liefert das Fragment zu `key`, rendert es bei Bedarf über render_fn().
+
+    render_fn erhält den CSRF-Platzhalter und muss ihn anstelle des echten
+    Tokens verwenden; vor der Auslieferung wird er durch `csrf_token` ersetzt.
+    """
+    cache = get_fragment_cache()
+    html = None
+    if current_app.config.get("FRAGMENT_CACHE_ENABLED", True):
+        html = cache.get(key)
+        if html is None:
+            html = str(render_fn(CSRF_SENTINEL))
+            cache.set(key, html)
+    else:
+        html = str(render_fn(CSRF_SENTINEL))
+    if csrf_token is not None:
+        html = html.replace(CSRF_SENTINEL, str(escape(csrf_token)))
+    return Markup(html)
+
+
+def invalidate_fragments(scope):
+    return get_fragment_cache().invalidate(scope)
@@ -0,0 +1,147 @@
+"""Direktvergleiche (Head-to-Head) zwischen Spielern.
+
+Eine gruppierte Abfrage über `matches` liefert für jedes Spielerpaar, das im
+Filter (Gruppe/Cube) gegeneinander gespielt hat, Siege, Niederlagen,
+Unentschieden und Spiele. Jedes Match erscheint dafür zweimal (aus Sicht
+beider Spieler, UNION ALL) und wird nach (Spieler, Gegner) gruppiert.
+
+Das Ergebnis ist dünn besetzt: nur gespielte Paarungen, als
+{Spieler: {Gegner: Bilanz}}. Es liegt pro Filter und Versionsstempel der
+Spielerliste im prozesslokalen Fragment-Cache; Profil und Matrix teilen sich
+denselben Eintrag.
+"""
+
+from flask import current_app
+from sqlalchemy import case, func, select, union_all
+from sqlalchemy.orm import aliased
+
+from ..db import db
+from ..models import Match, Player, Round, Tournament
+from .fragment_cache import get_fragment_cache
+from .versions import PLAYERS_SCOPE, get_versions
+
+
+def _perspective(player_column, opponent_column, won_column, lost_column, group_id, cube_id):
+    stmt = (
+        select(
+            player_column.label("player_id"),
+            opponent_column.label("opponent_id"),
+            won_column.label("won"),
+            lost_column.label("lost"),
+            func.coalesce(Match.score_draws, 0).label("drawn"),
+        )
+        .join(Round, Match.round_id == Round.id)
+        .join(Tournament, Round.tournament_id == Tournament.id)
+        .where(
+            Match.is_bye.is_(False),
+            Match.player1_id.isnot(None),
+            Match.player2_id.isnot(None),
+            Match.score1.isnot(None),
+            Match.score2.isnot(None),
+        )
+    )
+    if group_id:
+        stmt = stmt.where(Tournament.group_id == group_id)
+    if cube_id:
+        stmt = stmt.where(Tournament.cube_id == cube_id)
+    return stmt
+
+
+def head_to_head_query(group_id=None, cube_id=None):
+    """Gruppierte Abfrage: eine Zeile pro (Spieler, Gegner) mit Bilanz und Namen."""
+    both = union_all(
+        _perspective(Match.player1_id, Match.player2_id, Match.score1, Match.score2, group_id, cube_id),
+        _perspective(Match.player2_id, Match.player1_id, Match.score2, Match.score1, group_id, cube_id),
+    ).subquery()
+    player = aliased(Player)
+    opponent = aliased(Player)
+    return (
+        select(
+            player.name.label("player"),
+            opponent.name.label("opponent"),
+            func.count().label("matches"),
+            func.sum(case((both.c.won > both.c.lost, 1), else_=0)).label("wins"),
+            func.sum(case((both.c.won < both.c.lost, 1), else_=0)).label("losses"),
+            func.sum(case((both.c.won == both.c.lost, 1), else_=0)).label("draws"),
+            func.sum(both.c.won).label("games_won"),
+            func.sum(both.c.lost).label("games_lost"),
+            func.sum(both.c.drawn).label("games_drawn"),
+        )
+        .join(player, player.id == both.c.player_id)
+        .join(opponent, opponent.id == both.c.opponent_id)
+        .group_by(player.name, opponent.name)
+    )
+
+
+def compute_head_to_head(group_id=None, cube_id=None):
+    """{Spieler: {Gegner: Bilanz}} aus einer Abfrage, ohne Cache."""
+    rows = {}
+    for row in db.session.execute(head_to_head_query(group_id, cube_id)):
+        rows.setdefault(row.player, {})[row.opponent] = {
+            "matches": int(row.matches or 0),
+            "wins": int(row.wins or 0),
+            "losses": int(row.losses or 0),
+            "draws": int(row.draws or 0),
+            "games_won": int(row.games_won or 0),
+            "games_lost": int(row.games_lost or 0),
+            "games_drawn": int(row.games_drawn or 0),
+        }
+    return rows
+
+
+def get_head_to_head(group_id=None, cube_id=None):
+    """Wie compute_head_to_head, zwischengespeichert pro Filter und Spielerlisten-Version.
+
+    Das Ergebnis ist geteilt und darf nicht verändert werden.
+    """
+    if not current_app.config.get("FRAGMENT_CACHE_ENABLED", True):
+        return compute_head_to_head(group_id, cube_id)
+    version = get_versions([PLAYERS_SCOPE])[PLAYERS_SCOPE][0]
+    key = (PLAYERS_SCOPE, "head_to_head", version, group_id or "", cube_id or "")
+    cache = get_fragment_cache()
+    rows = cache.get(key)
+    if rows is None:
+        rows = compute_head_to_head(group_id, cube_id)
+        cache.set(key, rows)
+    return rows
+
+
+def player_head_to_head(player_name, group_id=None, cube_id=None):
+    """Bilanz eines Spielers gegen jeden Gegner, meistgespielte Gegner zuerst."""
+    records = get_head_to_head(group_id, cube_id).get(player_name, {})
+    return sorted(
+        ({"opponent": opponent, **record} for opponent, record in records.items()),
+        key=lambda entry: (-entry["matches"], entry["opponent"].lower()),
+    )
+
+
+def head_to_head_page(group_id=None, cube_id=None, page=1, col_page=1, per_page=20):
+    """Ausschnitt der Matrix: Zeilen- und Spaltenseite über die sortierte Spielerliste.
+
+    Zellen werden nur für gespielte Paarungen geliefert (dünn besetzt).
+    """
+    rows = get_head_to_head(group_id, cube_id)
+    players = sorted(rows, key=str.lower)
+    per_page = max(1, int(per_page))
+    pages = max(1, -(-len(players) // per_page))
+    page = min(max(1, int(page)), pages)
+    col_page = min(max(1, int(col_page)), pages)
+    row_players = players[(page - 1) * per_page:page * per_page]
+    column_players = players[(col_page - 1) * per_page:col_page * per_page]
+    columns = set(column_players)
+    cells = [
+        {"player": player, "opponent": opponent, **record}
+        for player in row_players
+        for opponent, record in sorted(rows[player].items())
+        if opponent in columns
+    ]
+    return {
+        "players": row_players,
+        "columns": column_players,
+        "cells": cells,
+        "page": page,
+        "col_page": col_page,
+        "pages": pages,
+        "per_page": per_page,
+        "total_players": len(players),
+    }
@@ -0,0 +1,428 @@
+"""Einmaliger Import der Legacy-Dateien in die DB (`flask import-legacy`).
+
+Quellen:
+- `data/tournament_meta.json` (Gruppe, Cube, Pairing-Modus, Erstellzeit)
+- `data/<id>/rounds/round_N.csv` (Runden und Matches)
+- `data/<id>/end_time.txt` und `tournament_results/<id>_results.json` (Endstatus)
+- `data/<id>/tournament_power_nine.json` (Power-Nine pro Turnier)
+- `tournament_data/results.csv` für Turniere ohne Rundendateien
+- `tournament_archive/<id>.zip` für archivierte Turniere (gleiche Dateien,
+  zum Lesen in ein temporäres Verzeichnis entpackt; das Archiv bleibt)
+
+Turniere werden einzeln verarbeitet, results.csv zeilenweise gestreamt; der
+Speicherbedarf hängt damit nicht von der Gesamthistorie ab. Committet wird
+nach jeweils `batch_size` neuen Zeilen. Der Import ergänzt nur Fehlendes
+(Runde per Nummer, Match per Tischnummer, Power-Nine per Karte): bestehende
+DB-Zeilen bleiben unverändert, ein zweiter Lauf legt nichts doppelt an.
+"""
+
+import csv
+import json
+import os
+import tempfile
+import zipfile
+from datetime import datetime
+
+from ..db import db
+from ..models import Match, PlayerPowerNine, Round, Tournament
+from ..round_store import list_round_numbers, read_round_rows
+from ..tournament_archive import ARCHIVE_DIR, extract_bundle, load_index
+from .cubes import normalize_cube_value
+from .groups import normalize_group_id
+from .players import get_or_create_players
+from .versions import PLAYERS_SCOPE, TOURNAMENTS_SCOPE, bump_versions, tournament_scope
+
+
+DEFAULT_BATCH_SIZE = 500
+# Tournament.id ist String(36); längere Ordnernamen sind keine Turniere.
+_MAX_TOURNAMENT_ID_LENGTH = 36
+_LEGACY_DATE_FORMAT = "%d.%m.%Y %H:%M"
+_PAIRING_MODES = {"auto", "manual"}
+
+
+def _empty_summary():
+    return {
+        "tournaments": 0,
+        "rounds": 0,
+        "matches": 0,
+        "power_nine": 0,
+        "skipped_rows": 0,
+    }
+
+
+def _optional_int(value):
+    text = str(value if value is not None else "").strip()
+    if text == "":
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        return None
+
+
+def _parse_iso(value):
+    try:
+        parsed = datetime.fromisoformat(str(value))
+    except (TypeError, ValueError):
+        return None
+    return parsed.replace(tzinfo=None) if parsed.tzinfo else parsed
+
+
+def _parse_legacy_date(value):
+    try:
+        return datetime.strptime(str(value or "").strip(), _LEGACY_DATE_FORMAT)
+    except ValueError:
+        return None
+
+
+def _read_json(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _read_text(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+class _LegacyImporter:
+    def __init__(self, data_root, results_root, results_csv, batch_size, progress, archive_dir=ARCHIVE_DIR):
+        self.data_root = data_root
+        self.results_root = results_root
+        self.results_csv = results_csv
+        self.archive_dir = archive_dir
+        self.batch_size = max(1, int(batch_size))
+        self.progress = progress or (lambda stage, done, total: None)
+        self.summary = _empty_summary()
+        self.meta = _read_json(os.path.join(data_root, "tournament_meta.json"))
+        self.touched = set()
+        self._pending = 0
+        # (Turnier, Rundennummer) -> Round.id
+        self._round_ids = {}
+        # Turniere, deren Matches aus Rundendateien stammen.
+        self._from_round_files = set()
+        # Bereits abgeglichene Turniere (results.csv nennt jedes Turnier vielfach).
+        self._ensured = set()
+
+    def _added(self, key, count=1):
+        self.summary[key] += count
+        self._pending += count
+        if self._pending >= self.batch_size:
+            self._commit()
+
+    def _commit(self):
+        db.session.commit()
+        self._pending = 0
+
+    def _tournament_ids(self):
+        ids = set()
+        if os.path.isdir(self.data_root):
+            for name in os.listdir(self.data_root):
+                path = os.path.join(self.data_root, name)
+                if not os.path.isdir(path):
+                    continue
+                if os.path.isdir(os.path.join(path, "rounds")) or os.path.exists(os.path.join(path, "end_time.txt")):
+                    ids.add(name)
+        if os.path.isdir(self.results_root):
+            for name in os.listdir(self.results_root):
+                if name.endswith("_results.json"):
+                    ids.add(name[: -len("_results.json")])
+        ids.update(self._archived_ids())
+        return sorted(tid for tid in ids if 0 < len(tid) <= _MAX_TOURNAMENT_ID_LENGTH)
+
+    def _archived_ids(self):
+        """Archivierte Turniere, deren Live-Dateien nicht mehr existieren."""
+        return {
+            tid
+            for tid in load_index(self.archive_dir)
+            if not os.path.isdir(os.path.join(self.data_root, tid))
+            and not os.path.exists(os.path.join(self.results_root, f"{tid}_results.json"))
+        }
+
+    def _ensure_tournament(self, tournament_id, results_payload=None, tournament_dir=None):
+        """Legt fehlende Turniere an; bestehende erhalten nur Endstatus und Pairing-Modus."""
+        meta = self.meta.get(tournament_id) or {}
+        tournament_data = (results_payload or {}).get("tournament_data") or {}
+        tournament_dir = tournament_dir or os.path.join(self.data_root, tournament_id)
+        end_time_file = os.path.join(tournament_dir, "end_time.txt")
+        end_text = _read_text(end_time_file)
+        ended = os.path.exists(end_time_file) or bool(results_payload)
+        ended_at = _parse_legacy_date(end_text) or _parse_legacy_date(tournament_data.get("end_date"))
+        pairing_mode = meta.get("pairing_mode") if meta.get("pairing_mode") in _PAIRING_MODES else None
+
+        row = db.session.get(Tournament, tournament_id)
+        if row is None:
+            row = Tournament(
+                id=tournament_id,
+                group_id=normalize_group_id(meta.get("group_id") or tournament_data.get("group_id")),
+                cube_id=normalize_cube_value(
+                    meta.get("cube_id") or meta.get("cube") or tournament_data.get("cube_id")
+                ),
+                status="ended" if ended else "running",
+                current_round=1,
+                pairing_mode=pairing_mode,
+                ended_at=ended_at if ended else None,
+            )
+            created_at = _parse_iso(meta.get("created_at"))
+            if created_at is not None:
+                row.created_at = created_at
+            db.session.add(row)
+            db.session.flush()
+            self.touched.add(tournament_id)
+            self._added("tournaments")
+            return row
+
+        if ended and row.status != "ended":
+            row.status = "ended"
+            row.ended_at = row.ended_at or ended_at
+            self.touched.add(tournament_id)
+        if pairing_mode and not row.pairing_mode:
+            row.pairing_mode = pairing_mode
+            self.touched.add(tournament_id)
+        return row
+
+    def _round_id(self, tournament, round_number):
+        key = (tournament.id, round_number)
+        round_id = self._round_ids.get(key)
+        if round_id is not None:
+            return round_id
+        row = Round.query.filter_by(tournament_id=tournament.id, number=round_number).first()
+        if row is None:
+            row = Round(tournament_id=tournament.id, number=round_number)
+            db.session.add(row)
+            db.session.flush()
+            self.touched.add(tournament.id)
+            self._added("rounds")
+        if (tournament.current_round or 1) < round_number:
+            tournament.current_round = round_number
+        self._round_ids[key] = row.id
+        return row.id
+
+    def _insert_missing_matches(self, round_id, tournament_id, match_values):
+        """match_values: [(table_number, values)]; fügt nur neue Tischnummern ein."""
+        existing_tables = {
+            table for (table,) in db.session.query(Match.table_number).filter(Match.round_id == round_id)
+        }
+        added = 0
+        for table_number, values in match_values:
+            if table_number in existing_tables:
+                continue
+            existing_tables.add(table_number)
+            db.session.add(Match(round_id=round_id, table_number=table_number, **values))
+            added += 1
+        if added:
+            self.touched.add(tournament_id)
+            self._added("matches", added)
+
+    def _match_values(self, players, player1_name, player2_name, score1, score2, draws,
+                      table_size=0, group_key="", dropout1=False, dropout2=False):
+        p1 = players.get(player1_name)
+        is_bye = player2_name == "BYE"
+        p2 = None if is_bye else players.get(player2_name)
+        return {
+            "table_size": table_size,
+            "group_key": group_key,
+            "player1_id": p1.id if p1 else None,
+            "player2_id": p2.id if p2 else None,
+            "player1_name_snapshot": player1_name or None,
+            "player2_name_snapshot": None if is_bye else (player2_name or None),
+            "is_bye": is_bye,
+            "score1": score1,
+            "score2": score2,
+            "score_draws": draws,
+            "dropout1": dropout1,
+            "dropout2": dropout2,
+        }
+
+    def _import_round_files(self, tournament, tournament_dir):
+        rounds_dir = os.path.join(tournament_dir, "rounds")
+        for round_number in sorted(list_round_numbers(rounds_dir)):
+            try:
+                rows = read_round_rows(os.path.join(rounds_dir, f"round_{round_number}.csv"))
+            except (OSError, csv.Error, UnicodeDecodeError):
+                self.summary["skipped_rows"] += 1
+                continue
+            self._from_round_files.add(tournament.id)
+            names = []
+            for row in rows:
+                names.append(row.get("player1"))
+                if (row.get("player2") or "").strip() != "BYE":
+                    names.append(row.get("player2"))
+            players = get_or_create_players(names)
+
+            match_values = []
+            for row in rows:
+                player1_name = (row.get("player1") or "").strip()
+                table_number = _optional_int(row.get("table"))
+                if not player1_name or table_number is None:
+                    self.summary["skipped_rows"] += 1
+                    continue
+                match_values.append((table_number, self._match_values(
+                    players,
+                    player1_name,
+                    (row.get("player2") or "").strip(),
+                    _optional_int(row.get("score1")),
+                    _optional_int(row.get("score2")),
+                    _optional_int(row.get("score_draws")),
+                    table_size=_optional_int(row.get("table_size")) or 0,
+                    group_key=(row.get("group_key") or "")[:32],
+                    dropout1=str(row.get("dropout1") or "").strip().lower() == "true",
+                    dropout2=str(row.get("dropout2") or "").strip().lower() == "true",
+                )))
+            self._insert_missing_matches(self._round_id(tournament, round_number), tournament.id, match_values)
+
+    def _import_power_nine(self, tournament, tournament_dir):
+        payload = _read_json(os.path.join(tournament_dir, "tournament_power_nine.json"))
+        if not payload:
+            return
+        players = get_or_create_players(payload.keys())
+        existing = {
+            (player_id, card_name)
+            for player_id, card_name in db.session.query(PlayerPowerNine.player_id, PlayerPowerNine.card_name)
+            .filter(PlayerPowerNine.tournament_id == tournament.id)
+        }
+        for player_name, cards in payload.items():
+            player = players.get((player_name or "").strip())
+            if player is None or not isinstance(cards, dict):
+                continue
+            for card_name, has_card in cards.items():
+                if not isinstance(card_name, str) or (player.id, card_name) in existing:
+                    continue
+                existing.add((player.id, card_name))
+                db.session.add(PlayerPowerNine(
+                    tournament_id=tournament.id,
+                    player_id=player.id,
+                    card_name=card_name[:64],
+                    has_card=bool(has_card),
+                ))
+                self.touched.add(tournament.id)
+                self._added("power_nine")
+
+    def _import_tournament(self, tournament_id, data_root, results_root):
+        tournament_dir = os.path.join(data_root, tournament_id)
+        results_payload = _read_json(os.path.join(results_root, f"{tournament_id}_results.json"))
+        tournament = self._ensure_tournament(tournament_id, results_payload, tournament_dir)
+        self._ensured.add(tournament_id)
+        self._import_round_files(tournament, tournament_dir)
+        self._import_power_nine(tournament, tournament_dir)
+
+    def _import_archived_tournament(self, tournament_id):
+        with tempfile.TemporaryDirectory(prefix="legacy-import-") as scratch:
+            data_root = os.path.join(scratch, "data")
+            results_root = os.path.join(scratch, "tournament_results")
+            try:
+                extract_bundle(tournament_id, data_root, results_root, self.archive_dir)
+            except (OSError, ValueError, zipfile.BadZipFile):
+                self.summary["skipped_rows"] += 1
+                return
+            self._import_tournament(tournament_id, data_root, results_root)
+
+    def import_tournaments(self):
+        tournament_ids = self._tournament_ids()
+        archived_ids = self._archived_ids()
+        total = len(tournament_ids)
+        for index, tournament_id in enumerate(tournament_ids, start=1):
+            if tournament_id in archived_ids:
+                self._import_archived_tournament(tournament_id)
+            else:
+                self._import_tournament(tournament_id, self.data_root, self.results_root)
+            self.progress("tournaments", index, total)
+        self._commit()
+
+    def _flush_results_rows(self, rows):
+        players = get_or_create_players(
+            name for row in rows for name in (row["player1"], row["player2"]) if name and name != "BYE"
+        )
+        by_round = {}
+        for row in rows:
+            tournament_id = row["tournament_id"]
+            if tournament_id in self._ensured:
+                tournament = db.session.get(Tournament, tournament_id)
+            else:
+                tournament = self._ensure_tournament(tournament_id)
+                self._ensured.add(tournament_id)
+            round_id = self._round_id(tournament, row["round"])
+            by_round.setdefault((round_id, tournament.id), []).append((row["table"], self._match_values(
+                players, row["player1"], row["player2"], row["score1"], row["score2"], row["draws"],
+            )))
+        for (round_id, tournament_id), match_values in by_round.items():
+            self._insert_missing_matches(round_id, tournament_id, match_values)
+
+    def import_results_csv(self):
+        """Matches aus results.csv für Turniere, deren Rundendateien fehlen."""
+        if not os.path.exists(self.results_csv):
+            return
+        pending_rows = []
+        processed = 0
+        with open(self.results_csv, "r", newline="", encoding="utf-8") as f:
+            for raw in csv.DictReader(f):
+                processed += 1
+                tournament_id = (raw.get("Tournament") or "").strip()
+                if tournament_id in self._from_round_files:
+                    continue
+                round_number = _optional_int(raw.get("Round"))
+                table_number = _optional_int(raw.get("Table"))
+                player1_name = (raw.get("Player 1") or "").strip()
+                if (
+                    not tournament_id
+                    or len(tournament_id) > _MAX_TOURNAMENT_ID_LENGTH
+                    or not round_number
+                    or table_number is None
+                    or not player1_name
+                ):
+                    self.summary["skipped_rows"] += 1
+                    continue
+                pending_rows.append({
+                    "tournament_id": tournament_id,
+                    "round": round_number,
+                    "table": table_number,
+                    "player1": player1_name,
+                    "player2": (raw.get("Player 2") or "").strip(),
+                    "score1": _optional_int(raw.get("Score 1")),
+                    "score2": _optional_int(raw.get("Score 2")),
+                    "draws": _optional_int(raw.get("Draws")),
+                })
+                if len(pending_rows) >= self.batch_size:
+                    self._flush_results_rows(pending_rows)
+                    pending_rows = []
+                    self.progress("results", processed, None)
+        if pending_rows:
+            self._flush_results_rows(pending_rows)
+        self.progress("results", processed, None)
+        self._commit()
+
+    def finish(self):
+        if self.touched:
+            keys = [tournament_scope(tid) for tid in sorted(self.touched)]
+            bump_versions(keys + [TOURNAMENTS_SCOPE, PLAYERS_SCOPE])
+
+
+def import_legacy_data(
+    data_root="data",
+    results_root="tournament_results",
+    results_csv=os.path.join("tournament_data", "results.csv"),
+    batch_size=DEFAULT_BATCH_SIZE,
+    progress=None,
+    archive_dir=ARCHIVE_DIR,
+):
+    """Importiert die Legacy-Dateien und liefert die Anzahl neu angelegter Zeilen.
+
+    progress(stage, done, total) wird nach jedem Turnier bzw. results.csv-Batch
+    aufgerufen; total ist None, wo die Gesamtzahl vorab unbekannt ist.
+    """
+    importer = _LegacyImporter(data_root, results_root, results_csv, batch_size, progress, archive_dir)
+    try:
+        importer.import_tournaments()
+        importer.import_results_csv()
+        importer.finish()
+    except Exception:
+        db.session.rollback()
+        raise
+    return importer.summary
@@ -0,0 +1,115 @@
+"""Präfix-Index über Spielernamen für die Autovervollständigung.
+
+Die Startseite bettet nicht mehr alle bekannten Namen ein; Eingabefelder
+fragen stattdessen `/api/players/suggest` ab. Dahinter liegt pro Prozess ein
+sortiertes Array aus (normalisierter Schlüssel, Name), durchsucht per bisect:
+O(log n) bis zum ersten Treffer, danach höchstens `limit` Schritte.
+
+Schlüssel sind wie `normalize_name` (Gross-/Kleinschreibung, Diakritika,
+Leerraum egal). Neben dem vollen Namen wird jeder Wortanfang indexiert, damit
+"mul" auch "Hans Müller" findet. Der Index wird neu aufgebaut, sobald der
+Versionsstempel `player_names` (Spieler angelegt oder gelöscht) springt; so
+bleiben alle Gunicorn-Worker konsistent.
+
+Für den Hinweis "ähnlicher Name" (Tippfehler, auch in den ersten Zeichen)
+vergleicht `similar()` per difflib gegen alle normalisierten Namen des Index;
+das Frontend prüft die Kandidaten danach mit seiner eigenen Schwelle.
+"""
+
+import difflib
+import threading
+from bisect import bisect_left
+
+from flask import current_app
+
+from ..models import Player
+from .normalize import normalize_name
+from .versions import PLAYER_NAMES_SCOPE, get_versions
+
+
+DEFAULT_SUGGEST_LIMIT = 10
+MAX_SUGGEST_LIMIT = 50
+DEFAULT_SIMILAR_LIMIT = 5
+# Bewusst grosszügig: die Hinweis-Schwelle (Levenshtein) liegt im Frontend.
+SIMILAR_CUTOFF = 0.6
+_EXTENSION_KEY = "player_prefix_index"
+
+
+def _is_deleted_player_name(name):
+    return isinstance(name, str) and name.startswith("DELETED_PLAYER")
+
+
+class PlayerPrefixIndex:
+    def __init__(self, names=(), version=None):
+        self.version = version
+        entries = set()
+        # Normalisierter voller Name -> Name (für similar()).
+        self._names_by_key = {}
+        for name in sorted(name for name in names if name):
+            if _is_deleted_player_name(name):
+                continue
+            self._names_by_key.setdefault(normalize_name(name), name)
+            words = normalize_name(name).split(" ")
+            for start in range(len(words)):
+                entries.add((" ".join(words[start:]), name))
+        self._entries = sorted(entries)
+        self._keys = [key for key, _ in self._entries]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def search(self, query, limit=DEFAULT_SUGGEST_LIMIT):
+        """Bis zu `limit` Namen, deren voller Name oder ein Wort mit `query` beginnt."""
+        prefix = normalize_name(query)
+        if not prefix or limit <= 0:
+            return []
+        results = []
+        seen = set()
+        for index in range(bisect_left(self._keys, prefix), len(self._keys)):
+            if not self._keys[index].startswith(prefix):
+                break
+            name = self._entries[index][1]
+            if name in seen:
+                continue
+            seen.add(name)
+            results.append(name)
+            if len(results) >= limit:
+                break
+        return results
+
+    def similar(self, name, limit=DEFAULT_SIMILAR_LIMIT, cutoff=SIMILAR_CUTOFF):
+        """Bis zu `limit` bekannte Namen, die `name` ähneln, die ähnlichsten zuerst."""
+        key = normalize_name(name)
+        if not key or limit <= 0:
+            return []
+        matches = difflib.get_close_matches(key, self._names_by_key, n=limit, cutoff=cutoff)
+        return [self._names_by_key[match] for match in matches]
+
+
+_BUILD_LOCK = threading.Lock()
+
+
+def get_player_index(app=None):
+    """Aktueller Index dieses Prozesses; baut ihn nach einem Versionssprung neu."""
+    app = app or current_app
+    version = get_versions([PLAYER_NAMES_SCOPE])[PLAYER_NAMES_SCOPE][0]
+    index = app.extensions.get(_EXTENSION_KEY)
+    if index is not None and index.version == version:
+        return index
+    with _BUILD_LOCK:
+        index = app.extensions.get(_EXTENSION_KEY)
+        if index is None or index.version != version:
+            names = [name for (name,) in Player.query.with_entities(Player.name)]
+            index = PlayerPrefixIndex(names, version=version)
+            app.extensions[_EXTENSION_KEY] = index
+    return index
+
+
+def suggest_player_names(query, limit=DEFAULT_SUGGEST_LIMIT):
+    limit = min(MAX_SUGGEST_LIMIT, max(1, int(limit)))
+    return get_player_index().search(query, limit)
+
+
+def similar_player_names(name, limit=DEFAULT_SIMILAR_LIMIT):
+    limit = min(MAX_SUGGEST_LIMIT, max(1, int(limit)))
+    return get_player_index().similar(name, limit)
@@ -0,0 +1,238 @@
+"""Spielerliste (`/players`) als sortierte, seitenweise SQL-Abfrage.
+
+Statt pro Spieler `get_player_statistics` aufzurufen und alle Spieler in
+Python zu sortieren, liefert eine gruppierte Abfrage über `matches` die
+Kennzahlen aller Spieler im Filter (Gruppe/Cube). Sortierung, Mindestzahl an
+Matches und Paging laufen in derselben Abfrage; Python sieht nur die Zeilen
+der angezeigten Seite.
+
+Paging per Keyset: der Cursor enthält den Sortwert und den Namen der letzten
+Zeile, die nächste Seite beginnt strikt danach (Name als eindeutiger
+Tiebreaker). Die Gewinnrate wird dabei exakt über Kreuzmultiplikation der
+Ganzzahlen verglichen, nicht über gerundete Prozentwerte.
+
+Die Kennzahlen entsprechen `get_player_statistics`: gewertet wird jedes Match
+mit beiden Scores, Power Nine nur im Vintage-Filter und nur für Turniere, in
+denen der Spieler ein gewertetes Match hat.
+"""
+
+import base64
+import json
+
+from sqlalchemy import Float, and_, case, cast, distinct, func, literal, or_, select, union_all
+
+from ..db import db
+from ..models import Match, Player, PlayerPowerNine, Round, Tournament
+from ..player_stats import POWER_NINE
+
+
+SORT_OPTIONS = {
+    "win_rate": "Gewinnrate",
+    "matches": "Gespielte Matches",
+    "tournaments": "Gespielte Turniere",
+    "power_nine": "Power Nine",
+}
+DEFAULT_SORT = "win_rate"
+DEFAULT_ORDER = "desc"
+# Sortwerte im Cursor (ohne Namen): Gewinnrate als (Siege, Nenner), sonst ein Wert.
+_CURSOR_WIDTH = {"win_rate": 2}
+
+
+def sort_options(include_power_nine=False):
+    """Erlaubte Sortierungen; Power Nine nur im Vintage-Filter."""
+    return {key: label for key, label in SORT_OPTIONS.items() if include_power_nine or key != "power_nine"}
+
+
+def encode_cursor(values):
+    raw = json.dumps(values, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token):
+    """Werteliste aus einem Cursor oder None bei fehlendem/ungültigem Token."""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        values = json.loads(raw.decode("utf-8"))
+    except (ValueError, UnicodeDecodeError):
+        return None
+    if not isinstance(values, list) or not values or not isinstance(values[-1], str):
+        return None
+    if not all(isinstance(value, int) and not isinstance(value, bool) for value in values[:-1]):
+        return None
+    return values
+
+
+def _perspective(player_column, won_column, lost_column, group_id, cube_id):
+    stmt = (
+        select(
+            player_column.label("player_id"),
+            Round.tournament_id.label("tournament_id"),
+            case((won_column > lost_column, 1), else_=0).label("won"),
+        )
+        .join(Round, Match.round_id == Round.id)
+        .join(Tournament, Round.tournament_id == Tournament.id)
+        .where(
+            player_column.isnot(None),
+            Match.score1.isnot(None),
+            Match.score2.isnot(None),
+        )
+    )
+    if group_id:
+        stmt = stmt.where(Tournament.group_id == group_id)
+    if cube_id:
+        stmt = stmt.where(Tournament.cube_id == cube_id)
+    return stmt
+
+
+def player_stats_query(group_id=None, cube_id=None, include_power_nine=False, min_matches=0):
+    """Eine Zeile pro Spieler mit Matches, Siegen, Turnieren und Power Nine.
+
+    Spieler ohne Match im Filter erscheinen nur ohne Gruppen-/Cube-Filter
+    (wie bisher auf `/players`). Liefert (Abfrage, Spalten-Dict).
+    """
+    played = union_all(
+        _perspective(Match.player1_id, Match.score1, Match.score2, group_id, cube_id),
+        _perspective(Match.player2_id, Match.score2, Match.score1, group_id, cube_id),
+    ).subquery()
+    stats = (
+        select(
+            played.c.player_id,
+            func.count().label("matches"),
+            func.sum(played.c.won).label("wins"),
+            func.count(distinct(played.c.tournament_id)).label("tournaments"),
+        )
+        .group_by(played.c.player_id)
+        .subquery()
+    )
+    columns = {
+        "matches": func.coalesce(stats.c.matches, 0),
+        "wins": func.coalesce(stats.c.wins, 0),
+        "tournaments": func.coalesce(stats.c.tournaments, 0),
+    }
+    query = (
+        select(Player.id, Player.name)
+        .outerjoin(stats, stats.c.player_id == Player.id)
+        .where(~Player.name.startswith("DELETED_PLAYER"))
+    )
+
+    if include_power_nine:
+        attended = select(played.c.player_id, played.c.tournament_id).distinct().subquery()
+        power_nine = (
+            select(PlayerPowerNine.player_id, func.count().label("power_nine"))
+            .join(
+                attended,
+                and_(
+                    attended.c.player_id == PlayerPowerNine.player_id,
+                    attended.c.tournament_id == PlayerPowerNine.tournament_id,
+                ),
+            )
+            .join(Tournament, PlayerPowerNine.tournament_id == Tournament.id)
+            .where(
+                PlayerPowerNine.has_card.is_(True),
+                PlayerPowerNine.card_name.in_(POWER_NINE),
+                Tournament.cube_id == "vintage",
+            )
+            .group_by(PlayerPowerNine.player_id)
+            .subquery()
+        )
+        query = query.outerjoin(power_nine, power_nine.c.player_id == Player.id)
+        columns["power_nine"] = func.coalesce(power_nine.c.power_nine, 0)
+    else:
+        columns["power_nine"] = literal(0)
+
+    required_matches = max(int(min_matches or 0), 1 if (group_id or cube_id) else 0)
+    if required_matches:
+        query = query.where(columns["matches"] >= required_matches)
+    query = query.add_columns(*(column.label(name) for name, column in columns.items()))
+    return query, columns
+
+
+def _sort_terms(sort, columns):
+    """(ORDER-BY-Ausdruck, Vergleich gegen Cursorwerte, Cursorwerte einer Zeile)."""
+    if sort == "win_rate":
+        denominator = case((columns["matches"] > 0, columns["matches"]), else_=1)
+        order_by = cast(columns["wins"], Float) / denominator
+
+        def compare(values):
+            # wins/d < w0/d0  <=>  wins*d0 < w0*d  (Ganzzahlen, exakt)
+            wins0, denominator0 = values
+            return columns["wins"] * denominator0, literal(wins0) * denominator
+
+        def cursor_values(row):
+            return [int(row.wins), max(1, int(row.matches))]
+
+        return order_by, compare, cursor_values
+
+    column = columns[sort]
+
+    def compare(values):
+        return column, literal(values[0])
+
+    def cursor_values(row):
+        return [int(getattr(row, sort))]
+
+    return column, compare, cursor_values
+
+
+def players_page(
+    group_id=None,
+    cube_id=None,
+    sort=DEFAULT_SORT,
+    order=DEFAULT_ORDER,
+    min_matches=0,
+    after=None,
+    per_page=50,
+):
+    """Eine Seite der Spielerliste samt Cursor für die nächste Seite.
+
+    `after` ist der `next_cursor` der vorherigen Seite (None = erste Seite).
+    Liefert {"players": [...], "next_cursor", "sort", "order", ...}; jede
+    Zeile enthält id, name, total_matches, matches_won, match_win_percentage,
+    tournaments_played und power_nine_count.
+    """
+    include_power_nine = cube_id == "vintage"
+    if sort not in sort_options(include_power_nine):
+        sort = DEFAULT_SORT
+    order = "asc" if order == "asc" else DEFAULT_ORDER
+    per_page = max(1, int(per_page))
+
+    query, columns = player_stats_query(group_id, cube_id, include_power_nine, min_matches)
+    order_by, compare, cursor_values = _sort_terms(sort, columns)
+
+    cursor = decode_cursor(after)
+    if cursor is not None and len(cursor) == _CURSOR_WIDTH.get(sort, 1) + 1:
+        left, right = compare(cursor[:-1])
+        beyond = left > right if order == "asc" else left < right
+        query = query.where(or_(beyond, and_(left == right, Player.name > cursor[-1])))
+
+    query = query.order_by(order_by.asc() if order == "asc" else order_by.desc(), Player.name.asc())
+    rows = db.session.execute(query.limit(per_page + 1)).all()
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+
+    players = []
+    for row in rows:
+        total_matches = int(row.matches)
+        wins = int(row.wins)
+        players.append({
+            "id": row.id,
+            "name": row.name,
+            "total_matches": total_matches,
+            "matches_won": wins,
+            "match_win_percentage": round(wins / total_matches * 100, 1) if total_matches else 0.0,
+            "tournaments_played": int(row.tournaments),
+            "power_nine_count": int(row.power_nine),
+        })
+
+    return {
+        "players": players,
+        "next_cursor": encode_cursor(cursor_values(rows[-1]) + [rows[-1].name]) if has_more else None,
+        "is_first_page": cursor is None,
+        "sort": sort,
+        "order": order,
+        "min_matches": max(0, int(min_matches or 0)),
+        "per_page": per_page,
+    }
+
@@ -3,6 +3,7 @@ from sqlalchemy.exc import IntegrityError
 from ..db import db
 from ..models import Player
 from .normalize import normalize_name
+from .versions import PLAYER_NAMES_SCOPE, bump_versions
 
 
 def _is_deleted_player_name(name: str) -> bool:
@@ -26,9 +27,59 @@ def get_or_create_player(player_name):
             db.session.add(row)
     except IntegrityError:
         return Player.query.filter_by(normalized_name=normalized).first()
+    bump_versions([PLAYER_NAMES_SCOPE], commit=False)
     return row
 
 
+def get_or_create_players(player_names):
+    """Löst viele Namen auf einmal auf: {bereinigter Name: Player}.
+
+    Bestehende Spieler kommen aus einer IN-Abfrage, fehlende werden in einem
+    Savepoint gesammelt eingefügt. Namen, die auf denselben normalisierten
+    Namen fallen, teilen sich einen Spieler. Legt ein paralleler Start
+    dieselben Spieler an, wird genau einmal neu gelesen und der Rest erneut
+    eingefügt.
+    """
+    cleaned_by_normalized = {}
+    for raw_name in player_names:
+        cleaned = (raw_name or "").strip()
+        if cleaned:
+            cleaned_by_normalized.setdefault(normalize_name(cleaned), []).append(cleaned)
+    if not cleaned_by_normalized:
+        return {}
+
+    players_by_normalized = {}
+    pending = list(cleaned_by_normalized)
+    for attempt in range(2):
+        players_by_normalized.update(
+            (row.normalized_name, row)
+            for row in Player.query.filter(Player.normalized_name.in_(pending)).all()
+        )
+        pending = [normalized for normalized in pending if normalized not in players_by_normalized]
+        if not pending:
+            break
+        new_rows = [Player(name=cleaned_by_normalized[normalized][0], normalized_name=normalized) for normalized in pending]
+        try:
+            with db.session.begin_nested():
+                db.session.add_all(new_rows)
+        except IntegrityError:
+            if attempt:
+                raise
+            continue
+        players_by_normalized.update(zip(pending, new_rows))
+        bump_versions([PLAYER_NAMES_SCOPE], commit=False)
+        break
+
+    resolved = {}
+    for normalized, names in cleaned_by_normalized.items():
+        row = players_by_normalized.get(normalized)
+        if row is None:
+            continue
+        for cleaned in names:
+            resolved[cleaned] = row
+    return resolved
+
+
 def list_player_names():
     rows = Player.query.order_by(Player.name.asc()).all()
     return [row.name for row in rows if row.name and not _is_deleted_player_name(row.name)]
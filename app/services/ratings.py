@@ -0,0 +1,269 @@
+"""Elo-Wertungen über die Match-Historie, pro Gesamt, Cube, Gruppe und Gruppe+Cube.
+
+Jedes gewertete Match (beide Scores gesetzt, kein BYE) verschiebt die Wertung
+beider Spieler in vier Scopes: `all`, `cube:<id>`, `group:<id>` und
+`group:<id>|cube:<id>`. Die Wertungen liegen in `player_ratings`; die
+angewendete Verschiebung pro Match und Scope in `match_rating_deltas`, damit
+eine Korrektur das alte Ergebnis zurücknehmen und das neue anwenden kann.
+Ansichten lesen nur `player_ratings` und scannen die Historie nicht.
+
+Deltas sind über (Turnier, Match-ID) verschlüsselt: SQLite vergibt IDs
+gelöschter Matches neu, Turnier-IDs (UUID) nicht. Wer Matches löscht, ruft
+vorher `revert_match_ratings` auf, damit deren Wertung zurückgenommen wird.
+
+Inkrementelle Updates folgen der Eingabereihenfolge der Ergebnisse.
+`flask recompute-ratings` rechnet alles in chronologischer Reihenfolge
+(Turnierstart, Runde, Tisch) neu und liest die Matches dabei blockweise.
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+
+from ..db import db
+from ..models import Match, MatchRatingDelta, PlayerRating, Round, Tournament
+
+
+INITIAL_RATING = 1500.0
+K_FACTOR = 32.0
+DEFAULT_BATCH_SIZE = 1000
+GLOBAL_RATING_SCOPE = "all"
+
+
+def rating_scopes(group_id, cube_id):
+    """Alle Scopes, in denen ein Match dieses Turniers zählt."""
+    scopes = [GLOBAL_RATING_SCOPE]
+    if cube_id:
+        scopes.append(f"cube:{cube_id}")
+    if group_id:
+        scopes.append(f"group:{group_id}")
+    if group_id and cube_id:
+        scopes.append(f"group:{group_id}|cube:{cube_id}")
+    return scopes
+
+
+def rating_scope_for_filter(group_id=None, cube_id=None):
+    """Scope für einen Filter der Spielerseiten (None/"all" = ohne Einschränkung)."""
+    cube_id = None if cube_id in (None, "", "all") else cube_id
+    return rating_scopes(group_id, cube_id)[-1]
+
+
+def _is_rated(match):
+    return (
+        not match.is_bye
+        and match.player1_id
+        and match.player2_id
+        and match.score1 is not None
+        and match.score2 is not None
+    )
+
+
+def _expected(rating_a, rating_b):
+    return 1.0 / (1.0 + 10 ** ((rating_b - rating_a) / 400.0))
+
+
+def _elo_delta(rating1, rating2, score1, score2):
+    """Verschiebung für Spieler 1 (Spieler 2 erhält das Negative)."""
+    if score1 > score2:
+        actual = 1.0
+    elif score2 > score1:
+        actual = 0.0
+    else:
+        actual = 0.5
+    return K_FACTOR * (actual - _expected(rating1, rating2))
+
+
+def _load_ratings(player_ids, scopes):
+    rows = PlayerRating.query.filter(
+        PlayerRating.player_id.in_(player_ids), PlayerRating.scope_key.in_(scopes)
+    ).all()
+    return {(row.player_id, row.scope_key): row for row in rows}
+
+
+def _rating_row(ratings, player_id, scope):
+    row = ratings.get((player_id, scope))
+    if row is None:
+        row = PlayerRating(player_id=player_id, scope_key=scope, rating=INITIAL_RATING, matches=0)
+        db.session.add(row)
+        ratings[(player_id, scope)] = row
+    return row
+
+
+def _revert_deltas(entries, ratings, now):
+    for entry in entries:
+        for player_id, sign in ((entry.player1_id, 1.0), (entry.player2_id, -1.0)):
+            row = ratings.get((player_id, entry.scope_key))
+            if row is not None:
+                row.rating -= sign * entry.delta
+                row.matches = max(0, (row.matches or 0) - 1)
+                row.updated_at = now
+        db.session.delete(entry)
+
+
+def apply_match_rating(match, tournament):
+    """Nimmt eine frühere Wertung dieses Matches zurück und wertet den aktuellen Stand.
+
+    Läuft in der Transaktion des Aufrufers (kein Commit).
+    """
+    if match.id is None:
+        db.session.flush()
+    previous = MatchRatingDelta.query.filter_by(tournament_id=tournament.id, match_id=match.id).all()
+    rated = _is_rated(match)
+    if not previous and not rated:
+        return
+
+    scopes = rating_scopes(tournament.group_id, tournament.cube_id)
+    player_ids = {entry.player1_id for entry in previous} | {entry.player2_id for entry in previous}
+    if rated:
+        player_ids.update((match.player1_id, match.player2_id))
+    ratings = _load_ratings(player_ids, scopes + [entry.scope_key for entry in previous])
+    now = datetime.now(timezone.utc)
+    _revert_deltas(previous, ratings, now)
+
+    if not rated:
+        return
+    if previous:
+        # Unique (match_id, scope_key): Löschungen vor den neuen Zeilen schreiben.
+        db.session.flush()
+    for scope in scopes:
+        row1 = _rating_row(ratings, match.player1_id, scope)
+        row2 = _rating_row(ratings, match.player2_id, scope)
+        delta = _elo_delta(row1.rating, row2.rating, match.score1, match.score2)
+        row1.rating += delta
+        row2.rating -= delta
+        row1.matches = (row1.matches or 0) + 1
+        row2.matches = (row2.matches or 0) + 1
+        row1.updated_at = row2.updated_at = now
+        db.session.add(MatchRatingDelta(
+            tournament_id=tournament.id,
+            match_id=match.id,
+            scope_key=scope,
+            player1_id=match.player1_id,
+            player2_id=match.player2_id,
+            delta=delta,
+        ))
+
+
+def revert_match_ratings(tournament_id, match_ids=None):
+    """Nimmt die Wertung von Matches vor deren Löschung zurück und entfernt ihre Deltas.
+
+    Ohne `match_ids` alle Matches des Turniers. Kein Commit. Liefert die
+    Anzahl entfernter Deltas.
+    """
+    query = MatchRatingDelta.query.filter_by(tournament_id=tournament_id)
+    if match_ids is not None:
+        match_ids = list(match_ids)
+        if not match_ids:
+            return 0
+        query = query.filter(MatchRatingDelta.match_id.in_(match_ids))
+    entries = query.all()
+    if not entries:
+        return 0
+    player_ids = {entry.player1_id for entry in entries} | {entry.player2_id for entry in entries}
+    ratings = _load_ratings(player_ids, {entry.scope_key for entry in entries})
+    _revert_deltas(entries, ratings, datetime.now(timezone.utc))
+    return len(entries)
+
+
+def _chronological_matches_query():
+    return (
+        select(
+            Match.id,
+            Match.player1_id,
+            Match.player2_id,
+            Match.score1,
+            Match.score2,
+            Match.is_bye,
+            Tournament.id,
+            Tournament.group_id,
+            Tournament.cube_id,
+        )
+        .join(Round, Match.round_id == Round.id)
+        .join(Tournament, Round.tournament_id == Tournament.id)
+        .where(
+            Match.is_bye.is_(False),
+            Match.player1_id.isnot(None),
+            Match.player2_id.isnot(None),
+            Match.score1.isnot(None),
+            Match.score2.isnot(None),
+        )
+        .order_by(Tournament.created_at, Tournament.id, Round.number, Match.table_number)
+    )
+
+
+def recompute_all_ratings(batch_size=DEFAULT_BATCH_SIZE, progress=None):
+    """Verwirft alle Wertungen und bewertet die Historie chronologisch neu.
+
+    Matches werden per `yield_per` blockweise gelesen; die Verschiebungen
+    gehen pro Block gesammelt in die DB. Die Wertungen selbst (Spieler x
+    Scopes) bleiben bis zum Schluss im Speicher. Liefert {"matches",
+    "ratings"}.
+    """
+    batch_size = max(1, int(batch_size))
+    ratings = {}
+    counts = {}
+    matches = 0
+
+    db.session.query(MatchRatingDelta).delete(synchronize_session=False)
+    db.session.query(PlayerRating).delete(synchronize_session=False)
+
+    # Eigene Verbindung zum Lesen: die Deltas werden parallel in die Session geschrieben.
+    pending = []
+    with db.engine.connect() as connection:
+        result = connection.execution_options(yield_per=batch_size).execute(_chronological_matches_query())
+        for partition in result.partitions():
+            for match_id, player1_id, player2_id, score1, score2, _is_bye, tournament_id, group_id, cube_id in partition:
+                for scope in rating_scopes(group_id, cube_id):
+                    rating1 = ratings.get((player1_id, scope), INITIAL_RATING)
+                    rating2 = ratings.get((player2_id, scope), INITIAL_RATING)
+                    delta = _elo_delta(rating1, rating2, score1, score2)
+                    ratings[(player1_id, scope)] = rating1 + delta
+                    ratings[(player2_id, scope)] = rating2 - delta
+                    counts[(player1_id, scope)] = counts.get((player1_id, scope), 0) + 1
+                    counts[(player2_id, scope)] = counts.get((player2_id, scope), 0) + 1
+                    pending.append({
+                        "tournament_id": tournament_id,
+                        "match_id": match_id,
+                        "scope_key": scope,
+                        "player1_id": player1_id,
+                        "player2_id": player2_id,
+                        "delta": delta,
+                    })
+                matches += 1
+            db.session.bulk_insert_mappings(MatchRatingDelta, pending)
+            pending = []
+            if progress:
+                progress(matches)
+
+    now = datetime.now(timezone.utc)
+    rows = [
+        {"player_id": player_id, "scope_key": scope, "rating": rating, "matches": counts[(player_id, scope)], "updated_at": now}
+        for (player_id, scope), rating in ratings.items()
+    ]
+    for start in range(0, len(rows), batch_size):
+        db.session.bulk_insert_mappings(PlayerRating, rows[start:start + batch_size])
+    db.session.commit()
+    return {"matches": matches, "ratings": len(rows)}
+
+
+def ratings_for_scope(scope_key, player_ids=None):
+    """{player_id: (Wertung, Matches)} für einen Scope, optional nur für `player_ids`."""
+    rows = db.session.query(PlayerRating.player_id, PlayerRating.rating, PlayerRating.matches).filter(
+        PlayerRating.scope_key == scope_key
+    )
+    if player_ids is not None:
+        rows = rows.filter(PlayerRating.player_id.in_(list(player_ids)))
+    return {player_id: (rating, matches) for player_id, rating, matches in rows}
+
+
+def get_player_rating(player_id, scope_key=GLOBAL_RATING_SCOPE):
+    """(Wertung, Matches) oder None, wenn der Spieler im Scope noch nicht gewertet ist."""
+    row = PlayerRating.query.filter_by(player_id=player_id, scope_key=scope_key).first()
+    if row is None:
+        return None
+    return row.rating, row.matches
+
+
+def delete_player_ratings(player_id):
+    """Entfernt die Wertungen eines Spielers (Deltas bleiben für die Gegner bestehen)."""
+    return PlayerRating.query.filter_by(player_id=player_id).delete(synchronize_session=False)
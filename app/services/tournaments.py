@@ -3,7 +3,9 @@ from datetime import datetime, timezone
 from ..db import db
 from ..models import Tournament
 from .cubes import DEFAULT_CUBE_ID, normalize_cube_value
+from .events import delete_events
 from .groups import DEFAULT_GROUP_ID, normalize_group_id
+from .ratings import revert_match_ratings
 
 
 def create_tournament(tournament_id, group_id=DEFAULT_GROUP_ID, cube_id=DEFAULT_CUBE_ID, status="running"):
@@ -42,10 +44,22 @@ def set_tournament_group_and_cube(tournament_id, group_id, cube_id):
     return row
 
 
+def set_tournament_pairing_mode(tournament_id, pairing_mode):
+    row = get_tournament(tournament_id)
+    if row is None:
+        return None
+    row.pairing_mode = pairing_mode
+    db.session.commit()
+    return row
+
+
 def remove_tournament(tournament_id):
     row = get_tournament(tournament_id)
     if row is None:
         return True
+    delete_events(tournament_id)
+    # Matches fallen per Cascade weg; ihre Elo-Verschiebungen vorher zurücknehmen.
+    revert_match_ratings(tournament_id)
     db.session.delete(row)
     db.session.commit()
     return True
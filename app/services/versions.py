@@ -0,0 +1,79 @@
+"""Versionsstempel für Turniere, Spieler und Übersichtsseiten.
+
+Jeder schreibende Pfad (Ergebnis speichern, Runde anlegen, Löschen) erhöht die
+passenden Zähler. Lesende Seiten leiten daraus ETag/Last-Modified ab und können
+mit 304 antworten, ohne CSV-Dateien zu parsen oder Statistiken zu aggregieren.
+Die Zähler liegen in der DB und gelten damit für alle Gunicorn-Worker.
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy.exc import IntegrityError
+
+from ..db import db
+from ..models import DataVersion
+from .normalize import normalize_name
+
+
+# Laufende Turniere, Gruppen, Cubes (Turnier-Switcher, Filterlisten).
+TOURNAMENTS_SCOPE = "tournaments"
+# Spielerliste und globale Statistiken.
+PLAYERS_SCOPE = "players"
+# Menge der Spielernamen (angelegt/gelöscht), z.B. für den Autocomplete-Index.
+PLAYER_NAMES_SCOPE = "player_names"
+
+
+def tournament_scope(tournament_id):
+    return f"tournament:{tournament_id}"
+
+
+def player_scope(player_name):
+    return f"player:{normalize_name(player_name)}"
+
+
+def _unique_keys(scope_keys):
+    return sorted({key for key in scope_keys if key})
+
+
+def get_versions(scope_keys):
+    """Liefert {scope_key: (version, updated_at)}; unbekannte Keys haben Version 0."""
+    keys = _unique_keys(scope_keys)
+    if not keys:
+        return {}
+    rows = DataVersion.query.filter(DataVersion.scope_key.in_(keys)).all()
+    by_key = {row.scope_key: (row.version, row.updated_at) for row in rows}
+    return {key: by_key.get(key, (0, None)) for key in keys}
+
+
+def bump_versions(scope_keys, commit=True):
+    """Erhöht die Zähler der angegebenen Scopes (legt fehlende an).
+
+    Mit commit=False läuft das Update in der Transaktion des Aufrufers, damit
+    Datenänderung und Versionssprung gemeinsam sichtbar werden.
+    """
+    keys = _unique_keys(scope_keys)
+    if not keys:
+        return
+    now = datetime.now(timezone.utc)
+    existing = {
+        key for (key,) in db.session.query(DataVersion.scope_key).filter(DataVersion.scope_key.in_(keys))
+    }
+    if existing:
+        DataVersion.query.filter(DataVersion.scope_key.in_(existing)).update(
+            {DataVersion.version: DataVersion.version + 1, DataVersion.updated_at: now},
+            synchronize_session=False,
+        )
+    for key in keys:
+        if key in existing:
+            continue
+        try:
+            with db.session.begin_nested():
+                db.session.add(DataVersion(scope_key=key, version=1, updated_at=now))
+        except IntegrityError:
+            # Paralleler Worker hat den Zähler soeben angelegt.
+            DataVersion.query.filter_by(scope_key=key).update(
+                {DataVersion.version: DataVersion.version + 1, DataVersion.updated_at: now},
+                synchronize_session=False,
+            )
+    if commit:
+        db.session.commit()
@@ -0,0 +1,210 @@
+"""Serverseitiger Session-Store (SESSION_BACKEND=db).
+
+Flask legt den Session-Inhalt standardmässig signiert ins Cookie. Mit
+`player_groups` und `leg_players_set` wächst dieses Cookie mit der Spielerzahl
+und wird bei jedem Request übertragen und verifiziert. Der DB-Store hält den
+Inhalt in `server_sessions`; das Cookie trägt nur eine signierte, zufällige ID.
+Abgelaufene Einträge werden stichprobenartig beim Speichern und über
+`flask sweep-sessions` entfernt.
+
+Gegen Session-Fixation bekommt die Session beim Login, Logout und bei
+`session.clear()` eine neue ID (`regenerate_session_id`); der alte Eintrag
+wird beim Speichern gelöscht. Requests auf statische Dateien lesen die
+Session nicht aus der DB.
+"""
+
+import random
+import secrets
+from datetime import datetime, timezone
+
+import click
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SecureCookieSession, SessionInterface
+from itsdangerous import BadSignature, Signer
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from .db import db
+from .models import ServerSession
+
+
+SESSION_BACKEND_COOKIE = "cookie"
+SESSION_BACKEND_DB = "db"
+_SIGNER_SALT = "server-session-id"
+
+
+def _utcnow_naive():
+    # Spalten sind ohne Zeitzone definiert; konsequent naive UTC-Werte schreiben.
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _new_sid():
+    return secrets.token_urlsafe(32)
+
+
+class ServerSideSession(SecureCookieSession):
+    def __init__(self, initial=None, sid=None, new=False, expires_at=None):
+        super().__init__(initial)
+        self.sid = sid
+        self.new = new
+        self.expires_at = expires_at
+        # Beim Speichern zu löschende ID nach regenerate().
+        self.previous_sid = None
+
+    def regenerate(self):
+        """Vergibt eine neue ID; der alte DB-Eintrag wird beim Speichern entfernt."""
+        if not self.new and self.previous_sid is None:
+            self.previous_sid = self.sid
+        self.sid = _new_sid()
+        self.modified = True
+
+    def clear(self):
+        super().clear()
+        self.regenerate()
+
+
+class DbSessionInterface(SessionInterface):
+    serializer = TaggedJSONSerializer()
+    session_class = ServerSideSession
+
+    def _signer(self, app):
+        return Signer(app.secret_key, salt=_SIGNER_SALT)
+
+    def _table(self):
+        return ServerSession.__table__
+
+    def _lifetime(self, app):
+        return app.permanent_session_lifetime
+
+    def open_session(self, app, request):
+        if _is_static_request(app, request):
+            # Assets brauchen keine Session: keine DB-Abfrage, kein Cookie.
+            return self.session_class(sid=_new_sid(), new=True)
+        raw_cookie = request.cookies.get(self.get_cookie_name(app))
+        if raw_cookie:
+            try:
+                sid = self._signer(app).unsign(raw_cookie).decode("utf-8")
+            except BadSignature:
+                sid = None
+            if sid:
+                table = self._table()
+                with db.engine.connect() as conn:
+                    row = conn.execute(
+                        select(table.c.data, table.c.expires_at).where(
+                            table.c.id == sid,
+                            table.c.expires_at > _utcnow_naive(),
+                        )
+                    ).first()
+                if row is not None:
+                    try:
+                        data = self.serializer.loads(row.data)
+                    except (TypeError, ValueError):
+                        data = {}
+                    return self.session_class(data, sid=sid, expires_at=row.expires_at)
+        return self.session_class(sid=_new_sid(), new=True)
+
+    def _needs_refresh(self, app, session):
+        # Unveränderte Sessions nur schreiben, wenn die Hälfte der Laufzeit verbraucht ist.
+        if session.expires_at is None:
+            return True
+        return session.expires_at - _utcnow_naive() < self._lifetime(app) / 2
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        table = self._table()
+
+        if session.previous_sid is not None:
+            with db.engine.begin() as conn:
+                conn.execute(delete(table).where(table.c.id == session.previous_sid))
+            session.previous_sid = None
+            if not session:
+                response.delete_cookie(name, domain=domain, path=path)
+                response.vary.add("Cookie")
+                return
+
+        if not session:
+            if session.modified and not session.new:
+                with db.engine.begin() as conn:
+                    conn.execute(delete(table).where(table.c.id == session.sid))
+                response.delete_cookie(name, domain=domain, path=path)
+                response.vary.add("Cookie")
+            return
+
+        if session.accessed:
+            response.vary.add("Cookie")
+
+        if not (session.modified or session.new or self._needs_refresh(app, session)):
+            return
+
+        now = _utcnow_naive()
+        values = {
+            "data": self.serializer.dumps(dict(session)),
+            "expires_at": now + self._lifetime(app),
+            "updated_at": now,
+        }
+        with db.engine.begin() as conn:
+            result = conn.execute(update(table).where(table.c.id == session.sid).values(**values))
+            if result.rowcount == 0:
+                try:
+                    with conn.begin_nested():
+                        conn.execute(insert(table).values(id=session.sid, **values))
+                except IntegrityError:
+                    conn.execute(update(table).where(table.c.id == session.sid).values(**values))
+            probability = float(app.config.get("SESSION_SWEEP_PROBABILITY", 0.01))
+            if probability > 0 and random.random() < probability:
+                conn.execute(delete(table).where(table.c.expires_at <= now))
+
+        response.set_cookie(
+            name,
+            self._signer(app).sign(session.sid.encode("utf-8")).decode("utf-8"),
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app),
+        )
+
+
+def _is_static_request(app, request):
+    # Die Session wird vor dem URL-Matching geöffnet; request.endpoint ist hier noch leer.
+    if not app.has_static_folder or not app.static_url_path:
+        return False
+    return request.path.startswith(app.static_url_path.rstrip("/") + "/")
+
+
+def regenerate_session_id(session):
+    """Neue Session-ID nach Login/Logout; beim Cookie-Backend ohne Wirkung.
+
+    Dort steckt der Inhalt signiert im Cookie, eine untergeschobene ID gibt es nicht.
+    """
+    regenerate = getattr(session, "regenerate", None)
+    if regenerate is not None:
+        regenerate()
+
+
+def sweep_expired_sessions():
+    """Löscht abgelaufene Sessions und liefert die Anzahl gelöschter Einträge."""
+    table = ServerSession.__table__
+    with db.engine.begin() as conn:
+        result = conn.execute(delete(table).where(table.c.expires_at <= _utcnow_naive()))
+    return int(result.rowcount or 0)
+
+
+def init_session_store(app):
+    backend = str(app.config.get("SESSION_BACKEND", SESSION_BACKEND_COOKIE)).strip().lower()
+    if backend == SESSION_BACKEND_DB:
+        app.session_interface = DbSessionInterface()
+    elif backend != SESSION_BACKEND_COOKIE:
+        raise RuntimeError(
+            f"Unbekanntes SESSION_BACKEND '{backend}'. Erlaubt: "
+            f"{SESSION_BACKEND_COOKIE}, {SESSION_BACKEND_DB}."
+        )
+
+    @app.cli.command("sweep-sessions")
+    def sweep_sessions_command():
+        """Entfernt abgelaufene serverseitige Sessions."""
+        removed = sweep_expired_sessions()
+        click.echo(f"{removed} abgelaufene Session(s) entfernt.")
@@ -0,0 +1,251 @@
+"""Archiv für beendete Turniere.
+
+Ein beendetes Turnier hinterlässt `data/<id>/` (Runden, Spielergruppen,
+end_time.txt, ...) und `tournament_results/<id>_results.json`. Der Archivierer
+packt beides in ein komprimiertes Bündel `tournament_archive/<id>.zip` und
+entfernt die Live-Dateien; Verzeichnis-Scans auf dem aktiven Pfad bleiben so
+klein, auch wenn die Historie wächst.
+
+`tournament_archive/index.json` führt alle archivierten Turniere mit
+Endzeitpunkt. Leser entscheiden damit ohne Verzeichnis-Scan, ob ein Turnier
+archiviert ist, und greifen per Zip-Inhaltsverzeichnis gezielt auf einzelne
+Dateien (z.B. die Ergebnis-JSON) zu. `restore_tournament()` entpackt ein
+Bündel wieder, wenn ein archiviertes Turnier geöffnet wird.
+"""
+
+import io
+import json
+import os
+import shutil
+import threading
+import time
+import zipfile
+from datetime import datetime, timezone
+
+from .atomic_io import atomic_write, atomic_write_bytes
+from .file_locks import file_lock, tournament_lock
+
+
+ARCHIVE_DIR = "tournament_archive"
+INDEX_FILENAME = "index.json"
+_INDEX_LOCK_NAME = "archive-index"
+_RESULTS_MEMBER = "results.json"
+_DATA_PREFIX = "data/"
+
+_INDEX_CACHE = {}
+_INDEX_CACHE_GUARD = threading.Lock()
+
+
+def bundle_path(tournament_id, archive_dir=ARCHIVE_DIR):
+    return os.path.join(archive_dir, f"{tournament_id}.zip")
+
+
+def _index_path(archive_dir):
+    return os.path.join(archive_dir, INDEX_FILENAME)
+
+
+def load_index(archive_dir=ARCHIVE_DIR):
+    """{tournament_id: Eintrag}; pro Prozess gecacht, solange index.json unverändert ist."""
+    path = _index_path(archive_dir)
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return {}
+    stamp = (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+    key = os.path.abspath(path)
+    with _INDEX_CACHE_GUARD:
+        cached = _INDEX_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(index, dict):
+        return {}
+    with _INDEX_CACHE_GUARD:
+        _INDEX_CACHE[key] = (stamp, index)
+    return index
+
+
+def _update_index(archive_dir, update_fn):
+    with file_lock(_INDEX_LOCK_NAME):
+        index = dict(load_index(archive_dir))
+        update_fn(index)
+        atomic_write(
+            _index_path(archive_dir),
+            lambda f: json.dump(index, f, indent=2, sort_keys=True, ensure_ascii=False),
+        )
+
+
+def is_archived(tournament_id, archive_dir=ARCHIVE_DIR):
+    return bool(tournament_id) and tournament_id in load_index(archive_dir)
+
+
+def list_archived(archive_dir=ARCHIVE_DIR):
+    """Archivierte Turniere als [(tournament_id, Eintrag)], neueste zuerst."""
+    index = load_index(archive_dir)
+    return sorted(index.items(), key=lambda item: item[1].get("ended_ts", 0), reverse=True)
+
+
+def read_archived_results(tournament_id, archive_dir=ARCHIVE_DIR):
+    """Inhalt der archivierten `<id>_results.json` oder {}."""
+    try:
+        with zipfile.ZipFile(bundle_path(tournament_id, archive_dir)) as bundle:
+            with bundle.open(_RESULTS_MEMBER) as f:
+                payload = json.load(f)
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _ended_timestamp(tournament_dir, results_file):
+    for path in (results_file, os.path.join(tournament_dir, "end_time.txt")):
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            continue
+    return None
+
+
+def _write_bundle(target, tournament_dir, results_file):
+    # Ein Turnier umfasst wenige KB; das Bündel entsteht im Speicher und wird atomar ersetzt.
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
+        if os.path.isdir(tournament_dir):
+            for root, _dirs, files in os.walk(tournament_dir):
+                for name in sorted(files):
+                    # Tempdateien gehören nicht ins Bündel.
+                    if name.endswith(".tmp"):
+                        continue
+                    path = os.path.join(root, name)
+                    relative = os.path.relpath(path, tournament_dir).replace(os.sep, "/")
+                    bundle.write(path, _DATA_PREFIX + relative)
+        if os.path.exists(results_file):
+            bundle.write(results_file, _RESULTS_MEMBER)
+    atomic_write_bytes(target, buffer.getvalue())
+
+
+def archive_tournament(tournament_id, data_root="data", results_root="tournament_results", archive_dir=ARCHIVE_DIR):
+    """Packt ein beendetes Turnier und entfernt die Live-Dateien; False, wenn nicht beendet."""
+    tournament_dir = os.path.join(data_root, tournament_id)
+    results_file = os.path.join(results_root, f"{tournament_id}_results.json")
+    with tournament_lock(tournament_id):
+        ended_ts = _ended_timestamp(tournament_dir, results_file)
+        if ended_ts is None:
+            return False
+        _write_bundle(bundle_path(tournament_id, archive_dir), tournament_dir, results_file)
+
+        def _add(index):
+            index[tournament_id] = {
+                "bundle": os.path.basename(bundle_path(tournament_id, archive_dir)),
+                "ended_ts": ended_ts,
+                "has_results": os.path.exists(results_file),
+                "archived_at": datetime.now(timezone.utc).isoformat(),
+            }
+
+        # Erst Index, dann löschen: ein Abbruch dazwischen lässt nur Live-Dateien
+        # übrig, die der nächste Lauf erneut (idempotent) archiviert.
+        _update_index(archive_dir, _add)
+        if os.path.isdir(tournament_dir):
+            shutil.rmtree(tournament_dir)
+        if os.path.exists(results_file):
+            os.remove(results_file)
+    return True
+
+
+def _ended_candidates(data_root, results_root):
+    candidates = set()
+    if os.path.isdir(data_root):
+        for name in os.listdir(data_root):
+            if os.path.exists(os.path.join(data_root, name, "end_time.txt")):
+                candidates.add(name)
+    if os.path.isdir(results_root):
+        for name in os.listdir(results_root):
+            if name.endswith("_results.json"):
+                candidates.add(name[: -len("_results.json")])
+    return sorted(candidates)
+
+
+def archive_ended_tournaments(min_age_days=0, data_root="data", results_root="tournament_results",
+                              archive_dir=ARCHIVE_DIR, is_valid_id=None):
+    """Archiviert alle Turniere, die seit mindestens min_age_days beendet sind.
+
+    Liefert {"archived": n, "skipped": n}.
+    """
+    summary = {"archived": 0, "skipped": 0}
+    cutoff = time.time() - max(0.0, float(min_age_days)) * 86400
+    for tournament_id in _ended_candidates(data_root, results_root):
+        if is_valid_id is not None and not is_valid_id(tournament_id):
+            continue
+        ended_ts = _ended_timestamp(
+            os.path.join(data_root, tournament_id),
+            os.path.join(results_root, f"{tournament_id}_results.json"),
+        )
+        if ended_ts is None or ended_ts > cutoff:
+            summary["skipped"] += 1
+            continue
+        if archive_tournament(tournament_id, data_root, results_root, archive_dir):
+            summary["archived"] += 1
+        else:
+            summary["skipped"] += 1
+    return summary
+
+
+def _safe_target(root, relative):
+    target = os.path.normpath(os.path.join(root, relative))
+    if os.path.commonpath([os.path.abspath(root), os.path.abspath(target)]) != os.path.abspath(root):
+        raise ValueError(f"Ungültiger Pfad im Archiv: {relative}")
+    return target
+
+
+def extract_bundle(tournament_id, data_root="data", results_root="tournament_results", archive_dir=ARCHIVE_DIR):
+    """Entpackt ein Bündel nach data_root/<id>/ und results_root/, ohne Index oder Bündel anzufassen.
+
+    Grundlage für restore_tournament(); der Legacy-Import entpackt damit in ein
+    temporäres Verzeichnis, das Archiv bleibt unverändert.
+    """
+    tournament_dir = os.path.join(data_root, tournament_id)
+    with zipfile.ZipFile(bundle_path(tournament_id, archive_dir)) as bundle:
+        for member in bundle.infolist():
+            if member.is_dir():
+                continue
+            if member.filename == _RESULTS_MEMBER:
+                target = os.path.join(results_root, f"{tournament_id}_results.json")
+            elif member.filename.startswith(_DATA_PREFIX):
+                target = _safe_target(tournament_dir, member.filename[len(_DATA_PREFIX):])
+            else:
+                continue
+            atomic_write_bytes(target, bundle.read(member))
+            # Änderungszeit zurücksetzen: "Letzte Turniere" sortiert danach.
+            member_ts = time.mktime(member.date_time + (0, 0, -1))
+            os.utime(target, (member_ts, member_ts))
+
+
+def restore_tournament(tournament_id, data_root="data", results_root="tournament_results", archive_dir=ARCHIVE_DIR):
+    """Entpackt ein archiviertes Turnier wieder in data/ und tournament_results/."""
+    if not is_archived(tournament_id, archive_dir):
+        return False
+    with tournament_lock(tournament_id):
+        if not is_archived(tournament_id, archive_dir):
+            # Paralleler Request hat bereits entpackt.
+            return True
+        extract_bundle(tournament_id, data_root, results_root, archive_dir)
+        _update_index(archive_dir, lambda index: index.pop(tournament_id, None))
+        try:
+            os.remove(bundle_path(tournament_id, archive_dir))
+        except OSError:
+            pass
+    return True
+
+
+def delete_archived_tournament(tournament_id, archive_dir=ARCHIVE_DIR):
+    if not is_archived(tournament_id, archive_dir):
+        return False
+    _update_index(archive_dir, lambda index: index.pop(tournament_id, None))
+    try:
+        os.remove(bundle_path(tournament_id, archive_dir))
+    except OSError:
+        pass
+    return True
@@ -2,7 +2,7 @@ from datetime import datetime, timezone
 import json
 import os
 
-from flask import has_app_context
+from flask import current_app, has_app_context
 
 from . import get_last_created_app
 from .atomic_io import atomic_write
@@ -47,6 +47,14 @@ def _call_with_app_context(func, *args, **kwargs):
         return None
 
 
+def legacy_file_fallbacks_enabled():
+    """False, sobald LEGACY_FILE_FALLBACKS abgeschaltet ist (nach `flask import-legacy`)."""
+    app = current_app if has_app_context() else get_last_created_app()
+    if app is None:
+        return True
+    return bool(app.config.get("LEGACY_FILE_FALLBACKS", True))
+
+
 def load_tournament_groups():
     rows = _call_with_app_context(group_service.list_groups)
     if rows is None:
@@ -189,7 +197,7 @@ def load_tournament_meta():
     data = {}
     legacy_file = os.path.join("data", "tournament_meta.json")
     changed = False
-    if os.path.exists(legacy_file):
+    if legacy_file_fallbacks_enabled() and os.path.exists(legacy_file):
         try:
             with open(legacy_file, "r", encoding="utf-8") as f:
                 raw = json.load(f)
@@ -220,7 +228,7 @@ def load_tournament_meta():
             "cube_id": row.cube_id,
             "cube_name": get_cube_name(row.cube_id),
             "created_at": row.created_at.isoformat() if row.created_at else _utcnow_iso(),
-            "pairing_mode": existing.get("pairing_mode"),
+            "pairing_mode": row.pairing_mode or existing.get("pairing_mode"),
         }
     if changed:
         save_tournament_meta(data)
@@ -230,6 +238,9 @@ def load_tournament_meta():
 def save_tournament_meta(meta):
     if not isinstance(meta, dict):
         return False
+    if not legacy_file_fallbacks_enabled():
+        # Legacy-Spiegel abgeschaltet: die DB ist alleinige Quelle.
+        return True
     os.makedirs("data", exist_ok=True)
     path = os.path.join("data", "tournament_meta.json")
     atomic_write(path, lambda f: json.dump(meta, f, indent=2, ensure_ascii=False))
@@ -240,6 +251,8 @@ def set_tournament_group(tournament_id, group_id, cube_id=DEFAULT_CUBE_ID):
     if not tournament_id:
         return False
     _call_with_app_context(tournament_service.set_tournament_group_and_cube, tournament_id, group_id, cube_id)
+    if not legacy_file_fallbacks_enabled():
+        return True
     # Legacy-Spiegel für bestehende Testfälle/Dateiverhalten.
     meta = load_tournament_meta()
     normalized_group = normalize_group_id(group_id)
@@ -259,6 +272,8 @@ def remove_tournament_group(tournament_id):
     if not tournament_id:
         return False
     removed = _call_with_app_context(tournament_service.remove_tournament, tournament_id)
+    if not legacy_file_fallbacks_enabled():
+        return removed
     meta = load_tournament_meta()
     if tournament_id in meta:
         del meta[tournament_id]
@@ -269,6 +284,8 @@ def remove_tournament_group(tournament_id):
 def get_tournament_group_id(tournament_id):
     row = _call_with_app_context(tournament_service.get_tournament, tournament_id)
     if row is None:
+        if not legacy_file_fallbacks_enabled():
+            return normalize_group_id(None)
         meta = load_tournament_meta()
         return normalize_group_id(meta.get(tournament_id, {}).get("group_id"))
     return normalize_group_id(row.group_id)
@@ -281,6 +298,8 @@ def get_tournament_group_name(tournament_id):
 def get_tournament_cube_id(tournament_id):
     row = _call_with_app_context(tournament_service.get_tournament, tournament_id)
     if row is None:
+        if not legacy_file_fallbacks_enabled():
+            return normalize_cube_value(None)
         meta = load_tournament_meta()
         payload = meta.get(tournament_id, {})
         return normalize_cube_value(payload.get("cube_id") or payload.get("cube"))
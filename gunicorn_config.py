@@ -1,6 +1,67 @@
+import os
+
 bind = "127.0.0.1:10000"
 workers = 2
+# SSE-Streams belegen je einen Thread; die App begrenzt sie per
+# SSE_MAX_STREAMS_PER_WORKER (Standard 2), der Rest bleibt für Requests frei.
 threads = 4
 timeout = 60
 accesslog = "-"
 errorlog = "-"
+
+# App einmal im Master laden: DB-Bootstrap (create_all, Default-Seeding) läuft
+# dann nur dort statt in jedem Worker. Code-Änderungen brauchen einen Restart,
+# ein HUP-Reload lädt bei preload_app keinen neuen Code.
+preload_app = os.environ.get("GUNICORN_PRELOAD_APP", "true").lower() == "true"
+
+
+def on_starting(server):
+    """Im Master, bevor Worker starten: abgebrochene Datei-Batches nachziehen.
+
+    Nur hier läuft garantiert kein Worker, dessen laufenden Batch die
+    Recovery sonst vorzeitig umbenennen würde.
+    """
+    from app.atomic_io import recover_file_state
+
+    summary = recover_file_state()
+    if summary["batches"] or summary["temp_files"]:
+        server.log.warning(
+            "Datei-Recovery: %s Batch(es) wiederhergestellt, %s verwaiste Tempdatei(en) gelöscht",
+            summary["batches"],
+            summary["temp_files"],
+        )
+
+
+def post_fork(server, worker):
+    """Vom Master geerbte DB-Verbindungen im Worker verwerfen.
+
+    dispose(close=False) ersetzt den Pool, ohne die Sockets des Masters zu
+    schliessen; jeder Worker öffnet danach eigene Verbindungen.
+    """
+    if not preload_app:
+        return
+    from app import get_last_created_app
+    from app.db import db
+
+    app = get_last_created_app()
+    if app is None:
+        return
+    with app.app_context():
+        db.engine.dispose(close=False)
+
+
+def post_worker_init(worker):
+    """Pairing-Pool starten, bevor der Worker Requests annimmt.
+
+    PAIRING_POOL_WORKERS gilt pro Worker; pool_size_for() kappt auf die CPUs,
+    die auf jeden der `workers` Prozesse entfallen (Standard: Pool aus).
+    """
+    from app import get_last_created_app
+    from app.pairing_executor import pool_size_for, start_pool
+
+    app = get_last_created_app()
+    if app is None:
+        return
+    size = start_pool(pool_size_for(app.config.get("PAIRING_POOL_WORKERS", 0), worker.cfg.workers))
+    if size:
+        worker.log.info("Pairing-Pool mit %s Prozess(en) gestartet", size)
@@ -0,0 +1,28 @@
+"""add index on tournaments.created_at
+
+Revision ID: a8c3e5f7b9d2
+Revises: e6b1c4d8f2a7
+Create Date: 2026-04-02 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a8c3e5f7b9d2"
+down_revision = "e6b1c4d8f2a7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Sitzverteilung liest die letzten N Turniere nach Startzeit.
+    indexes = {index["name"] for index in sa.inspect(op.get_bind()).get_indexes("tournaments")}
+    if "ix_tournaments_created_at" in indexes:
+        return
+    op.create_index("ix_tournaments_created_at", "tournaments", ["created_at"], unique=False)
+
+
+def downgrade():
+    op.drop_index("ix_tournaments_created_at", table_name="tournaments")
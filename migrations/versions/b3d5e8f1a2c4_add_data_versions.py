@@ -0,0 +1,33 @@
+"""add data_versions for conditional GET stamps
+
+Revision ID: b3d5e8f1a2c4
+Revises: f2a9c3d1b8e4
+Create Date: 2026-03-02 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b3d5e8f1a2c4"
+down_revision = "f2a9c3d1b8e4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # create_app() legt fehlende Tabellen per create_all() bereits an.
+    if "data_versions" in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        "data_versions",
+        sa.Column("scope_key", sa.String(length=160), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("scope_key"),
+    )
+
+
+def downgrade():
+    op.drop_table("data_versions")
@@ -0,0 +1,64 @@
+"""add player_ratings and match_rating_deltas
+
+Revision ID: b5d7f9a1c3e6
+Revises: a8c3e5f7b9d2
+Create Date: 2026-04-06 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b5d7f9a1c3e6"
+down_revision = "a8c3e5f7b9d2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # create_app() legt fehlende Tabellen per create_all() bereits an.
+    # Bestehende Historie danach einmal mit `flask recompute-ratings` bewerten.
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    if "player_ratings" not in tables:
+        op.create_table(
+            "player_ratings",
+            sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+            sa.Column("player_id", sa.String(length=36), nullable=False),
+            sa.Column("scope_key", sa.String(length=160), nullable=False),
+            sa.Column("rating", sa.Float(), nullable=False),
+            sa.Column("matches", sa.Integer(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+            sa.ForeignKeyConstraint(["player_id"], ["players.id"]),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("player_id", "scope_key", name="uq_player_ratings_player_scope"),
+        )
+        with op.batch_alter_table("player_ratings", schema=None) as batch_op:
+            batch_op.create_index(batch_op.f("ix_player_ratings_player_id"), ["player_id"], unique=False)
+            batch_op.create_index(batch_op.f("ix_player_ratings_scope_key"), ["scope_key"], unique=False)
+
+    if "match_rating_deltas" not in tables:
+        op.create_table(
+            "match_rating_deltas",
+            sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+            sa.Column("match_id", sa.Integer(), nullable=False),
+            sa.Column("scope_key", sa.String(length=160), nullable=False),
+            sa.Column("player1_id", sa.String(length=36), nullable=False),
+            sa.Column("player2_id", sa.String(length=36), nullable=False),
+            sa.Column("delta", sa.Float(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("match_id", "scope_key", name="uq_match_rating_deltas_match_scope"),
+        )
+        with op.batch_alter_table("match_rating_deltas", schema=None) as batch_op:
+            batch_op.create_index(batch_op.f("ix_match_rating_deltas_match_id"), ["match_id"], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table("match_rating_deltas", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_match_rating_deltas_match_id"))
+    op.drop_table("match_rating_deltas")
+
+    with op.batch_alter_table("player_ratings", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_player_ratings_scope_key"))
+        batch_op.drop_index(batch_op.f("ix_player_ratings_player_id"))
+    op.drop_table("player_ratings")
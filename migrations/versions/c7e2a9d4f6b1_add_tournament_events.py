@@ -0,0 +1,40 @@
+"""add tournament_events for live round updates
+
+Revision ID: c7e2a9d4f6b1
+Revises: b3d5e8f1a2c4
+Create Date: 2026-03-04 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c7e2a9d4f6b1"
+down_revision = "b3d5e8f1a2c4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # create_app() legt fehlende Tabellen per create_all() bereits an.
+    if "tournament_events" in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        "tournament_events",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("tournament_id", sa.String(length=36), nullable=False),
+        sa.Column("event_type", sa.String(length=32), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("tournament_events", schema=None) as batch_op:
+        batch_op.create_index(batch_op.f("ix_tournament_events_tournament_id"), ["tournament_id"], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table("tournament_events", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_tournament_events_tournament_id"))
+
+    op.drop_table("tournament_events")
@@ -0,0 +1,50 @@
+"""key match_rating_deltas by tournament and match
+
+Revision ID: c9e4a7b2d5f8
+Revises: b5d7f9a1c3e6
+Create Date: 2026-04-12 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c9e4a7b2d5f8"
+down_revision = "b5d7f9a1c3e6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # SQLite vergibt IDs gelöschter Matches neu; Deltas gelöschter Turniere
+    # würden sonst neue Matches "zurücknehmen". Deltas ohne Match werden
+    # verworfen. Ihre Verschiebung steckt noch in player_ratings, und ein
+    # bereits neu vergebenes Match ist nicht unterscheidbar: danach einmal
+    # `flask recompute-ratings` ausführen.
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("match_rating_deltas")}
+    if "tournament_id" in columns:
+        return
+    with op.batch_alter_table("match_rating_deltas", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("tournament_id", sa.String(length=36), nullable=True))
+    op.execute(
+        "UPDATE match_rating_deltas SET tournament_id = ("
+        "SELECT rounds.tournament_id FROM matches JOIN rounds ON matches.round_id = rounds.id "
+        "WHERE matches.id = match_rating_deltas.match_id)"
+    )
+    op.execute("DELETE FROM match_rating_deltas WHERE tournament_id IS NULL")
+    with op.batch_alter_table("match_rating_deltas", schema=None) as batch_op:
+        batch_op.alter_column("tournament_id", existing_type=sa.String(length=36), nullable=False)
+        batch_op.drop_constraint("uq_match_rating_deltas_match_scope", type_="unique")
+        batch_op.create_unique_constraint(
+            "uq_match_rating_deltas_match_scope", ["tournament_id", "match_id", "scope_key"]
+        )
+        batch_op.create_index(batch_op.f("ix_match_rating_deltas_tournament_id"), ["tournament_id"], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table("match_rating_deltas", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_match_rating_deltas_tournament_id"))
+        batch_op.drop_constraint("uq_match_rating_deltas_match_scope", type_="unique")
+        batch_op.create_unique_constraint("uq_match_rating_deltas_match_scope", ["match_id", "scope_key"])
+        batch_op.drop_column("tournament_id")
@@ -0,0 +1,39 @@
+"""add server_sessions for the server-side session store
+
+Revision ID: d4f8b2c6e9a3
+Revises: c7e2a9d4f6b1
+Create Date: 2026-03-05 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d4f8b2c6e9a3"
+down_revision = "c7e2a9d4f6b1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # create_app() legt fehlende Tabellen per create_all() bereits an.
+    if "server_sessions" in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        "server_sessions",
+        sa.Column("id", sa.String(length=64), nullable=False),
+        sa.Column("data", sa.Text(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("server_sessions", schema=None) as batch_op:
+        batch_op.create_index(batch_op.f("ix_server_sessions_expires_at"), ["expires_at"], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table("server_sessions", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_server_sessions_expires_at"))
+
+    op.drop_table("server_sessions")
@@ -0,0 +1,30 @@
+"""add pairing_mode to tournaments
+
+Revision ID: e6b1c4d8f2a7
+Revises: d4f8b2c6e9a3
+Create Date: 2026-03-09 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e6b1c4d8f2a7"
+down_revision = "d4f8b2c6e9a3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Bisher nur in data/tournament_meta.json; `flask import-legacy` übernimmt bestehende Werte.
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("tournaments")}
+    if "pairing_mode" in columns:
+        return
+    with op.batch_alter_table("tournaments", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("pairing_mode", sa.String(length=16), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table("tournaments", schema=None) as batch_op:
+        batch_op.drop_column("pairing_mode")
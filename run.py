@@ -1,10 +1,15 @@
+import os
+
 from app import create_app
+from app.atomic_io import recover_file_state
+from app.pairing_executor import pool_size_for, start_pool
 
 app = create_app()
 
 if __name__ == "__main__":
+    # Entwicklungsserver: einmal vor dem Start, wie Gunicorn `on_starting`.
+    recover_file_state()
+    # Pairing-Pool nur im Prozess, der Requests bedient (Reloader-Kind).
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_pool(pool_size_for(app.config["PAIRING_POOL_WORKERS"]))
     app.run(debug=True)
-
-
-
-
@@ -0,0 +1,72 @@
+"""Benchmark der Sitzverteilung (app/seating.py) für grosse Spieleabende.
+
+Erzeugt eine Historie aus K zufälligen Turnieren eines Stamm-Pools und
+verteilt danach einen Roster auf Pods. Ausgegeben werden die Wiederholungen
+(Summe gemeinsamer Pods innerhalb der neuen Pods) vor und nach der Suche
+sowie die Laufzeit.
+
+    python scripts/seating_benchmark.py --players 120 --pod-size 8 --history 8 --budget-ms 200
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+
+def _synthetic_history(pool, pod_size, tournaments, attendance, rng):
+    weights = defaultdict(int)
+    for _ in range(tournaments):
+        present = [player for player in pool if rng.random() < attendance]
+        rng.shuffle(present)
+        for start in range(0, len(present) - pod_size + 1, pod_size):
+            pod = sorted(present[start:start + pod_size])
+            for index, player_a in enumerate(pod):
+                for player_b in pod[index + 1:]:
+                    weights[frozenset((player_a, player_b))] += 1
+    return dict(weights)
+
+
+def main() -> int:
+    project_root = Path(__file__).resolve().parents[1]
+    if str(project_root) not in sys.path:
+        sys.path.insert(0, str(project_root))
+    from app.seating import optimize_seating, seating_cost
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=120)
+    parser.add_argument("--pod-size", type=int, default=8)
+    parser.add_argument("--history", type=int, default=8, help="Anzahl früherer Turniere")
+    parser.add_argument("--attendance", type=float, default=0.8, help="Anteil des Pools pro früherem Turnier")
+    parser.add_argument("--budget-ms", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    roster_size = args.players - args.players % args.pod_size
+    if roster_size < 2 * args.pod_size:
+        parser.error("Mindestens zwei volle Pods erforderlich.")
+    pod_sizes = [args.pod_size] * (roster_size // args.pod_size)
+
+    rng = random.Random(args.seed)
+    pool = [f"Spieler {index:03d}" for index in range(roster_size)]
+    weights = _synthetic_history(pool, args.pod_size, args.history, args.attendance, rng)
+    print(f"{roster_size} Spieler, {len(pod_sizes)} Pods à {args.pod_size}, "
+          f"{args.history} Turniere Historie, {len(weights)} Paare mit Vorgeschichte")
+
+    for run in range(args.repeat):
+        roster = list(pool)
+        rng.shuffle(roster)
+        start_pods = [roster[index:index + args.pod_size] for index in range(0, roster_size, args.pod_size)]
+        started = time.perf_counter()
+        pods = optimize_seating(roster, pod_sizes, weights, time_budget_ms=args.budget_ms, seed=run)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"Lauf {run + 1}: Wiederholungen {seating_cost(start_pods, weights)} -> "
+              f"{seating_cost(pods, weights)} in {elapsed_ms:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
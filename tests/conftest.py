@@ -1,3 +1,4 @@
+import csv
 import json
 import os
 import random
@@ -56,3 +57,109 @@ def golden_fixtures():
             return json.load(f)
 
     return _load
+
+
+TEST_PLAYERS = ["Alice", "Bob", "Carol", "Dave", "Eve", "Frank", "Gina", "Hank"]
+
+
+@pytest.fixture
+def start_tournament():
+    """Startet über /mtg/pair ein Turnier mit einer Spielergruppe und liefert die ID.
+
+    players: Namensliste oder Anzahl (die ersten N aus TEST_PLAYERS).
+    """
+
+    def _start(client, players=8, cube="vintage", group="liga"):
+        if isinstance(players, int):
+            players = TEST_PLAYERS[:players]
+        response = client.post(
+            "/mtg/pair",
+            data={
+                "players": list(players),
+                "group_sizes": [str(len(players))],
+                "tournament_group": group,
+                "tournament_cube": cube,
+            },
+        )
+        assert response.status_code in (302, 303)
+        with client.session_transaction() as sess:
+            return sess["tournament_id"]
+
+    return _start
+
+
+def _round_path(tournament_id, round_number):
+    return os.path.join("data", tournament_id, "rounds", f"round_{round_number}.csv")
+
+
+@pytest.fixture
+def round_path():
+    return _round_path
+
+
+@pytest.fixture
+def round_rows():
+    """Zeilen von `data/<id>/rounds/round_N.csv` als Dicts."""
+
+    def _rows(tournament_id, round_number=1):
+        with open(_round_path(tournament_id, round_number), encoding="utf-8") as f:
+            return list(csv.DictReader(f))
+
+    return _rows
+
+
+@pytest.fixture
+def save_result():
+    """Speichert ein Tischergebnis über /mtg/save_results und prüft den Erfolg."""
+
+    def _save(client, row, score1=2, score2=1, draws=0, round_number=1):
+        response = client.post(
+            "/mtg/save_results",
+            data={
+                "table": row["table"],
+                "player1": row["player1"],
+                "player2": row["player2"],
+                "score1": str(score1),
+                "score2": str(score2),
+                "score_draws": str(draws),
+                "current_round": str(round_number),
+                "dropout1": "false",
+                "dropout2": "false",
+                "table_size": row.get("table_size") or "6",
+            },
+        )
+        assert response.status_code == 200, response.get_json()
+        assert response.get_json()["success"] is True
+        return response
+
+    return _save
+
+
+@pytest.fixture
+def complete_round(round_rows, save_result):
+    """Trägt für alle Tische einer Runde dasselbe Ergebnis ein."""
+
+    def _complete(client, tournament_id, round_number=1, score1=2, score2=1):
+        for row in round_rows(tournament_id, round_number):
+            save_result(client, row, score1, score2, round_number=round_number)
+
+    return _complete
+
+
+@pytest.fixture
+def count_pairing_runs(monkeypatch):
+    """Zählt ab dem Aufruf die Läufe von routes._build_round_matches (Liste, ein Eintrag pro Lauf)."""
+    from app import routes
+
+    def _install():
+        calls = []
+        original = routes._build_round_matches
+
+        def _counting(*args, **kwargs):
+            calls.append(1)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(routes, "_build_round_matches", _counting)
+        return calls
+
+    return _install
@@ -0,0 +1,50 @@
+import sqlalchemy as sa
+
+from app import create_app
+from app.db import db
+from app.models import Cube, TournamentGroup
+
+
+def test_create_app_skips_bootstrap_when_disabled(isolated_workspace, monkeypatch):
+    monkeypatch.setenv("DB_BOOTSTRAP_ON_STARTUP", "false")
+    app = create_app()
+    with app.app_context():
+        assert "tournament_groups" not in sa.inspect(db.engine).get_table_names()
+
+    result = app.test_cli_runner().invoke(args=["bootstrap-db"])
+    assert result.exit_code == 0, result.output
+    with app.app_context():
+        assert db.session.get(TournamentGroup, "liga") is not None
+        assert Cube.query.count() > 0
+        db.session.remove()
+        db.drop_all()
+
+
+def test_post_fork_disposes_inherited_engine(app, monkeypatch):
+    import gunicorn_config
+
+    disposed = []
+    with app.app_context():
+        engine = db.engine
+    monkeypatch.setattr(type(engine), "dispose", lambda self, close=True: disposed.append(close))
+    monkeypatch.setattr(gunicorn_config, "preload_app", True)
+    gunicorn_config.post_fork(None, None)
+    assert disposed == [False]
+
+
+def test_post_worker_init_sizes_pairing_pool_per_worker(app, monkeypatch):
+    from types import SimpleNamespace
+
+    import gunicorn_config
+    from app import pairing_executor
+
+    started = []
+    monkeypatch.setattr(pairing_executor.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(pairing_executor, "start_pool", lambda workers: started.append(workers) or workers)
+    worker = SimpleNamespace(cfg=SimpleNamespace(workers=2), log=SimpleNamespace(info=lambda *args: None))
+
+    gunicorn_config.post_worker_init(worker)
+    app.config["PAIRING_POOL_WORKERS"] = 8
+    gunicorn_config.post_worker_init(worker)
+
+    assert started == [0, 4]
@@ -0,0 +1,183 @@
+import csv
+import os
+
+from app.models import Match, PlayerPowerNine, Round
+from app.services.events import list_events_since
+
+
+def _results_for(rows):
+    return [
+        {"table": row["table"], "player1": row["player1"], "player2": row["player2"],
+         "score1": 2, "score2": 1, "score_draws": 0}
+        for row in rows
+    ]
+
+
+def test_bulk_saves_all_tables_at_once(client, app, seeded_random, start_tournament, round_rows):
+    tournament_id = start_tournament(client)
+    rows = round_rows(tournament_id)
+    results = _results_for(rows)
+    results[0]["dropout2"] = "true"
+
+    response = client.post("/mtg/save_results/bulk", json={"round": 1, "results": results})
+
+    payload = response.get_json()
+    assert response.status_code == 200, payload
+    assert len(payload["matches"]) == len(rows)
+    saved = {row["table"]: row for row in round_rows(tournament_id)}
+    assert all(row["score1"] == "2" for row in saved.values())
+    assert saved[rows[0]["table"]]["dropout2"] == "true"
+
+    with open(os.path.join("tournament_data", "results.csv"), encoding="utf-8") as f:
+        logged = [row for row in csv.DictReader(f) if row["Tournament"] == tournament_id]
+    assert sorted(row["Table"] for row in logged) == sorted(row["table"] for row in rows)
+
+    with app.app_context():
+        round_row = Round.query.filter_by(tournament_id=tournament_id, number=1).one()
+        assert {match.score1 for match in Match.query.filter_by(round_id=round_row.id)} == {2}
+        events = list_events_since(tournament_id, 0)
+        assert sum(1 for event in events if event["type"] == "match_result") == len(rows)
+    with client.session_transaction() as sess:
+        assert rows[0]["player2"] in sess["leg_players_set"]
+
+
+def test_bulk_reports_errors_per_table_and_saves_nothing(client, seeded_random, start_tournament, round_rows):
+    tournament_id = start_tournament(client)
+    rows = round_rows(tournament_id)
+    results = _results_for(rows)
+    results[1]["score2"] = 2
+    results.append({"table": "99", "score1": 2, "score2": 0})
+
+    response = client.post("/mtg/save_results/bulk", json={"round": 1, "results": results})
+
+    assert response.status_code == 400
+    errors = response.get_json()["errors"]
+    assert [error["table"] for error in errors] == [rows[1]["table"], "99"]
+    assert "2 Siege" in errors[0]["message"]
+    assert round_rows(tournament_id) == rows
+    assert not os.path.exists(os.path.join("tournament_data", "results.csv"))
+
+
+def test_bulk_rejects_mismatched_players_and_duplicates(client, seeded_random, start_tournament, round_rows):
+    tournament_id = start_tournament(client)
+    row = round_rows(tournament_id)[0]
+    entry = {"table": row["table"], "player1": row["player1"], "player2": "Nobody", "score1": 2, "score2": 0}
+
+    response = client.post("/mtg/save_results/bulk", json={"round": 1, "results": [entry, dict(entry)]})
+
+    messages = [error["message"] for error in response.get_json()["errors"]]
+    assert "Spielerpaarung stimmt nicht überein" in messages[0]
+    assert "mehrfach" in messages[1]
+
+
+def test_bulk_validates_request_shape(client, start_tournament):
+    start_tournament(client)
+    assert client.post("/mtg/save_results/bulk", json={"results": []}).status_code == 400
+    assert client.post("/mtg/save_results/bulk", json={"round": 1, "results": []}).status_code == 400
+    assert client.post("/mtg/save_results/bulk", json={"round": 5, "results": [{"table": "1"}]}).status_code == 404
+
+
+def test_bulk_keeps_other_tables_when_one_db_update_fails(
+    client, app, seeded_random, monkeypatch, start_tournament, round_rows
+):
+    import app.routes as routes
+
+    tournament_id = start_tournament(client)
+    rows = round_rows(tournament_id)
+    failing_table = int(rows[0]["table"])
+    original_update = routes._update_match_result_in_db
+
+    def flaky_update(**kwargs):
+        original_update(**kwargs)
+        if kwargs["table_number"] == failing_table:
+            raise RuntimeError("DB weg")
+
+    monkeypatch.setattr(routes, "_update_match_result_in_db", flaky_update)
+
+    response = client.post("/mtg/save_results/bulk", json={"round": 1, "results": _results_for(rows)})
+
+    payload = response.get_json()
+    assert response.status_code == 207
+    assert payload["partial"] is True
+    assert [error["table"] for error in payload["errors"]] == [rows[0]["table"]]
+    with app.app_context():
+        round_row = Round.query.filter_by(tournament_id=tournament_id, number=1).one()
+        scores = {match.table_number: match.score1 for match in Match.query.filter_by(round_id=round_row.id)}
+    assert scores.pop(failing_table) is None
+    assert set(scores.values()) == {2}
+
+
+def test_bulk_stores_table_size_and_power_nine(client, app, seeded_random, start_tournament, round_rows):
+    tournament_id = start_tournament(client)
+    rows = round_rows(tournament_id)
+    results = _results_for(rows[:1])
+    results[0]["table_size"] = "8"
+    results[0]["player1_power_nine"] = {"Black Lotus": True, "Time Walk": False}
+
+    response = client.post("/mtg/save_results/bulk", json={"round": 1, "results": results})
+
+    assert response.status_code == 200, response.get_json()
+    assert round_rows(tournament_id)[0]["table_size"] == "8"
+    with app.app_context():
+        owned = {
+            row.card_name
+            for row in PlayerPowerNine.query.filter_by(tournament_id=tournament_id, has_card=True)
+        }
+    assert owned == {"Black Lotus"}
+
+
+def test_bulk_rejects_unknown_fields_and_bad_power_nine(client, seeded_random, start_tournament, round_rows):
+    tournament_id = start_tournament(client)
+    rows = round_rows(tournament_id)
+    results = _results_for(rows[:3])
+    results[0]["comment"] = "egal"
+    results[1]["table_size"] = "7"
+    results[2]["player2_power_nine"] = {"Sol Ring": True}
+
+    response = client.post("/mtg/save_results/bulk", json={"round": 1, "results": results})
+
+    assert response.status_code == 400
+    messages = [error["message"] for error in response.get_json()["errors"]]
+    assert "Unbekannte Felder: comment" in messages[0]
+    assert "Tischgröße" in messages[1]
+    assert "Sol Ring" in messages[2]
+    assert round_rows(tournament_id) == rows
+
+
+def test_bulk_endpoint_is_rate_limited(app):
+    assert "main.save_results_bulk" in app.config["RATE_LIMITED_ENDPOINTS"]
+
+
+def test_bulk_power_nine_failure_rolls_back_only_its_table(
+    client, app, seeded_random, monkeypatch, start_tournament, round_rows
+):
+    import app.routes as routes
+
+    tournament_id = start_tournament(client)
+    rows = round_rows(tournament_id)
+    results = _results_for(rows)
+    failing_player = rows[1]["player1"]
+    for entry in results:
+        entry["player1_power_nine"] = {"Black Lotus": True}
+    original_upsert = routes._upsert_tournament_power_nine
+
+    def flaky_upsert(tid, player_name, data):
+        player = original_upsert(tid, player_name, data)
+        if player_name == failing_player:
+            raise RuntimeError("DB weg")
+        return player
+
+    monkeypatch.setattr(routes, "_upsert_tournament_power_nine", flaky_upsert)
+
+    response = client.post("/mtg/save_results/bulk", json={"round": 1, "results": results})
+
+    payload = response.get_json()
+    assert response.status_code == 207
+    assert [error["table"] for error in payload["errors"]] == [rows[1]["table"]]
+    with app.app_context():
+        round_row = Round.query.filter_by(tournament_id=tournament_id, number=1).one()
+        scores = {match.table_number: match.score1 for match in Match.query.filter_by(round_id=round_row.id)}
+        lotus_owners = PlayerPowerNine.query.filter_by(tournament_id=tournament_id, has_card=True).count()
+    assert scores.pop(int(rows[1]["table"])) is None
+    assert set(scores.values()) == {2}
+    assert lotus_owners == len(rows) - 1
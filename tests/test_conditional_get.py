@@ -0,0 +1,62 @@
+import app.routes as routes
+
+
+def test_show_round_answers_304_until_result_is_saved(client, start_tournament, round_rows, save_result):
+    tournament_id = start_tournament(client, 6)
+    first = client.get("/mtg/round/1")
+    assert first.status_code == 200
+    # Erster Render legt den CSRF-Token an; danach ist der ETag stabil.
+    etag = client.get("/mtg/round/1").headers["ETag"]
+    assert etag
+    assert client.get("/mtg/round/1").headers["Last-Modified"]
+
+    cached = client.get("/mtg/round/1", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.data == b""
+
+    save_result(client, round_rows(tournament_id)[0])
+
+    refreshed = client.get("/mtg/round/1", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["ETag"] != etag
+
+
+def test_show_round_304_skips_leaderboard_computation(client, monkeypatch, start_tournament):
+    start_tournament(client, 6)
+    client.get("/mtg/round/1")
+    etag = client.get("/mtg/round/1").headers["ETag"]
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("Leaderboard darf bei 304 nicht berechnet werden")
+
+    monkeypatch.setattr(routes, "calculate_leaderboard", _fail)
+    monkeypatch.setattr(routes, "get_active_tournaments", _fail)
+    response = client.get("/mtg/round/1", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_players_list_etag_changes_after_result(client, start_tournament, round_rows, save_result):
+    tournament_id = start_tournament(client, 6)
+    client.get("/mtg/players")
+    etag = client.get("/mtg/players").headers["ETag"]
+    assert client.get("/mtg/players", headers={"If-None-Match": etag}).status_code == 304
+
+    save_result(client, round_rows(tournament_id)[0])
+    assert client.get("/mtg/players", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_player_profile_version_is_scoped_to_player(client, start_tournament, round_rows, save_result):
+    tournament_id = start_tournament(client, 6)
+    rows = round_rows(tournament_id)
+    first, second = rows[0], rows[1]
+
+    url = f"/mtg/player/{first['player1']}"
+    client.get(url)
+    etag = client.get(url).headers["ETag"]
+
+    # Ergebnis eines fremden Tisches ändert das Profil nicht.
+    save_result(client, second)
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    save_result(client, first)
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 200
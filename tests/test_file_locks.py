@@ -0,0 +1,75 @@
+import threading
+import time
+
+from flask import g
+
+from app.file_locks import file_lock, tournament_lock
+
+
+def test_lock_wait_is_recorded_in_request_globals(app):
+    holder_ready = threading.Event()
+    release = threading.Event()
+
+    def _holder():
+        with file_lock("tournament-demo"):
+            holder_ready.set()
+            release.wait(2)
+
+    thread = threading.Thread(target=_holder)
+    thread.start()
+    holder_ready.wait(2)
+    threading.Timer(0.05, release.set).start()
+    with app.test_request_context():
+        with tournament_lock("demo"):
+            pass
+        assert g.lock_wait_ms >= 40
+    thread.join()
+
+
+def test_locks_of_different_tournaments_do_not_block(app):
+    with tournament_lock("a"):
+        started = time.monotonic()
+        with tournament_lock("b"):
+            pass
+        assert time.monotonic() - started < 0.5
+
+
+def test_parallel_result_entry_keeps_both_tables(app, client, start_tournament, round_rows):
+    tournament_id = start_tournament(client)
+    rows = round_rows(tournament_id)[:2]
+    clients = [client, app.test_client()]
+    with clients[1].session_transaction() as sess:
+        sess["tournament_id"] = tournament_id
+
+    barrier = threading.Barrier(2)
+    statuses = []
+
+    def _save(scorekeeper, row):
+        barrier.wait()
+        response = scorekeeper.post(
+            "/mtg/save_results",
+            data={
+                "table": row["table"],
+                "player1": row["player1"],
+                "player2": row["player2"],
+                "score1": "2",
+                "score2": "0",
+                "score_draws": "0",
+                "current_round": "1",
+                "dropout1": "false",
+                "dropout2": "false",
+                "table_size": row["table_size"],
+            },
+        )
+        statuses.append(response.status_code)
+
+    threads = [threading.Thread(target=_save, args=(scorekeeper, row)) for scorekeeper, row in zip(clients, rows)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert statuses == [200, 200]
+    saved = {row["table"]: row for row in round_rows(tournament_id)}
+    for row in rows:
+        assert saved[row["table"]]["score1"] == "2"
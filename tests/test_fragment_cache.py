@@ -0,0 +1,57 @@
+import app.routes as routes
+from app.services.fragment_cache import CSRF_SENTINEL, FragmentCache
+
+
+def test_lru_evicts_least_recently_used_entry():
+    cache = FragmentCache(max_entries=2)
+    cache.set(("a", 1), "A")
+    cache.set(("b", 1), "B")
+    assert cache.get(("a", 1)) == "A"
+    cache.set(("c", 1), "C")
+    assert cache.get(("b", 1)) is None
+    assert cache.get(("a", 1)) == "A"
+    assert cache.invalidate("a") == 1
+    assert len(cache) == 1
+
+
+def test_repeated_round_view_serves_cached_fragment(client, monkeypatch, start_tournament):
+    start_tournament(client, 6)
+    first = client.get("/mtg/round/1")
+    assert first.status_code == 200
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("Fragment hätte aus dem Cache kommen müssen")
+
+    monkeypatch.setattr(routes, "calculate_leaderboard", _fail)
+    monkeypatch.setattr(routes, "get_active_tournaments", _fail)
+    second = client.get("/mtg/round/1")
+    assert second.status_code == 200
+    html = second.get_data(as_text=True)
+    assert CSRF_SENTINEL not in html
+    with client.session_transaction() as sess:
+        assert f'name="csrf_token" value="{sess["csrf_token"]}"' in html
+    assert 'class="leaderboard"' in html
+
+
+def test_saved_result_invalidates_round_fragment(client, start_tournament, round_rows):
+    tournament_id = start_tournament(client, 6)
+    client.get("/mtg/round/1")
+    row = round_rows(tournament_id)[0]
+    response = client.post(
+        "/mtg/save_results",
+        data={
+            "table": row["table"],
+            "player1": row["player1"],
+            "player2": row["player2"],
+            "score1": "1",
+            "score2": "1",
+            "score_draws": "1",
+            "current_round": "1",
+            "dropout1": "false",
+            "dropout2": "false",
+            "table_size": row["table_size"],
+        },
+    )
+    assert response.status_code == 200
+    html = client.get("/mtg/round/1").get_data(as_text=True)
+    assert "Draws: 1" in html
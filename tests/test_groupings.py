@@ -0,0 +1,34 @@
+from app.routes import _enumerate_groupings, find_all_valid_groupings
+
+
+def test_groupings_are_unique_and_ranked():
+    groupings = find_all_valid_groupings(64, [12, 6, 10, 8, 8])
+    assert len(groupings) == len(set(groupings))
+    assert all(sum(grouping) == 64 for grouping in groupings)
+    assert all(list(grouping) == sorted(grouping) for grouping in groupings)
+    # Wenigste Tische zuerst, bei Gleichstand die ausgeglichenste Verteilung.
+    assert groupings[0] == (10, 10, 10, 10, 12, 12)
+    ranks = [(len(g), max(g) - min(g)) for g in groupings]
+    assert ranks == sorted(ranks)
+
+
+def test_groupings_limit_and_unsatisfiable_counts():
+    assert find_all_valid_groupings(7, [6, 8]) == []
+    assert find_all_valid_groupings(12, [6]) == [(6, 6)]
+    assert len(find_all_valid_groupings(64, [6, 8, 10, 12], limit=3)) == 3
+
+
+def test_groupings_are_memoized_per_count_and_sizes():
+    _enumerate_groupings.cache_clear()
+    find_all_valid_groupings(120, [6, 8, 10, 12])
+    find_all_valid_groupings(120, [12, 10, 8, 6])
+    info = _enumerate_groupings.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_api_groupings_handles_large_rosters(client):
+    players = [f"Spieler {index}" for index in range(96)]
+    response = client.post("/mtg/api/groupings", json={"players": players, "group_sizes": [6, 8, 10, 12]})
+    assert response.status_code == 200
+    groupings = response.get_json()
+    assert groupings[0] == [12] * 8
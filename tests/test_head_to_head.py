@@ -0,0 +1,89 @@
+from app.services import head_to_head
+from app.services.head_to_head import head_to_head_page, player_head_to_head
+
+
+PLAYERS = ["Alice", "Bob", "Carol", "Dave", "Eve", "Frank", "Gina", "Hank"]
+
+
+def test_records_are_symmetric_and_filtered_by_cube(
+    client, app, seeded_random, start_tournament, round_rows, save_result
+):
+    row = round_rows(start_tournament(client))[0]
+    save_result(client, row, 2, 0, 1)
+    other_cube_rows = round_rows(start_tournament(client, cube="pauper"))
+    other_cube_row = next(r for r in other_cube_rows if row["player1"] in (r["player1"], r["player2"]))
+    save_result(client, other_cube_row, 2, 0)
+
+    with app.app_context():
+        vintage = player_head_to_head(row["player1"], cube_id="vintage")
+        assert vintage == [{
+            "opponent": row["player2"], "matches": 1, "wins": 1, "losses": 0, "draws": 0,
+            "games_won": 2, "games_lost": 0, "games_drawn": 1,
+        }]
+        mirrored = player_head_to_head(row["player2"], cube_id="vintage")[0]
+        assert (mirrored["wins"], mirrored["losses"], mirrored["games_lost"]) == (0, 1, 2)
+        # Die Pauper-Paarung kann denselben Gegner treffen.
+        overall = player_head_to_head(row["player1"])
+        assert sum(record["matches"] for record in overall) == 2
+        other_opponent = ({other_cube_row["player1"], other_cube_row["player2"]} - {row["player1"]}).pop()
+        assert {record["opponent"] for record in overall} == {row["player2"], other_opponent}
+
+
+def test_cached_per_players_version(client, app, seeded_random, monkeypatch, start_tournament, round_rows, save_result):
+    rows = round_rows(start_tournament(client))
+    save_result(client, rows[0], 2, 0)
+    calls = []
+    original = head_to_head.compute_head_to_head
+
+    def _counting(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(head_to_head, "compute_head_to_head", _counting)
+    with app.test_request_context():
+        head_to_head.get_head_to_head()
+        head_to_head.get_head_to_head()
+    assert calls == [1]
+
+    save_result(client, rows[1], 0, 2)
+    with app.test_request_context():
+        records = head_to_head.get_head_to_head()
+    assert calls == [1, 1]
+    assert rows[1]["player2"] in records
+
+
+def test_matrix_pages_rows_and_columns(client, app, seeded_random, start_tournament, round_rows, save_result):
+    rows = round_rows(start_tournament(client))
+    for row in rows:
+        save_result(client, row, 2, 0)
+
+    with app.test_request_context():
+        first = head_to_head_page(page=1, col_page=2, per_page=3)
+        last = head_to_head_page(page=99, per_page=3)
+    assert first["total_players"] == 8
+    assert first["pages"] == 3
+    assert len(first["players"]) == 3 and len(first["columns"]) == 3
+    assert first["players"] == sorted(PLAYERS)[:3]
+    assert first["columns"] == sorted(PLAYERS)[3:6]
+    assert all(cell["opponent"] in first["columns"] for cell in first["cells"])
+    assert last["page"] == 3 and last["players"] == sorted(PLAYERS)[6:]
+
+    response = client.get("/mtg/api/head_to_head?per_page=8")
+    payload = response.get_json()
+    assert payload["success"] is True
+    # Dünn besetzt: nur gespielte Paarungen, aus beiden Perspektiven.
+    assert len(payload["cells"]) == 2 * len(rows)
+
+
+def test_matrix_and_profile_pages_render(client, seeded_random, start_tournament, round_rows, save_result):
+    row = round_rows(start_tournament(client))[0]
+    save_result(client, row, 2, 1)
+
+    profile = client.get(f"/mtg/player/{row['player1']}")
+    matrix = client.get("/mtg/head_to_head")
+
+    assert matrix.status_code == 200
+    assert "1-0-0" in matrix.get_data(as_text=True)
+    assert "Direktvergleiche" in profile.get_data(as_text=True)
+    assert row["player2"] in profile.get_data(as_text=True)
+    assert client.get("/mtg/head_to_head", headers={"If-None-Match": matrix.headers["ETag"]}).status_code == 304
@@ -0,0 +1,189 @@
+import csv
+import json
+import os
+import uuid
+
+from app.db import db
+from app.models import Match, PlayerPowerNine, Round, Tournament
+from app.routes import check_tournament_status, get_last_tournaments
+from app.services.legacy_import import import_legacy_data
+from app.tournament_groups import get_tournament_group_id, load_tournament_meta
+
+
+ROUND_FIELDS = [
+    "table", "player1", "player2", "score1", "score2", "score_draws",
+    "dropout1", "dropout2", "table_size", "group_key",
+]
+RESULTS_FIELDS = ["Tournament", "Timestamp", "Round", "Table", "Player 1", "Score 1", "Player 2", "Score 2", "Draws"]
+
+
+def _write_csv(path, fieldnames, rows):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _write_json(path, payload):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f)
+
+
+def _legacy_tree():
+    ended_id = str(uuid.uuid4())
+    archived_id = str(uuid.uuid4())
+    _write_json("data/tournament_meta.json", {
+        ended_id: {"group_id": "liga", "cube_id": "vintage", "pairing_mode": "manual",
+                   "created_at": "2024-05-01T18:00:00+00:00"},
+        archived_id: {"group_id": "casual", "cube": "Pauper"},
+    })
+    round_row = {"score_draws": "0", "dropout1": "false", "dropout2": "false", "table_size": "8", "group_key": "8-1"}
+    _write_csv(f"data/{ended_id}/rounds/round_1.csv", ROUND_FIELDS, [
+        dict(round_row, table="1", player1="Alice", player2="Bob", score1="2", score2="1"),
+        dict(round_row, table="2", player1="Carol", player2="BYE", score1="2", score2="0"),
+    ])
+    _write_csv(f"data/{ended_id}/rounds/round_2.csv", ROUND_FIELDS, [
+        dict(round_row, table="1", player1="Alice", player2="Carol", score1="", score2="", dropout2="true"),
+    ])
+    with open(f"data/{ended_id}/end_time.txt", "w", encoding="utf-8") as f:
+        f.write("02.05.2024 22:15")
+    _write_json(f"data/{ended_id}/tournament_power_nine.json", {"Alice": {"Black Lotus": True, "Time Walk": False}})
+    _write_json(f"tournament_results/{archived_id}_results.json", {
+        "tournament_data": {"end_date": "03.05.2024 21:00", "total_rounds": 1},
+        "final_leaderboard": [["Dave", 3]],
+    })
+    _write_csv("tournament_data/results.csv", RESULTS_FIELDS, [
+        # Für Turniere mit Rundendateien gilt die Rundendatei.
+        {"Tournament": ended_id, "Round": "1", "Table": "1", "Player 1": "Alice", "Score 1": "0",
+         "Player 2": "Bob", "Score 2": "2", "Draws": "0"},
+        {"Tournament": archived_id, "Round": "1", "Table": "1", "Player 1": "Dave", "Score 1": "2",
+         "Player 2": "Erin", "Score 2": "0", "Draws": "1"},
+        {"Tournament": archived_id, "Round": "x", "Table": "2", "Player 1": "Dave", "Score 1": "2",
+         "Player 2": "Erin", "Score 2": "0", "Draws": "0"},
+    ])
+    return ended_id, archived_id
+
+
+def test_import_creates_rows_and_is_idempotent(app):
+    with app.app_context():
+        ended_id, archived_id = _legacy_tree()
+        progress = []
+
+        summary = import_legacy_data(batch_size=2, progress=lambda *args: progress.append(args))
+
+        assert summary == {"tournaments": 2, "rounds": 3, "matches": 4, "power_nine": 2, "skipped_rows": 1}
+        assert ("tournaments", 2, 2) in progress
+
+        ended = db.session.get(Tournament, ended_id)
+        assert (ended.status, ended.group_id, ended.cube_id, ended.pairing_mode) == ("ended", "liga", "vintage", "manual")
+        assert ended.current_round == 2
+        assert ended.ended_at.strftime("%d.%m.%Y %H:%M") == "02.05.2024 22:15"
+
+        first_round = Round.query.filter_by(tournament_id=ended_id, number=1).one()
+        alice_bob = Match.query.filter_by(round_id=first_round.id, table_number=1).one()
+        assert (alice_bob.score1, alice_bob.score2) == (2, 1)
+        bye = Match.query.filter_by(round_id=first_round.id, table_number=2).one()
+        assert bye.is_bye and bye.player2_id is None
+
+        archived = db.session.get(Tournament, archived_id)
+        assert (archived.status, archived.group_id, archived.cube_id) == ("ended", "casual", "pauper")
+        archived_match = Match.query.join(Round).filter(Round.tournament_id == archived_id).one()
+        assert (archived_match.player1_name_snapshot, archived_match.score_draws) == ("Dave", 1)
+
+        assert PlayerPowerNine.query.filter_by(tournament_id=ended_id, has_card=True).count() == 1
+
+        again = import_legacy_data()
+        assert again == {"tournaments": 0, "rounds": 0, "matches": 0, "power_nine": 0, "skipped_rows": 1}
+        assert Match.query.count() == 4
+
+
+def test_import_keeps_existing_db_rows(app):
+    with app.app_context():
+        ended_id, _archived_id = _legacy_tree()
+        import_legacy_data()
+        match = Match.query.join(Round).filter(Round.tournament_id == ended_id, Round.number == 1).first()
+        match.score1 = 0
+        db.session.commit()
+
+        import_legacy_data()
+
+        assert db.session.get(Match, match.id).score1 == 0
+
+
+def test_disabled_fallbacks_skip_file_probes(app):
+    with app.app_context():
+        ended_id, archived_id = _legacy_tree()
+        orphan_id = str(uuid.uuid4())
+        os.makedirs(f"data/{orphan_id}", exist_ok=True)
+        with open(f"data/{orphan_id}/end_time.txt", "w", encoding="utf-8") as f:
+            f.write("01.01.2024 10:00")
+        import_legacy_data()
+
+    app.config["LEGACY_FILE_FALLBACKS"] = False
+    with app.test_request_context():
+        assert check_tournament_status(ended_id) is True
+        # Nur in Dateien beendet (nicht importiert): ohne Fallback unbekannt.
+        db.session.delete(db.session.get(Tournament, orphan_id))
+        db.session.commit()
+        assert check_tournament_status(orphan_id) is False
+
+        last = get_last_tournaments(limit=5)
+        assert [row["id"] for row in last] == [archived_id, ended_id]
+        assert last[0]["winner"] == "Dave"
+        assert last[1]["date"] == "02.05.2024 22:15"
+        assert get_last_tournaments(limit=5, group_filter="liga")[0]["id"] == ended_id
+
+        assert load_tournament_meta()[ended_id]["pairing_mode"] == "manual"
+        assert get_tournament_group_id(orphan_id) == "default"
+
+
+def test_import_legacy_cli_reports_progress(app):
+    with app.app_context():
+        _legacy_tree()
+    result = app.test_cli_runner().invoke(args=["import-legacy", "--batch-size", "10"])
+    assert result.exit_code == 0, result.output
+    assert "Turniere: 2/2" in result.output
+    assert "2 Turnier(e), 3 Runde(n), 4 Match(es)" in result.output
+
+
+def test_import_reads_archived_bundles(app):
+    from app.tournament_archive import archive_ended_tournaments, is_archived
+
+    with app.app_context():
+        ended_id, archived_id = _legacy_tree()
+        assert archive_ended_tournaments()["archived"] == 2
+        assert not os.path.exists(f"data/{ended_id}")
+
+        summary = import_legacy_data()
+
+        assert summary == {"tournaments": 2, "rounds": 3, "matches": 4, "power_nine": 2, "skipped_rows": 1}
+        ended = db.session.get(Tournament, ended_id)
+        assert (ended.status, ended.current_round) == ("ended", 2)
+        assert ended.ended_at.strftime("%d.%m.%Y %H:%M") == "02.05.2024 22:15"
+        first_round = Round.query.filter_by(tournament_id=ended_id, number=1).one()
+        alice_bob = Match.query.filter_by(round_id=first_round.id, table_number=1).one()
+        assert (alice_bob.score1, alice_bob.score2) == (2, 1)
+        assert PlayerPowerNine.query.filter_by(tournament_id=ended_id, has_card=True).count() == 1
+        # Das Archiv bleibt unverändert, entpackt wird nur temporär.
+        assert is_archived(ended_id) and is_archived(archived_id)
+        assert not os.path.exists(f"data/{ended_id}")
+
+
+def test_reimport_does_not_restore_deleted_tournament(app, client):
+    with app.app_context():
+        ended_id, archived_id = _legacy_tree()
+        import_legacy_data()
+
+    assert client.post(f"/mtg/delete_tournament/{archived_id}").get_json()["success"] is True
+
+    with app.app_context():
+        import_legacy_data()
+
+        assert db.session.get(Tournament, archived_id) is None
+        assert Round.query.filter_by(tournament_id=archived_id).count() == 0
+        assert db.session.get(Tournament, ended_id) is not None
+    with open("tournament_data/results.csv", encoding="utf-8", newline="") as f:
+        remaining = [row["Tournament"] for row in csv.DictReader(f)]
+    assert remaining == [ended_id]
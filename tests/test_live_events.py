@@ -0,0 +1,68 @@
+def test_event_stream_delivers_saved_result(client, app, start_tournament, round_rows):
+    app.config["SSE_MAX_STREAM_SECONDS"] = 0
+    tournament_id = start_tournament(client, 6)
+    row = round_rows(tournament_id)[0]
+    response = client.post(
+        "/mtg/save_results",
+        data={
+            "table": row["table"],
+            "player1": row["player1"],
+            "player2": row["player2"],
+            "score1": "2",
+            "score2": "0",
+            "score_draws": "0",
+            "current_round": "1",
+            "dropout1": "false",
+            "dropout2": "false",
+            "table_size": row["table_size"],
+        },
+    )
+    assert response.status_code == 200
+
+    stream = client.get(f"/mtg/tournament/{tournament_id}/events?since=0")
+    assert stream.status_code == 200
+    assert stream.mimetype == "text/event-stream"
+    body = stream.get_data(as_text=True)
+    assert body.startswith("retry:")
+    assert "event: match_result" in body
+    assert f'"player1": "{row["player1"]}"' in body
+
+
+def test_event_stream_resumes_after_last_event_id(client, app, start_tournament):
+    app.config["SSE_MAX_STREAM_SECONDS"] = 0
+    tournament_id = start_tournament(client, 6)
+    stream = client.get(f"/mtg/tournament/{tournament_id}/events", headers={"Last-Event-ID": "999999"})
+    assert "event:" not in stream.get_data(as_text=True)
+
+
+def test_event_stream_rejects_invalid_tournament_id(client):
+    response = client.get("/mtg/tournament/not-a-uuid/events")
+    assert response.status_code == 400
+
+
+def test_event_stream_cap_returns_no_content_and_frees_slot_on_close(client, app, start_tournament):
+    from app import routes
+
+    app.config["SSE_MAX_STREAM_SECONDS"] = 0
+    app.config["SSE_MAX_STREAMS_PER_WORKER"] = 1
+    tournament_id = start_tournament(client, 6)
+    url = f"/mtg/tournament/{tournament_id}/events"
+
+    held = client.get(url, buffered=False)
+    assert held.status_code == 200
+    rejected = client.get(url)
+    assert rejected.status_code == 204
+    assert rejected.get_data() == b""
+
+    held.close()
+    assert routes._sse_open_streams == 0
+    assert client.get(url).status_code == 200
+    assert routes._sse_open_streams == 0
+
+
+def test_round_page_falls_back_to_polling(client, app, start_tournament):
+    app.config["SSE_FALLBACK_POLL_MS"] = 7000
+    start_tournament(client, 6)
+    html = client.get("/mtg/round/1").get_data(as_text=True)
+    assert "const liveFallbackPollMs = 7000;" in html
+    assert "startRoundStatePolling()" in html
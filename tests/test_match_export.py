@@ -0,0 +1,106 @@
+import csv
+import io
+import json
+from datetime import datetime
+
+from app.db import db
+from app.models import Match, Round
+from app.services.exports import EXPORT_COLUMNS, iter_csv, iter_match_history, parse_export_filters
+from app.services.players import get_or_create_players
+from app.services.tournaments import create_tournament
+
+
+def _seed_history(app):
+    with app.app_context():
+        players = get_or_create_players(["Alice", "Bob", "Carol"])
+        for tournament_id, group_id, cube_id, created_at in (
+            ("t-liga", "liga", "vintage", datetime(2024, 3, 1, 19, 0)),
+            ("t-casual", "casual", "pauper", datetime(2024, 6, 1, 19, 0)),
+        ):
+            create_tournament(tournament_id, group_id=group_id, cube_id=cube_id).created_at = created_at
+            round_row = Round(tournament_id=tournament_id, number=1, created_at=created_at)
+            db.session.add(round_row)
+            db.session.flush()
+            db.session.add_all([
+                Match(round_id=round_row.id, table_number=1, table_size=8, group_key="8-1",
+                      player1_id=players["Alice"].id, player2_id=players["Bob"].id,
+                      score1=2, score2=1, score_draws=0),
+                Match(round_id=round_row.id, table_number=2, table_size=8, group_key="8-1",
+                      player1_id=players["Carol"].id, is_bye=True, score1=2, score2=0, score_draws=0,
+                      dropout1=True),
+            ])
+        db.session.commit()
+
+
+def test_csv_export_streams_all_matches(app, client):
+    _seed_history(app)
+
+    response = client.get("/mtg/export/matches")
+
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == "text/csv"
+    assert "attachment" in response.headers["Content-Disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert [(row["tournament_id"], row["table"]) for row in rows] == [
+        ("t-liga", "1"), ("t-liga", "2"), ("t-casual", "1"), ("t-casual", "2"),
+    ]
+    assert rows[1]["player2"] == "BYE"
+    assert rows[1]["dropout1"] == "true"
+    assert rows[0]["score_draws"] == "0"
+
+
+def test_json_export_applies_filters(app, client):
+    _seed_history(app)
+
+    response = client.get("/mtg/export/matches?format=json&group=casual")
+    payload = json.loads(response.get_data(as_text=True))
+    assert {row["tournament_id"] for row in payload} == {"t-casual"}
+    assert payload[0]["player1"] == "Alice"
+    assert payload[0]["is_bye"] is False
+
+    response = client.get("/mtg/export/matches?format=json&from=2024-01-01&to=2024-03-01")
+    assert {row["tournament_id"] for row in json.loads(response.get_data(as_text=True))} == {"t-liga"}
+
+    response = client.get("/mtg/export/matches?format=json&cube=vintage&tournament=t-casual")
+    assert json.loads(response.get_data(as_text=True)) == []
+
+
+def test_export_rejects_invalid_parameters(client):
+    assert client.get("/mtg/export/matches?format=xml").status_code == 400
+    assert client.get("/mtg/export/matches?from=gestern").status_code == 400
+    assert client.get("/mtg/export/matches?from=2024-05-01&to=2024-04-01").status_code == 400
+
+
+def test_export_keeps_deleted_player_names_from_snapshot(app):
+    _seed_history(app)
+    with app.app_context():
+        match = Match.query.filter_by(table_number=1).first()
+        match.player2_id = None
+        match.player2_name_snapshot = "Bob (alt)"
+        db.session.commit()
+
+        rows = list(iter_match_history(parse_export_filters(tournament_id="t-liga")))
+        assert rows[0]["player2"] == "Bob (alt)"
+
+
+def test_csv_serializer_yields_in_chunks(app):
+    _seed_history(app)
+    with app.app_context():
+        chunks = list(iter_csv(iter_match_history(parse_export_filters(), chunk_size=1), chunk_size=1))
+
+    assert chunks[0].startswith(",".join(EXPORT_COLUMNS))
+    assert len(chunks) == 5
+
+
+def test_export_matches_cli_writes_file(app, tmp_path):
+    _seed_history(app)
+    target = tmp_path / "export.csv"
+
+    result = app.test_cli_runner().invoke(
+        args=["export-matches", "--output", str(target), "--group", "liga"]
+    )
+
+    assert result.exit_code == 0, result.output
+    rows = list(csv.DictReader(target.open(encoding="utf-8")))
+    assert [row["tournament_id"] for row in rows] == ["t-liga", "t-liga"]
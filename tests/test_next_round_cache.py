@@ -0,0 +1,62 @@
+import csv
+import os
+
+from app.pairing_cache import normalize_idempotency_key, state_fingerprint
+
+
+def test_repeated_post_with_same_key_reuses_created_round(
+    client, seeded_random, start_tournament, complete_round, count_pairing_runs
+):
+    tournament_id = start_tournament(client, 6)
+    complete_round(client, tournament_id)
+    calls = count_pairing_runs()
+
+    first = client.post("/mtg/next_round", data={"idempotency_key": "key-12345678"})
+    second = client.post("/mtg/next_round", data={"idempotency_key": "key-12345678"})
+
+    assert first.headers["Location"].endswith("/round/2")
+    assert second.headers["Location"].endswith("/round/2")
+    assert calls == [1]
+    assert not os.path.exists(os.path.join("data", tournament_id, "rounds", "round_3.csv"))
+    with client.session_transaction() as sess:
+        assert not sess.get("_flashes")
+
+
+def test_unchanged_state_reuses_cached_pairings(
+    client, seeded_random, start_tournament, round_rows, complete_round, count_pairing_runs
+):
+    tournament_id = start_tournament(client, 6)
+    complete_round(client, tournament_id)
+    calls = count_pairing_runs()
+
+    client.post("/mtg/next_round")
+    round_two = round_rows(tournament_id, 2)
+    # Runde 2 geht verloren (z.B. abgebrochener Schreibvorgang), Stand bis Runde 1 ist gleich.
+    os.remove(os.path.join("data", tournament_id, "rounds", "round_2.csv"))
+    client.post("/mtg/next_round")
+
+    assert calls == [1]
+    assert round_rows(tournament_id, 2) == round_two
+
+
+def test_fingerprint_covers_results_dropouts_and_mode(isolated_workspace):
+    rounds_dir = isolated_workspace / "rounds"
+    rounds_dir.mkdir()
+    round_file = rounds_dir / "round_1.csv"
+    round_file.write_text("table,player1,player2,score1,score2\n1,A,B,2,1\n", encoding="utf-8")
+    groups = {"6-1": ["A", "B"]}
+
+    base = state_fingerprint(str(rounds_dir), 1, groups, [], "auto")
+
+    assert state_fingerprint(str(rounds_dir), 1, groups, [], "auto") == base
+    assert state_fingerprint(str(rounds_dir), 1, groups, ["A"], "auto") != base
+    assert state_fingerprint(str(rounds_dir), 1, groups, [], "manual") != base
+    round_file.write_text("table,player1,player2,score1,score2\n1,A,B,1,2\n", encoding="utf-8")
+    assert state_fingerprint(str(rounds_dir), 1, groups, [], "auto") != base
+
+
+def test_idempotency_key_format():
+    assert normalize_idempotency_key(" 0f8e2b9c-1d2e-4f50-a1b2-c3d4e5f60718 ") == "0f8e2b9c-1d2e-4f50-a1b2-c3d4e5f60718"
+    assert normalize_idempotency_key("kurz") is None
+    assert normalize_idempotency_key("../../etc/passwd") is None
+    assert normalize_idempotency_key(None) is None
@@ -0,0 +1,116 @@
+import csv
+import os
+
+import pytest
+
+from app import pairing_executor
+from app.pairing_executor import pair_pods, pool_size_for, shutdown_pool, start_pool
+from app.swiss_pairing import generate_swiss_pairings
+
+
+def _pods():
+    pods = [[f"P{pod}-{seat}" for seat in range(10)] for pod in range(3)]
+    points = {player: (index % 4) * 3 for pod in pods for index, player in enumerate(pod)}
+    opponents = {}
+    for pod in pods:
+        opponents.update({pod[0]: [pod[1]], pod[1]: [pod[0]], pod[2]: [(pod[3], "W")], pod[3]: [(pod[2], "L")]})
+    return pods, points, opponents
+
+
+@pytest.fixture
+def pool_cleanup():
+    yield
+    shutdown_pool()
+
+
+def test_process_pool_matches_inline_results_in_pod_order(pool_cleanup):
+    pods, points, opponents = _pods()
+    pods.append(["Solo-1", "Solo-2", "Solo-3"])
+    bye_counts = {"Solo-1": 1}
+    assert start_pool(2) == 2
+
+    parallel = pair_pods(pods, points, opponents, bye_counts, max_workers=2, min_parallel_players=4)
+
+    inline = [generate_swiss_pairings(pod, points, opponents, bye_counts) for pod in pods]
+    assert parallel == inline
+    assert parallel[3]["bye_player"] != "Solo-1"
+    assert pairing_executor._POOL is not None
+
+
+def test_small_pods_stay_inline(monkeypatch):
+    pods, points, opponents = _pods()
+    monkeypatch.setattr(pairing_executor, "_get_pool", lambda workers: pytest.fail("Pool unerwartet benutzt"))
+
+    assert len(pair_pods(pods, points, opponents, {}, max_workers=4, min_parallel_players=11)) == 3
+    assert len(pair_pods(pods[:1], points, opponents, {}, max_workers=4, min_parallel_players=2)) == 1
+    assert len(pair_pods(pods, points, opponents, {}, max_workers=1, min_parallel_players=2)) == 3
+
+
+def test_requests_never_start_a_pool(monkeypatch):
+    pods, points, opponents = _pods()
+    monkeypatch.setattr(pairing_executor, "ProcessPoolExecutor", lambda *a, **k: pytest.fail("Pool im Request gestartet"))
+
+    results = pair_pods(pods, points, opponents, {}, max_workers=4, min_parallel_players=2)
+
+    assert results == [generate_swiss_pairings(pod, points, opponents, {}) for pod in pods]
+    assert pairing_executor._POOL is None
+
+
+def test_pool_size_is_shared_across_processes(monkeypatch):
+    monkeypatch.setattr(pairing_executor.os, "cpu_count", lambda: 8)
+    assert pool_size_for(4, processes=2) == 4
+    assert pool_size_for(4, processes=4) == 2
+    assert pool_size_for(4, processes=8) == 0
+    assert pool_size_for(0, processes=1) == 0
+    assert start_pool(1) == 0 and pairing_executor._POOL is None
+
+
+def test_pool_is_off_by_default(app):
+    assert app.config["PAIRING_POOL_WORKERS"] == 0
+
+
+def test_unavailable_pool_falls_back_to_inline(monkeypatch):
+    pods, points, opponents = _pods()
+
+    def _broken_pool(workers):
+        raise OSError("keine Prozesse erlaubt")
+
+    monkeypatch.setattr(pairing_executor, "_get_pool", _broken_pool)
+
+    results = pair_pods(pods, points, opponents, {}, max_workers=2, min_parallel_players=2)
+
+    assert results == [generate_swiss_pairings(pod, points, opponents, {}) for pod in pods]
+
+
+def test_next_round_numbers_tables_in_group_order(client, app, seeded_random, pool_cleanup):
+    app.config.update(PAIRING_POOL_WORKERS=2, PAIRING_PARALLEL_MIN_PLAYERS=2)
+    start_pool(2)
+    players = [f"Spieler {index}" for index in range(12)]
+    response = client.post(
+        "/mtg/pair",
+        data={"players": players, "group_sizes": ["6"], "tournament_group": "liga", "tournament_cube": "vintage"},
+    )
+    assert response.status_code in (302, 303)
+    with client.session_transaction() as sess:
+        tournament_id = sess["tournament_id"]
+    round_path = os.path.join("data", tournament_id, "rounds", "round_1.csv")
+    with open(round_path, encoding="utf-8") as f:
+        first_round = list(csv.DictReader(f))
+    for row in first_round:
+        client.post("/mtg/save_results", data={
+            "table": row["table"], "player1": row["player1"], "player2": row["player2"],
+            "score1": "2", "score2": "0", "score_draws": "0", "current_round": "1",
+            "dropout1": "false", "dropout2": "false", "table_size": row["table_size"],
+        })
+
+    response = client.post("/mtg/next_round")
+
+    assert response.status_code in (302, 303)
+    with open(os.path.join("data", tournament_id, "rounds", "round_2.csv"), encoding="utf-8") as f:
+        second_round = list(csv.DictReader(f))
+    assert [row["table"] for row in second_round] == [str(number) for number in range(1, 7)]
+    group_order = [row["group_key"] for row in second_round]
+    assert group_order == sorted(group_order, key=[row["group_key"] for row in first_round].index)
+    assert len(set(group_order)) == 2
+    first_pairs = {frozenset((row["player1"], row["player2"])) for row in first_round}
+    assert not first_pairs & {frozenset((row["player1"], row["player2"])) for row in second_round}
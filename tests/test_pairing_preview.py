@@ -0,0 +1,72 @@
+import csv
+import os
+
+from app.models import Round
+
+
+def test_preview_returns_pairings_without_persisting(
+    client, app, seeded_random, start_tournament, round_path, complete_round
+):
+    tournament_id = start_tournament(client)
+    complete_round(client, tournament_id)
+
+    response = client.get("/mtg/next_round/preview")
+
+    payload = response.get_json()
+    assert response.status_code == 200, payload
+    assert payload["round"] == 2
+    assert response.headers["Cache-Control"] == "no-store"
+    assert len(payload["matches"]) == 4
+    assert payload["byes"] == []
+    assert payload["repeat_pairs"] == []
+    assert payload["groups"][0]["bye_player"] is None
+    assert payload["cached"] is False
+    assert set(payload["timing_ms"]) == {"pairing", "total"}
+    assert not os.path.exists(round_path(tournament_id, 2))
+    with app.app_context():
+        assert Round.query.filter_by(tournament_id=tournament_id, number=2).first() is None
+
+    assert client.get("/mtg/next_round/preview").get_json()["cached"] is True
+
+
+def test_confirm_commits_previewed_pairings(
+    client, seeded_random, start_tournament, round_path, complete_round, count_pairing_runs
+):
+    tournament_id = start_tournament(client)
+    complete_round(client, tournament_id)
+    calls = count_pairing_runs()
+
+    preview = client.get("/mtg/next_round/preview").get_json()
+    response = client.post("/mtg/next_round", data={"fingerprint": preview["fingerprint"]})
+
+    assert response.headers["Location"].endswith("/round/2")
+    assert calls == [1]
+    with open(round_path(tournament_id, 2), encoding="utf-8") as f:
+        saved = [(row["player1"], row["player2"]) for row in csv.DictReader(f)]
+    assert saved == [(match["player1"], match["player2"]) for match in preview["matches"]]
+
+
+def test_confirm_with_stale_fingerprint_is_rejected(
+    client, seeded_random, start_tournament, round_path, complete_round
+):
+    tournament_id = start_tournament(client)
+    complete_round(client, tournament_id)
+
+    response = client.post("/mtg/next_round", data={"fingerprint": "0" * 64})
+
+    assert response.headers["Location"].endswith("/round/1")
+    assert not os.path.exists(round_path(tournament_id, 2))
+    with client.session_transaction() as sess:
+        assert any("Vorschau" in message for _category, message in sess["_flashes"])
+
+
+def test_preview_reports_incomplete_round(client, seeded_random, start_tournament):
+    tournament_id = start_tournament(client)
+
+    response = client.get("/mtg/next_round/preview")
+
+    assert response.status_code == 409
+    payload = response.get_json()
+    assert payload["success"] is False
+    assert payload["round"] == 1
+    assert not os.path.exists(os.path.join("data", tournament_id, "pairing_cache.json"))
@@ -89,3 +89,43 @@ def test_save_results_updates_csv_and_db_consistently(client, app):
     with open(results_file, "r", encoding="utf-8") as f:
         line_count_after_reload = sum(1 for _ in f)
     assert line_count_after_reload == line_count_before_reload
+
+
+
+def test_round_resync_only_touches_changed_tables(client, app):
+    from sqlalchemy import event
+
+    from app.routes import _sync_round_to_db
+
+    tournament_id = _start_tournament(client)
+    round_path = os.path.join("data", tournament_id, "rounds", "round_1.csv")
+    with open(round_path, "r", encoding="utf-8") as f:
+        csv_rows = list(csv.DictReader(f))
+    csv_rows[0]["score1"] = "2"
+    csv_rows[0]["score2"] = "0"
+
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(" ".join(statement.split()).upper())
+
+    with app.test_request_context():
+        original_ids = {
+            row.table_number: row.id
+            for row in Match.query.join(Round).filter(Round.tournament_id == tournament_id).all()
+        }
+        engine = db.engine
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            _sync_round_to_db(tournament_id, 1, csv_rows)
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+        matches = Match.query.join(Round).filter(Round.tournament_id == tournament_id).all()
+        assert {row.table_number: row.id for row in matches} == original_ids
+        changed = next(row for row in matches if row.table_number == int(csv_rows[0]["table"]))
+        assert (changed.score1, changed.score2) == (2, 0)
+
+    assert not [s for s in statements if s.startswith(("INSERT INTO MATCHES", "DELETE FROM MATCHES", "INSERT INTO PLAYERS"))]
+    assert len([s for s in statements if s.startswith("UPDATE MATCHES")]) == 1
+    assert len([s for s in statements if s.startswith("SELECT") and "FROM PLAYERS" in s]) == 1
@@ -2,7 +2,7 @@ import json
 import os
 
 from app.models import Match, Player
-from app.player_stats import delete_player
+from app.player_stats import delete_player, delete_player_with_counts
 
 
 def _start_tournament(client, players=None):
@@ -53,6 +53,30 @@ def test_hard_delete_removes_player_and_freezes_match_name(app, client):
     assert "Alice" not in html
 
 
+def test_hard_delete_reports_counts_and_keeps_existing_snapshots(app, client):
+    _start_tournament(client)
+
+    with app.app_context():
+        from app.db import db
+
+        alice_id = Player.query.filter_by(name="Alice").first().id
+        slot1 = Match.query.filter_by(player1_id=alice_id).count()
+        slot2 = Match.query.filter_by(player2_id=alice_id).count()
+        match = Match.query.filter((Match.player1_id == alice_id) | (Match.player2_id == alice_id)).first()
+        column = "player1_name_snapshot" if match.player1_id == alice_id else "player2_name_snapshot"
+        setattr(match, column, "Alice (Snapshot)")
+        db.session.commit()
+        match_id = match.id
+
+        counts = delete_player_with_counts("alice")
+        assert counts["players"] == 1
+        assert counts["player1_matches"] == slot1
+        assert counts["player2_matches"] == slot2
+        assert getattr(db.session.get(Match, match_id), column) == "Alice (Snapshot)"
+
+        assert delete_player_with_counts("Alice")["players"] == 0
+
+
 def test_player_delete_dialog_text_is_simplified(client):
     _start_tournament(client)
     profile = client.get("/mtg/player/Bob")
@@ -0,0 +1,49 @@
+import uuid
+
+from sqlalchemy import event, insert
+
+from app.db import db
+from app.models import Player
+from app.services.players import get_or_create_players
+
+
+def test_get_or_create_players_normalizes_and_reuses_rows(app):
+    with app.app_context():
+        db.session.add(Player(name="Alice", normalized_name="alice"))
+        db.session.commit()
+
+        resolved = get_or_create_players(["Alice", " alice ", "Bob", "", None, "BOB"])
+        db.session.commit()
+
+        assert resolved["Alice"].id == resolved["alice"].id
+        assert resolved["Bob"] is resolved["BOB"]
+        assert Player.query.count() == 2
+
+
+def test_get_or_create_players_retries_once_on_concurrent_insert(app):
+    with app.app_context():
+        engine = db.engine
+        state = {"injected": False}
+
+        def _concurrent_start(conn, cursor, statement, parameters, context, executemany):
+            if state["injected"] or not statement.lstrip().upper().startswith("SELECT") or "players" not in statement:
+                return
+            state["injected"] = True
+            # Simuliert einen parallelen Turnierstart, der "Bob" zuerst anlegt.
+            with engine.begin() as other:
+                other.execute(
+                    insert(Player.__table__).values(
+                        id=str(uuid.uuid4()), name="Bob", normalized_name="bob", created_at=db.func.now()
+                    )
+                )
+
+        event.listen(engine, "after_cursor_execute", _concurrent_start)
+        try:
+            resolved = get_or_create_players(["Bob", "Carol"])
+            db.session.commit()
+        finally:
+            event.remove(engine, "after_cursor_execute", _concurrent_start)
+
+        assert state["injected"]
+        assert set(resolved) == {"Bob", "Carol"}
+        assert Player.query.count() == 2
@@ -0,0 +1,73 @@
+from app.models import Player
+from app.services.normalize import normalize_name
+from app.services.player_index import PlayerPrefixIndex, get_player_index
+from app.services.players import get_or_create_players
+
+
+def test_prefix_index_matches_diacritics_and_word_starts():
+    index = PlayerPrefixIndex(["Hans Müller", "Hannah", "Ängelo", "Bob", "DELETED_PLAYER_1"])
+
+    assert index.search("han") == ["Hannah", "Hans Müller"]
+    assert index.search("MUL") == ["Hans Müller"]
+    assert index.search("  ange") == ["Ängelo"]
+    assert index.search("h", limit=1) == ["Hannah"]
+    assert index.search("") == []
+    assert index.search("deleted") == []
+
+
+def test_index_rebuilds_after_player_create_and_delete(client, app):
+    with app.app_context():
+        get_or_create_players(["Zoë"])
+        app.extensions.pop("player_prefix_index", None)
+        first = get_player_index()
+        assert get_player_index() is first
+
+    assert client.get("/mtg/api/players/suggest?q=zo").get_json()["names"] == ["Zoë"]
+
+    with app.app_context():
+        get_or_create_players(["Zora"])
+        from app.db import db
+        db.session.commit()
+    assert client.get("/mtg/api/players/suggest?q=zo").get_json()["names"] == ["Zoë", "Zora"]
+
+    client.post("/mtg/player/Zora/delete")
+    assert client.get("/mtg/api/players/suggest?q=zo").get_json()["names"] == ["Zoë"]
+
+
+def test_suggest_limits_results(client, app):
+    with app.app_context():
+        get_or_create_players([f"Spieler {index:02d}" for index in range(80)])
+        from app.db import db
+        db.session.commit()
+        assert Player.query.filter_by(normalized_name=normalize_name("Spieler 00")).first() is not None
+
+    assert len(client.get("/mtg/api/players/suggest?q=spieler").get_json()["names"]) == 10
+    assert len(client.get("/mtg/api/players/suggest?q=spieler&limit=500").get_json()["names"]) == 50
+    assert client.get("/mtg/api/players/suggest?q=spieler 7&limit=3").get_json()["names"] == [
+        "Spieler 70", "Spieler 71", "Spieler 72"
+    ]
+
+
+def test_similar_names_catch_typos_at_the_start():
+    index = PlayerPrefixIndex(["Hannah", "Hans Müller", "Bob", "DELETED_PLAYER_1"])
+
+    assert index.similar("Jannah") == ["Hannah"]
+    assert index.similar("hnas müller")[0] == "Hans Müller"
+    assert index.similar("Bbo") == ["Bob"]
+    assert index.similar("Zebulon") == []
+    assert index.similar("deleted_player_1") == []
+    assert index.similar("") == []
+
+
+def test_similar_endpoint_searches_all_players(client, app):
+    with app.app_context():
+        get_or_create_players(["Enrique"] + [f"Spieler {index:02d}" for index in range(80)])
+        from app.db import db
+        db.session.commit()
+
+    payload = client.get("/mtg/api/players/similar?name=Anrique").get_json()
+    assert payload["success"] is True
+    assert payload["names"] == ["Enrique"]
+    assert len(client.get("/mtg/api/players/similar?name=Spieler&limit=3").get_json()["names"]) <= 3
+    assert client.get("/mtg/api/players/similar?name=").get_json()["names"] == []
+    assert "/mtg/api/players/similar" in client.get("/mtg/").get_data(as_text=True)
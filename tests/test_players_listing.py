@@ -0,0 +1,116 @@
+import csv
+import os
+
+from app.db import db
+from app.models import Player, PlayerPowerNine
+from app.player_stats import get_player_statistics
+from app.services.player_listing import players_page
+
+
+PLAYERS = ["Alice", "Bob", "Carol", "Dave", "Eve", "Frank", "Gina", "Hank"]
+SCORES = [(2, 0), (2, 1), (1, 2), (1, 1)]
+
+
+def _play_tournament(client, cube, score_count):
+    response = client.post(
+        "/mtg/pair",
+        data={"players": PLAYERS, "group_sizes": ["8"], "tournament_group": "liga", "tournament_cube": cube},
+    )
+    assert response.status_code in (302, 303)
+    with client.session_transaction() as sess:
+        tournament_id = sess["tournament_id"]
+    with open(os.path.join("data", tournament_id, "rounds", "round_1.csv"), encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    for row, (score1, score2) in zip(rows, SCORES[:score_count]):
+        response = client.post("/mtg/save_results", data={
+            "table": row["table"], "player1": row["player1"], "player2": row["player2"],
+            "score1": str(score1), "score2": str(score2), "score_draws": "0", "current_round": "1",
+            "dropout1": "false", "dropout2": "false", "table_size": "8",
+        })
+        assert response.status_code == 200
+    return tournament_id
+
+
+def _all_pages(**kwargs):
+    names, after = [], None
+    while True:
+        page = players_page(after=after, per_page=3, **kwargs)
+        names.extend(player["name"] for player in page["players"])
+        after = page["next_cursor"]
+        if after is None:
+            return names
+
+
+def test_page_stats_match_per_player_statistics(client, app, seeded_random):
+    vintage_id = _play_tournament(client, "vintage", 4)
+    _play_tournament(client, "pauper", 2)
+
+    with app.app_context():
+        alice = Player.query.filter_by(name="Alice").one()
+        for card in ("Black Lotus", "Time Walk"):
+            db.session.add(PlayerPowerNine(tournament_id=vintage_id, player_id=alice.id, card_name=card, has_card=True))
+        db.session.commit()
+
+        for cube_id in (None, "vintage", "pauper"):
+            page = players_page(cube_id=cube_id, per_page=100)
+            for player in page["players"]:
+                expected = get_player_statistics(player["name"], cube_filter=cube_id or "all")
+                assert player["total_matches"] == expected["total_matches"]
+                assert player["matches_won"] == expected["matches_won"]
+                assert player["match_win_percentage"] == expected["match_win_percentage"]
+                assert player["tournaments_played"] == expected["tournaments_played"]
+                if cube_id == "vintage":
+                    assert player["power_nine_count"] == expected["power_nine_total"]
+            # Mit Cube-Filter nur Spieler, die dort gespielt haben.
+            assert len(page["players"]) == (8 if cube_id in (None, "vintage") else 4)
+
+
+def test_keyset_pages_cover_full_sorted_list(client, app, seeded_random):
+    _play_tournament(client, "vintage", 4)
+    _play_tournament(client, "vintage", 3)
+
+    with app.app_context():
+        for sort in ("win_rate", "matches", "tournaments"):
+            for order in ("desc", "asc"):
+                full = players_page(sort=sort, order=order, per_page=100)["players"]
+                assert _all_pages(sort=sort, order=order) == [player["name"] for player in full]
+
+        full = players_page(per_page=100)["players"]
+        rates = [player["matches_won"] / max(1, player["total_matches"]) for player in full]
+        assert rates == sorted(rates, reverse=True)
+
+
+def test_min_matches_and_invalid_parameters(client, app, seeded_random):
+    _play_tournament(client, "vintage", 4)
+    _play_tournament(client, "vintage", 1)
+
+    with app.app_context():
+        everyone = players_page(per_page=100)["players"]
+        filtered = players_page(min_matches=2, per_page=100)
+        assert filtered["min_matches"] == 2
+        assert [player["name"] for player in filtered["players"]] == [
+            player["name"] for player in everyone if player["total_matches"] >= 2
+        ]
+        assert 0 < len(filtered["players"]) < len(everyone)
+
+        fallback = players_page(sort="power_nine", after="kaputt", per_page=100)
+        assert fallback["sort"] == "win_rate"
+        assert fallback["is_first_page"] is True
+
+
+def test_players_route_sorts_and_pages(client, seeded_random):
+    _play_tournament(client, "vintage", 4)
+
+    first = client.get("/mtg/players?sort=matches&order=asc&per_page=5")
+    html = first.get_data(as_text=True)
+    assert first.status_code == 200
+    assert 'value="matches" selected' in html
+    assert html.count('class="player-card"') == 5
+    assert "Weiter →" in html
+    start = html.rfind('href="', 0, html.index("Weiter →")) + len('href="')
+    next_url = html[start:html.index('"', start)].replace("&amp;", "&")
+
+    second = client.get(next_url).get_data(as_text=True)
+    assert second.count('class="player-card"') == 3
+    assert "Zum Anfang" in second
+    assert "Weiter →" not in second
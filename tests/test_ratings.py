@@ -0,0 +1,108 @@
+import pytest
+
+from app.models import MatchRatingDelta, Player, PlayerRating
+from app.services.ratings import INITIAL_RATING, rating_scope_for_filter, recompute_all_ratings
+
+
+PLAYERS = ["Alice", "Bob", "Carol", "Dave", "Eve", "Frank", "Gina", "Hank"]
+OTHER_PLAYERS = ["Ivan", "Jana", "Kurt", "Lena", "Mona", "Nils", "Olga", "Paul"]
+
+
+def _ratings(scope="all"):
+    rows = PlayerRating.query.filter_by(scope_key=scope).all()
+    names = {player.id: player.name for player in Player.query.all()}
+    return {names[row.player_id]: (row.rating, row.matches) for row in rows}
+
+
+def test_result_updates_ratings_in_all_scopes(client, app, start_tournament, round_rows, save_result):
+    tournament_id = start_tournament(client)
+    row = round_rows(tournament_id)[0]
+
+    save_result(client, row, 2, 0)
+
+    with app.app_context():
+        for scope in ("all", "cube:vintage", "group:liga", "group:liga|cube:vintage"):
+            ratings = _ratings(scope)
+            assert ratings[row["player1"]] == (pytest.approx(INITIAL_RATING + 16), 1)
+            assert ratings[row["player2"]] == (pytest.approx(INITIAL_RATING - 16), 1)
+        assert MatchRatingDelta.query.count() == 4
+
+
+def test_corrected_result_replaces_previous_rating(client, app, start_tournament, round_rows, save_result):
+    tournament_id = start_tournament(client)
+    row = round_rows(tournament_id)[0]
+
+    save_result(client, row, 2, 0)
+    save_result(client, row, 1, 1)
+
+    with app.app_context():
+        ratings = _ratings()
+        assert ratings[row["player1"]] == (pytest.approx(INITIAL_RATING), 1)
+        assert ratings[row["player2"]] == (pytest.approx(INITIAL_RATING), 1)
+        assert MatchRatingDelta.query.count() == 4
+
+
+def test_recompute_matches_incremental_ratings(client, app, start_tournament, round_rows, save_result):
+    tournament_id = start_tournament(client)
+    for row in round_rows(tournament_id):
+        save_result(client, row, 2, 1)
+    with app.app_context():
+        incremental = _ratings("group:liga|cube:vintage")
+
+    result = app.test_cli_runner().invoke(args=["recompute-ratings", "--batch-size", "2"])
+
+    assert result.exit_code == 0, result.output
+    assert "Fertig: 4 Match(es)" in result.output
+    with app.app_context():
+        recomputed = _ratings("group:liga|cube:vintage")
+        assert recomputed.keys() == incremental.keys()
+        for name, (rating, matches) in incremental.items():
+            assert recomputed[name] == (pytest.approx(rating), matches)
+        assert recompute_all_ratings()["ratings"] == 4 * len(PLAYERS)
+
+
+def test_ratings_shown_on_players_list_and_profile(client, start_tournament, round_rows, save_result):
+    tournament_id = start_tournament(client)
+    row = round_rows(tournament_id)[0]
+    save_result(client, row, 2, 0)
+
+    listing = client.get("/mtg/players").get_data(as_text=True)
+    profile = client.get(f"/mtg/player/{row['player1']}?cube=vintage").get_data(as_text=True)
+
+    assert "Elo:" in listing
+    assert "1516" in listing and "1484" in listing
+    assert "1516" in profile
+    assert "1 gewertete Matches" in profile
+
+
+def test_deleting_tournament_reverts_ratings_and_reused_match_ids_start_clean(
+    client, app, start_tournament, round_rows, save_result
+):
+    tournament_id = start_tournament(client)
+    for row in round_rows(tournament_id)[:2]:
+        save_result(client, row, 2, 0)
+
+    response = client.post(f"/mtg/delete_tournament/{tournament_id}")
+    assert response.get_json()["success"] is True
+    with app.app_context():
+        assert MatchRatingDelta.query.count() == 0
+        assert all(values == (pytest.approx(INITIAL_RATING), 0) for values in _ratings().values())
+
+    new_tournament_id = start_tournament(client, OTHER_PLAYERS)
+    row = round_rows(new_tournament_id)[0]
+    save_result(client, row, 2, 0)
+
+    with app.app_context():
+        ratings = _ratings()
+        assert ratings[row["player1"]] == (pytest.approx(INITIAL_RATING + 16), 1)
+        assert ratings[row["player2"]] == (pytest.approx(INITIAL_RATING - 16), 1)
+        assert all(ratings[name] == (pytest.approx(INITIAL_RATING), 0) for name in PLAYERS if name in ratings)
+        assert {entry.tournament_id for entry in MatchRatingDelta.query.all()} == {new_tournament_id}
+
+
+def test_rating_scope_for_filter():
+    assert rating_scope_for_filter() == "all"
+    assert rating_scope_for_filter(cube_id="all") == "all"
+    assert rating_scope_for_filter(cube_id="vintage") == "cube:vintage"
+    assert rating_scope_for_filter("liga", "all") == "group:liga"
+    assert rating_scope_for_filter("liga", "vintage") == "group:liga|cube:vintage"
@@ -0,0 +1,59 @@
+def test_round_state_returns_full_snapshot(client, seeded_random, start_tournament, round_rows):
+    tournament_id = start_tournament(client, 6)
+
+    response = client.get("/mtg/round/1/state")
+
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "no-store"
+    state = response.get_json()
+    assert state["full"] is True
+    assert state["round"] == 1 and state["total_rounds"] == 1
+    assert state["tournament_ended"] is False
+    assert [match["table"] for match in state["matches"]] == [row["table"] for row in round_rows(tournament_id)]
+    # Ohne Ergebnisse ist die Tabelle noch leer.
+    assert state["standings"] == []
+    assert set(state["power_nine"]["Alice"]) >= {"Black Lotus", "Time Walk"}
+
+
+def test_round_state_delta_contains_only_changed_tables(
+    client, seeded_random, start_tournament, round_rows, save_result
+):
+    tournament_id = start_tournament(client, 6)
+    first = client.get("/mtg/round/1/state").get_json()
+
+    unchanged = client.get(f"/mtg/round/1/state?since={first['version']}&cursor={first['cursor']}").get_json()
+    assert unchanged["unchanged"] is True
+    assert "matches" not in unchanged
+
+    row = next(row for row in round_rows(tournament_id) if row["player2"] != "BYE")
+    save_result(client, row)
+
+    delta = client.get(f"/mtg/round/1/state?since={first['version']}&cursor={first['cursor']}").get_json()
+    assert delta["full"] is False
+    assert delta["version"] > first["version"]
+    assert [(match["table"], match["score1"], match["score2"]) for match in delta["matches"]] == [(row["table"], "2", "1")]
+    winner = next(entry for entry in delta["standings"] if entry[0] == row["player1"])
+    assert winner[1] == 3
+
+
+def test_round_state_falls_back_to_full_after_pairing_change(client, seeded_random, start_tournament, round_rows):
+    tournament_id = start_tournament(client, 6)
+    first = client.get("/mtg/round/1/state").get_json()
+    rows = [row for row in round_rows(tournament_id) if row["player2"] != "BYE"]
+    swapped = [
+        {"table": rows[0]["table"], "player1": rows[0]["player1"], "player2": rows[1]["player1"]},
+        {"table": rows[1]["table"], "player1": rows[0]["player2"], "player2": rows[1]["player2"]},
+    ] + [{"table": row["table"], "player1": row["player1"], "player2": row["player2"]} for row in rows[2:]]
+
+    response = client.post("/mtg/round/1/save_pairings", json={"matches": swapped})
+    assert response.get_json()["success"] is True
+
+    state = client.get(f"/mtg/round/1/state?since={first['version']}&cursor={first['cursor']}").get_json()
+    assert state["full"] is True
+    assert len(state["matches"]) == len(round_rows(tournament_id))
+
+
+def test_round_state_requires_existing_round(client, start_tournament):
+    assert client.get("/mtg/round/1/state").status_code == 400
+    start_tournament(client, 6)
+    assert client.get("/mtg/round/7/state").status_code == 404
@@ -0,0 +1,95 @@
+import csv
+import os
+
+import pytest
+
+from app.round_store import list_round_numbers, read_round_rows, read_round_table
+
+
+FIELDNAMES = [
+    "table", "player1", "player2", "score1", "score2", "score_draws",
+    "dropout1", "dropout2", "table_size", "group_key",
+]
+
+
+def _write_round(path, rows, fieldnames=FIELDNAMES):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _dict_reader(path):
+    with open(path, "r", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        return reader.fieldnames, list(reader)
+
+
+def _sample_rows():
+    return [
+        {"table": "1", "player1": "Älice", "player2": "Bob", "score1": "2", "score2": "1",
+         "score_draws": "0", "dropout1": "false", "dropout2": "true", "table_size": "8", "group_key": "8-1"},
+        {"table": "2", "player1": "Carol", "player2": "BYE", "score1": "", "score2": "",
+         "score_draws": "", "dropout1": "false", "dropout2": "false", "table_size": "8", "group_key": "8-1"},
+        {"table": "3", "player1": "Dave, Jr.", "player2": "Eve", "score1": "02", "score2": "-1",
+         "score_draws": "x", "dropout1": "", "dropout2": "True", "table_size": "8", "group_key": "8-1"},
+    ]
+
+
+def test_round_table_matches_dict_reader(isolated_workspace):
+    path = os.path.join("data", "t1", "rounds", "round_1.csv")
+    _write_round(path, _sample_rows())
+
+    assert read_round_table(path) == _dict_reader(path)
+    assert read_round_rows(path) == _sample_rows()
+
+
+def test_rows_with_missing_or_extra_fields_match_dict_reader(isolated_workspace):
+    path = os.path.join("data", "t1", "rounds", "round_1.csv")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("table,player1,player2\n1,Alice\n2,Bob,Carol,extra\n")
+
+    assert read_round_table(path) == _dict_reader(path)
+
+
+def test_missing_csv_raises(isolated_workspace):
+    path = os.path.join("data", "t1", "rounds", "round_1.csv")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with pytest.raises(OSError):
+        read_round_rows(path)
+
+
+def test_round_listing(isolated_workspace):
+    for round_number in (1, 2, 10):
+        _write_round(os.path.join("data", "t1", "rounds", f"round_{round_number}.csv"), _sample_rows())
+    with open(os.path.join("data", "t1", "rounds", "round_x.csv"), "w", encoding="utf-8") as f:
+        f.write("table\n")
+
+    assert sorted(list_round_numbers(os.path.join("data", "t1", "rounds"))) == [1, 2, 10]
+    assert list_round_numbers(os.path.join("data", "missing", "rounds")) == []
+
+
+def test_round_view_does_not_write_round_files(client):
+    response = client.post(
+        "/mtg/pair",
+        data={
+            "players": ["Alice", "Bob", "Carol", "Dave"],
+            "group_sizes": ["4"],
+            "tournament_group": "liga",
+            "tournament_cube": "vintage",
+        },
+        follow_redirects=False,
+    )
+    assert response.status_code in (302, 303)
+    with client.session_transaction() as sess:
+        tournament_id = sess["tournament_id"]
+    rounds_dir = os.path.join("data", tournament_id, "rounds")
+    before = {name: os.stat(os.path.join(rounds_dir, name)).st_mtime_ns for name in os.listdir(rounds_dir)}
+
+    assert client.get("/mtg/round/1").status_code == 200
+
+    after = {name: os.stat(os.path.join(rounds_dir, name)).st_mtime_ns for name in os.listdir(rounds_dir)}
+    assert after == before
@@ -0,0 +1,93 @@
+import itertools
+import json
+import os
+
+from app.seating import load_coseating_history, optimize_seating, seating_cost
+from app.services.players import get_or_create_players
+
+
+PLAYERS = [f"Spieler {index:02d}" for index in range(12)]
+
+
+def _pod_weights(*pods):
+    weights = {}
+    for pod in pods:
+        for player_a, player_b in itertools.combinations(pod, 2):
+            key = frozenset((player_a, player_b))
+            weights[key] = weights.get(key, 0) + 1
+    return weights
+
+
+def _player_groups(tournament_id):
+    with open(os.path.join("data", tournament_id, "player_groups.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _tournament_dirs():
+    return {name for name in os.listdir("data") if os.path.isdir(os.path.join("data", name))}
+
+
+def test_optimizer_reaches_optimum_and_keeps_pod_sizes():
+    players = list("ABCDEFGH")
+    weights = _pod_weights("ABCD", "EFGH", "AB")
+    best = min(
+        seating_cost([list(pod), [p for p in players if p not in pod]], weights)
+        for pod in itertools.combinations(players, 4)
+    )
+
+    pods = optimize_seating(players, [4, 4], weights, time_budget_ms=10_000, seed=3, max_steps=20_000)
+
+    assert [len(pod) for pod in pods] == [4, 4]
+    assert sorted(player for pod in pods for player in pod) == players
+    assert seating_cost(pods, weights) == best < seating_cost([players[:4], players[4:]], weights)
+
+
+def test_optimizer_without_history_keeps_start_order():
+    players = list("ABCDEF")
+
+    assert optimize_seating(players, [2, 4], {}) == [["A", "B"], ["C", "D", "E", "F"]]
+    assert optimize_seating(players, [6], _pod_weights("ABC")) == [players]
+
+
+def test_pair_spreads_previous_pod_mates(client, app):
+    data = {"players": PLAYERS, "group_sizes": ["6"], "tournament_group": "liga", "tournament_cube": "vintage"}
+    client.post("/mtg/pair", data=data)
+    with client.session_transaction() as sess:
+        first_id = sess["tournament_id"]
+    first_pods = list(_player_groups(first_id).values())
+
+    with app.app_context():
+        players_by_name = get_or_create_players(PLAYERS)
+        names_by_id = {row.id: name for name, row in players_by_name.items()}
+        history = load_coseating_history(names_by_id)
+    assert len(history) == 30
+    assert set(history.values()) == {1}
+
+    client.post("/mtg/pair", data=data)
+    with client.session_transaction() as sess:
+        second_id = sess["tournament_id"]
+
+    # Optimum: jeder neue Pod hat genau drei Spieler aus jedem alten Pod.
+    second_pods = list(_player_groups(second_id).values())
+    for pod in second_pods:
+        assert sorted(len(set(pod) & set(old_pod)) for old_pod in first_pods) == [3, 3]
+
+
+def test_start_tables_redistributes_only_on_request(client):
+    payload = json.dumps([
+        {"table_size": 6, "group_id": "liga", "cube_id": "vintage", "players": PLAYERS[:6]},
+        {"table_size": 6, "group_id": "liga", "cube_id": "vintage", "players": PLAYERS[6:]},
+    ])
+    client.post("/mtg/start_tables", data={"tables_payload": payload})
+    first_ids = _tournament_dirs()
+    assert sorted(sorted(pod) for tid in first_ids for pod in _player_groups(tid).values()) == [
+        PLAYERS[:6], PLAYERS[6:]
+    ]
+
+    client.post("/mtg/start_tables", data={"tables_payload": payload, "optimize_seating": "1"})
+    second_ids = _tournament_dirs() - first_ids
+
+    pods = [pod for tid in second_ids for pod in _player_groups(tid).values()]
+    assert sorted(len(pod) for pod in pods) == [6, 6]
+    for pod in pods:
+        assert len(set(pod) & set(PLAYERS[:6])) == 3
@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app import create_app
+from app.db import db
+from app.models import ServerSession
+from app.session_store import DbSessionInterface, sweep_expired_sessions
+
+
+@pytest.fixture
+def db_session_app(isolated_workspace, monkeypatch):
+    monkeypatch.setenv("SESSION_BACKEND", "db")
+    test_app = create_app()
+    test_app.config["TESTING"] = True
+    with test_app.app_context():
+        db.create_all()
+    yield test_app
+    with test_app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+def test_db_backend_keeps_cookie_small_and_constant(db_session_app, start_tournament):
+    assert isinstance(db_session_app.session_interface, DbSessionInterface)
+    client = db_session_app.test_client()
+    start_tournament(client, [f"Spieler {index}" for index in range(8)])
+
+    cookie = client.get_cookie("session")
+    assert cookie is not None
+    assert len(cookie.value) < 100
+    with client.session_transaction() as sess:
+        assert len(sess["player_groups"]) >= 1
+        tournament_id = sess["tournament_id"]
+
+    assert client.get("/mtg/round/1").status_code == 200
+    with db_session_app.app_context():
+        row = ServerSession.query.one()
+        assert tournament_id in row.data
+
+
+def test_sweep_removes_expired_sessions(db_session_app, start_tournament):
+    client = db_session_app.test_client()
+    start_tournament(client, [f"Spieler {index}" for index in range(8)])
+    with db_session_app.app_context():
+        ServerSession.query.update({ServerSession.expires_at: datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(minutes=1)})
+        db.session.commit()
+        assert sweep_expired_sessions() == 1
+        assert ServerSession.query.count() == 0
+
+    # Abgelaufene Session wird nicht mehr geladen.
+    with client.session_transaction() as sess:
+        assert "tournament_id" not in sess
+
+
+def test_unknown_session_backend_is_rejected(isolated_workspace, monkeypatch):
+    monkeypatch.setenv("SESSION_BACKEND", "redis")
+    with pytest.raises(RuntimeError):
+        create_app()
+
+
+def test_login_logout_and_clear_rotate_the_session_id(db_session_app):
+    db_session_app.config.update(
+        APP_LOGIN_ENABLED=True, APP_LOGIN_USERNAME="mtg", APP_LOGIN_PASSWORD="pw", APP_LOGIN_PASSWORD_HASH=""
+    )
+    client = db_session_app.test_client()
+    client.get("/mtg/login")
+    with client.session_transaction() as sess:
+        sess["planted"] = True
+    planted = client.get_cookie("session").value
+
+    assert client.post("/mtg/login", data={"username": "mtg", "password": "pw"}).status_code in (302, 303)
+    logged_in = client.get_cookie("session").value
+    assert logged_in != planted
+    with db_session_app.app_context():
+        assert ServerSession.query.count() == 1
+
+    # Das alte Cookie verweist auf keinen Eintrag mehr und ist damit nicht angemeldet.
+    attacker = db_session_app.test_client()
+    attacker.set_cookie("session", planted)
+    assert attacker.get("/mtg/").status_code in (302, 303)
+    assert client.get("/mtg/").status_code == 200
+
+    client.post("/mtg/logout")
+    assert client.get_cookie("session").value != logged_in
+
+
+def test_session_clear_issues_new_id(db_session_app, start_tournament):
+    client = db_session_app.test_client()
+    start_tournament(client, 8)
+    first = client.get_cookie("session").value
+
+    assert client.post("/mtg/start_tournament", data={"force_new": "1"}).status_code in (302, 303)
+
+    assert client.get_cookie("session").value != first
+    with db_session_app.app_context():
+        assert ServerSession.query.count() == 1
+
+
+def test_static_requests_skip_the_session_lookup(db_session_app, monkeypatch):
+    client = db_session_app.test_client()
+    client.get("/mtg/login")
+    with client.session_transaction() as sess:
+        sess["x"] = 1
+    lookups = []
+    original = DbSessionInterface._signer
+    monkeypatch.setattr(DbSessionInterface, "_signer", lambda self, app: lookups.append(1) or original(self, app))
+
+    response = client.get("/static/does-not-exist.css")
+
+    assert response.status_code == 404
+    assert lookups == []
+    assert "Set-Cookie" not in response.headers
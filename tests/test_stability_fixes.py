@@ -1,12 +1,23 @@
 """Tests für die Stabilitäts-Fixes (atomare Writes, Errorhandler, robuste CSV-Verarbeitung)."""
 
 import csv
+import json
 import os
+import subprocess
+import sys
+import time
 
 import pytest
 
 from app import create_app
-from app.atomic_io import atomic_write
+from app.atomic_io import (
+    LIVE_JOURNAL_MAX_AGE_SECONDS,
+    AtomicBatch,
+    atomic_write,
+    recover_file_state,
+    recover_pending_batches,
+    remove_orphaned_temp_files,
+)
 from app.routes import calculate_leaderboard
 
 
@@ -49,6 +60,140 @@ def test_atomic_write_creates_missing_directories(tmp_path):
     assert target.read_text(encoding="utf-8") == "inhalt"
 
 
+def test_atomic_batch_commits_all_files_together(tmp_path):
+    journal = tmp_path / "journal"
+    first = tmp_path / "data" / "round_1.csv"
+    second = tmp_path / "tournament_data" / "results.csv"
+    second.parent.mkdir()
+    second.write_text("alt", encoding="utf-8")
+
+    with AtomicBatch(journal_dir=str(journal)) as batch:
+        batch.write(str(first), lambda f: f.write("runde"))
+        batch.write(str(second), lambda f: f.write("ergebnis"))
+        # Vor dem Commit ist noch nichts sichtbar.
+        assert not first.exists()
+        assert second.read_text(encoding="utf-8") == "alt"
+
+    assert first.read_text(encoding="utf-8") == "runde"
+    assert second.read_text(encoding="utf-8") == "ergebnis"
+    assert list(tmp_path.rglob("*.tmp")) == []
+    assert list(journal.glob("*.json")) == []
+
+
+def test_atomic_batch_aborts_without_touching_targets(tmp_path):
+    target = tmp_path / "results.csv"
+    target.write_text("alt", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        with AtomicBatch(journal_dir=str(tmp_path / "journal")) as batch:
+            batch.write(str(target), lambda f: f.write("neu"))
+            raise ValueError("boom")
+
+    assert target.read_text(encoding="utf-8") == "alt"
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_recover_pending_batches_rolls_forward_half_applied_batch(tmp_path, monkeypatch):
+    journal = tmp_path / "journal"
+    first = tmp_path / "a.txt"
+    second = tmp_path / "b.txt"
+    real_replace = os.replace
+    calls = []
+
+    def crashing_replace(src, dst):
+        calls.append(dst)
+        # Absturz nach dem ersten Rename der Zieldateien (Journal-Rename zählt mit).
+        if len([c for c in calls if not str(c).endswith(".json")]) == 2:
+            raise SystemExit("crash")
+        return real_replace(src, dst)
+
+    batch = AtomicBatch(journal_dir=str(journal))
+    batch.write(str(first), lambda f: f.write("A"))
+    batch.write(str(second), lambda f: f.write("B"))
+    monkeypatch.setattr(os, "replace", crashing_replace)
+    with pytest.raises(SystemExit):
+        batch.commit()
+    monkeypatch.setattr(os, "replace", real_replace)
+
+    assert first.read_text(encoding="utf-8") == "A"
+    assert not second.exists()
+    # Der schreibende Prozess (dieser) lebt noch: sein Journal bleibt liegen.
+    assert recover_pending_batches(str(journal)) == 0
+    assert not second.exists()
+
+    _hand_journals_to_dead_process(journal)
+    assert recover_pending_batches(str(journal)) == 1
+    assert second.read_text(encoding="utf-8") == "B"
+    assert list(journal.glob("*.json")) == []
+    assert recover_pending_batches(str(journal)) == 0
+
+
+def _dead_pid():
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def _hand_journals_to_dead_process(journal):
+    pid = _dead_pid()
+    for path in journal.glob("*.json"):
+        path.rename(path.with_name(f"{pid}-{path.name.split('-', 1)[1]}"))
+
+
+def test_recover_skips_live_journal_until_it_is_stale(tmp_path):
+    journal = tmp_path / "journal"
+    journal.mkdir()
+    target = tmp_path / "a.txt"
+    tmp_file = tmp_path / "a.txt.123.tmp"
+    tmp_file.write_text("A", encoding="utf-8")
+    journal_file = journal / f"{os.getpid()}-abc-0001.json"
+    journal_file.write_text(json.dumps([[str(tmp_file), str(target)]]), encoding="utf-8")
+
+    assert recover_pending_batches(str(journal)) == 0
+    assert remove_orphaned_temp_files([str(tmp_path)], str(journal), min_age_seconds=0) == 0
+    assert tmp_file.exists()
+
+    # Wiederverwendete PID: ein altes Journal gilt trotzdem als verwaist.
+    old = time.time() - LIVE_JOURNAL_MAX_AGE_SECONDS - 1
+    os.utime(journal_file, (old, old))
+    assert recover_pending_batches(str(journal)) == 1
+    assert target.read_text(encoding="utf-8") == "A"
+
+
+def test_orphaned_temp_files_are_removed_only_when_old(tmp_path):
+    old_tmp = tmp_path / "data" / "t1" / "round_1.csv.abc.tmp"
+    fresh_tmp = tmp_path / "data" / "t1" / "round_2.csv.def.tmp"
+    old_tmp.parent.mkdir(parents=True)
+    old_tmp.write_text("x", encoding="utf-8")
+    fresh_tmp.write_text("y", encoding="utf-8")
+    (tmp_path / "data" / "t1" / "round_1.csv").write_text("keep", encoding="utf-8")
+    old = time.time() - 3600
+    os.utime(old_tmp, (old, old))
+
+    removed = remove_orphaned_temp_files([str(tmp_path / "data")], str(tmp_path / "journal"))
+
+    assert removed == 1
+    assert not old_tmp.exists()
+    assert fresh_tmp.exists()
+    assert (tmp_path / "data" / "t1" / "round_1.csv").exists()
+
+
+def test_create_app_does_not_replay_journals(isolated_workspace):
+    journal = isolated_workspace / "instance" / "atomic_journal"
+    journal.mkdir(parents=True)
+    tmp_file = isolated_workspace / "a.txt.1.tmp"
+    tmp_file.write_text("A", encoding="utf-8")
+    (journal / f"{_dead_pid()}-abc-0001.json").write_text(
+        json.dumps([[str(tmp_file), str(isolated_workspace / "a.txt")]]), encoding="utf-8"
+    )
+
+    create_app()
+
+    assert tmp_file.exists()
+    assert recover_file_state()["batches"] == 1
+    assert (isolated_workspace / "a.txt").read_text(encoding="utf-8") == "A"
+
+
 # ---------------------------------------------------------------------------
 # Errorhandler
 # ---------------------------------------------------------------------------
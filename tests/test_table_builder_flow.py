@@ -470,9 +470,13 @@ class TableBuilderFlowTests(unittest.TestCase):
             self.assertEqual(response.status_code, 200)
             html = response.get_data(as_text=True)
             self.assertIn('datalist id="knownPlayersList"', html)
-            self.assertIn('<option value="Enrique"></option>', html)
+            # Namen kommen über den Autocomplete-Endpunkt, nicht eingebettet.
+            self.assertNotIn('<option value="Enrique">', html)
+            self.assertIn("/mtg/api/players/suggest", html)
             self.assertIn("findClosestKnownName", html)
             self.assertIn("Ähnlicher Name gefunden", html)
+            suggest = client.get("/mtg/api/players/suggest?q=enr").get_json()
+            self.assertEqual(suggest["names"], ["Enrique"])
 
     def test_index_hides_deleted_players_from_autocomplete_and_fuzzy_source(self):
         with temp_cwd():
@@ -489,9 +493,9 @@ class TableBuilderFlowTests(unittest.TestCase):
                 db.session.commit()
             response = client.get("/mtg/")
             self.assertEqual(response.status_code, 200)
-            html = response.get_data(as_text=True)
-            self.assertIn('<option value="Enrique"></option>', html)
-            self.assertNotIn("DELETED_PLAYER_123abc", html)
+            self.assertNotIn("DELETED_PLAYER_123abc", response.get_data(as_text=True))
+            self.assertEqual(client.get("/mtg/api/players/suggest?q=e").get_json()["names"], ["Enrique"])
+            self.assertEqual(client.get("/mtg/api/players/suggest?q=deleted").get_json()["names"], [])
 
     def test_players_list_hides_deleted_players(self):
         with temp_cwd():
@@ -0,0 +1,114 @@
+import json
+import os
+import time
+import uuid
+import zipfile
+
+from app.routes import check_tournament_status, get_last_tournaments
+from app.tournament_archive import (
+    archive_ended_tournaments,
+    archive_tournament,
+    bundle_path,
+    is_archived,
+    list_archived,
+    load_index,
+    read_archived_results,
+    restore_tournament,
+)
+
+
+def _ended_tournament(winner="Alice", age_days=0):
+    tournament_id = str(uuid.uuid4())
+    rounds_dir = os.path.join("data", tournament_id, "rounds")
+    os.makedirs(rounds_dir)
+    with open(os.path.join(rounds_dir, "round_1.csv"), "w", encoding="utf-8", newline="") as f:
+        f.write("table,player1,player2,score1,score2\n1,Alice,Bob,2,1\n")
+    with open(os.path.join("data", tournament_id, "end_time.txt"), "w", encoding="utf-8") as f:
+        f.write("02.05.2024 22:15")
+    os.makedirs("tournament_results", exist_ok=True)
+    results_file = os.path.join("tournament_results", f"{tournament_id}_results.json")
+    with open(results_file, "w", encoding="utf-8") as f:
+        json.dump({"tournament_data": {"end_date": "02.05.2024 22:15"}, "final_leaderboard": [[winner, 6]]}, f)
+    ended_ts = time.time() - age_days * 86400
+    os.utime(results_file, (ended_ts, ended_ts))
+    return tournament_id
+
+
+def test_archive_and_restore_round_trip(isolated_workspace):
+    tournament_id = _ended_tournament()
+
+    assert archive_tournament(tournament_id) is True
+
+    assert not os.path.exists(os.path.join("data", tournament_id))
+    assert not os.path.exists(os.path.join("tournament_results", f"{tournament_id}_results.json"))
+    assert is_archived(tournament_id)
+    assert load_index()[tournament_id]["has_results"] is True
+    with zipfile.ZipFile(bundle_path(tournament_id)) as bundle:
+        assert sorted(bundle.namelist()) == ["data/end_time.txt", "data/rounds/round_1.csv", "results.json"]
+    assert read_archived_results(tournament_id)["final_leaderboard"] == [["Alice", 6]]
+
+    assert restore_tournament(tournament_id) is True
+
+    assert not is_archived(tournament_id)
+    assert not os.path.exists(bundle_path(tournament_id))
+    with open(os.path.join("data", tournament_id, "rounds", "round_1.csv"), encoding="utf-8") as f:
+        assert "Alice,Bob,2,1" in f.read()
+    assert os.path.exists(os.path.join("tournament_results", f"{tournament_id}_results.json"))
+
+
+def test_archive_skips_running_tournaments_and_respects_min_age(isolated_workspace):
+    running_id = str(uuid.uuid4())
+    os.makedirs(os.path.join("data", running_id, "rounds"))
+    old_id = _ended_tournament(age_days=40)
+    recent_id = _ended_tournament(age_days=1)
+
+    summary = archive_ended_tournaments(min_age_days=30)
+
+    assert summary == {"archived": 1, "skipped": 1}
+    assert is_archived(old_id)
+    assert not is_archived(recent_id)
+    assert os.path.isdir(os.path.join("data", running_id))
+
+
+def test_last_tournaments_merge_live_and_archived(app):
+    archived_id = _ended_tournament(winner="Dave", age_days=10)
+    live_id = _ended_tournament(winner="Erin", age_days=1)
+    archive_tournament(archived_id)
+
+    with app.test_request_context():
+        last = get_last_tournaments(limit=5)
+        assert [row["id"] for row in last] == [live_id, archived_id]
+        assert last[1]["winner"] == "Dave"
+        assert check_tournament_status(archived_id) is True
+    assert [tid for tid, _entry in list_archived()] == [archived_id]
+
+
+def test_load_tournament_restores_archived_bundle(client):
+    tournament_id = _ended_tournament()
+    archive_tournament(tournament_id)
+
+    response = client.get(f"/mtg/load_tournament/{tournament_id}", follow_redirects=False)
+
+    assert response.status_code in (302, 303)
+    assert "/round/1" in response.headers["Location"]
+    assert os.path.isdir(os.path.join("data", tournament_id))
+    assert not is_archived(tournament_id)
+
+
+def test_delete_tournament_removes_bundle(client):
+    tournament_id = _ended_tournament()
+    archive_tournament(tournament_id)
+
+    response = client.post(f"/mtg/delete_tournament/{tournament_id}")
+
+    assert response.status_code == 200
+    assert response.get_json()["success"] is True
+    assert not is_archived(tournament_id)
+    assert not os.path.exists(bundle_path(tournament_id))
+
+
+def test_archive_cli_reports_counts(app):
+    _ended_tournament(age_days=5)
+    result = app.test_cli_runner().invoke(args=["archive-tournaments", "--min-age-days", "1"])
+    assert result.exit_code == 0, result.output
+    assert "1 Turnier(e) archiviert, 0 übersprungen." in result.output